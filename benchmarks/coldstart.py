@@ -0,0 +1,160 @@
+"""Cold-start check for the production image.
+
+    python -m benchmarks.coldstart --image portfolio [--runs 3] [--target 8] [--output coldstart.json]
+    python -m benchmarks.coldstart --workdir /path/to/tree [--runs 3] [--target 8]
+
+Each run starts a fresh server and measures, from the moment it is launched:
+
+* ``health_s`` - until ``/_stcore/health`` first answers 200
+* ``welcome_s`` - until a visitor's first run of the app, the Welcome page,
+  has finished rendering over the websocket (``script_finished``)
+* ``ready_s`` - until ``/readyz`` answers 200, i.e. the boot warm-up is done
+
+With ``--image`` the server is ``docker run`` of that image, so image startup
+is included (pull the image beforehand, as the autoscaler's nodes would have).
+Without it, ``uvicorn serve:app`` is started in ``--workdir`` with the same
+production environment as the image, which is useful where Docker isn't
+available. The check fails (exit status 1) if the slowest ``welcome_s`` is
+above ``--target`` seconds (default ``COLD_START_TARGET_S``).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import websockets
+
+from benchmarks.load import REPO_ROOT, Session, free_port
+
+# Container start to first rendered Welcome page, in seconds.
+COLD_START_TARGET_S = 8.0
+CONTAINER_PORT = 8501
+POLL_INTERVAL = 0.05
+# Mirrors the ENV block of the Dockerfile for --workdir runs.
+PRODUCTION_ENV = {
+    "PORTFOLIO_REQUIRE_MANIFEST": "1",
+    "PORTFOLIO_OFFLINE": "1",
+    "STREAMLIT_SERVER_HEADLESS": "true",
+    "STREAMLIT_SERVER_FILE_WATCHER_TYPE": "none",
+    "STREAMLIT_BROWSER_GATHER_USAGE_STATS": "false",
+}
+
+
+def http_status(url: str) -> int | None:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except OSError:
+        return None
+
+
+def wait_for(url: str, start: float, deadline: float) -> float | None:
+    """Seconds from ``start`` until ``url`` answers 200, or ``None`` at ``deadline``."""
+    while time.perf_counter() < deadline:
+        if http_status(url) == 200:
+            return time.perf_counter() - start
+        time.sleep(POLL_INTERVAL)
+    return None
+
+
+async def first_render(port: int, timeout: float) -> list[str]:
+    stats = {"messages": 0, "bytes": 0, "errors": []}
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_size=None) as ws:
+        await Session("", timeout, stats).rerun(ws, None)
+    return stats["errors"]
+
+
+def launch(args, port: int, name: str) -> subprocess.Popen:
+    if args.image:
+        command = ["docker", "run", "--rm", "--name", name, "-p", f"127.0.0.1:{port}:{CONTAINER_PORT}", args.image]
+        return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    command = [sys.executable, "-m", "uvicorn", "serve:app", "--host", "127.0.0.1", "--port", str(port)]
+    env = dict(os.environ, **PRODUCTION_ENV)
+    return subprocess.Popen(command, cwd=args.workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def stop(args, process: subprocess.Popen, name: str):
+    if args.image:
+        subprocess.run(["docker", "stop", "--time", "5", name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def measure(args, run: int) -> dict:
+    port = free_port()
+    name = f"portfolio-coldstart-{os.getpid()}-{run}"
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    deadline = start + args.timeout
+    process = launch(args, port, name)
+    try:
+        health = wait_for(f"{base}/_stcore/health", start, deadline)
+        if health is None:
+            return {"run": run, "health_s": None, "welcome_s": None, "ready_s": None, "errors": ["never healthy"]}
+        errors = asyncio.run(first_render(port, deadline - time.perf_counter()))
+        welcome = time.perf_counter() - start
+        ready = wait_for(f"{base}/readyz", start, deadline)
+        return {"run": run, "health_s": round(health, 3), "welcome_s": round(welcome, 3),
+                "ready_s": None if ready is None else round(ready, 3), "errors": errors}
+    finally:
+        stop(args, process, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--image", help="production image to docker run")
+    parser.add_argument("--workdir", default=str(REPO_ROOT), help="tree to serve with uvicorn when --image is not given")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--target", type=float, default=COLD_START_TARGET_S,
+                        help="fail if the slowest start to first Welcome render exceeds this many seconds")
+    parser.add_argument("--timeout", type=float, default=120.0, help="give up on a run after this many seconds")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'run':>4}{'health s':>10}{'welcome s':>11}{'ready s':>9}{'errors':>8}")
+    for run in range(1, args.runs + 1):
+        row = measure(args, run)
+        results.append(row)
+        print(f"{run:>4}" + "".join(f"{'-' if row[k] is None else f'{row[k]:.2f}':>{w}}"
+                                    for k, w in (("health_s", 10), ("welcome_s", 11), ("ready_s", 9)))
+              + f"{len(row['errors']):>8}")
+
+    welcome = [row["welcome_s"] for row in results]
+    failed = any(t is None for t in welcome) or any(row["errors"] for row in results)
+    slowest = None if failed else max(welcome)
+    summary = {
+        "target_s": args.target,
+        "welcome_median_s": None if failed else round(statistics.median(welcome), 3),
+        "welcome_max_s": slowest,
+        "passed": not failed and slowest <= args.target,
+        "runs": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+            f.write("\n")
+
+    if summary["passed"]:
+        print(f"OK: first Welcome render within {slowest:.2f} s of start (target {args.target:.1f} s)")
+    else:
+        reason = "a run failed" if failed else f"slowest start {slowest:.2f} s"
+        print(f"FAIL: {reason}, target {args.target:.1f} s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare a benchmark run against the committed baseline.
+
+    python -m portfolio.build_assets
+    python -m benchmarks.sections --output bench_output.json
+    python -m benchmarks.compare bench_output.json [--update]
+
+Exits non-zero if any section got slower or heavier than its baseline by more
+than the allowed tolerance. ``--update`` rewrites ``benchmarks/baseline.json``
+with the given results instead.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# metric -> (relative tolerance, absolute slack). Timings are noisy across
+# machines, so they get a generous margin; byte counts are deterministic.
+TOLERANCES = {
+    "cold_start_ms": (0.5, 250.0),
+    "first_visit_ms": (0.5, 100.0),
+    "rerun_ms": (0.5, 10.0),
+    "peak_rss_kb": (0.2, 10240),
+    "message_bytes": (0.05, 256),
+    "media_bytes": (0.05, 1024),
+    "static_bytes": (0.05, 1024),
+    "video_bytes": (0.05, 1024),
+}
+
+
+def compare(baseline: dict, results: dict) -> list[str]:
+    failures = []
+    for section, row in results.items():
+        base = baseline.get(section)
+        if base is None:
+            continue
+        for metric, (relative, slack) in TOLERANCES.items():
+            if metric not in base or metric not in row:
+                continue
+            limit = base[metric] * (1 + relative) + slack
+            if row[metric] > limit:
+                failures.append(f"{section}: {metric} {row[metric]} > {limit:.0f} (baseline {base[metric]})")
+        if row.get("errors") and not base.get("errors"):
+            failures.append(f"{section}: new errors {row['errors']}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("results")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with these results")
+    args = parser.parse_args(argv)
+
+    with open(args.results, encoding="utf-8") as f:
+        results = json.load(f)
+
+    if args.update:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"baseline updated: {args.baseline}")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    failures = compare(baseline, results)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"OK: {len(results)} sections within tolerance of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Throughput of the streaming filter and spectrogram, in samples per second.
+
+    python -m benchmarks.dsp [--seconds 10,60,600] [--taps 63,255,1023] [--output dsp.json]
+
+Three measurements, all on the synthetic Class AB signal at
+``portfolio.dsp.SAMPLE_RATE``:
+
+* filtering: ``portfolio.dsp.overlap_add`` over the chunked signal against
+  ``np.convolve`` (direct convolution in C) on the whole array, per tap count,
+  with the largest difference between the two,
+* STFT: ``portfolio.dsp.stft`` against a Python loop that transforms one
+  frame at a time, with the largest difference,
+* the whole filter demo, ``portfolio.dsp.analyse``: signal synthesis, filter,
+  two STFTs and the display grid in one pass, per signal length, with the
+  peak memory it allocated (``tracemalloc`` sees NumPy's buffers). Bounded
+  memory shows as a peak that doesn't grow with the length.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+
+from portfolio import dsp
+
+FILTER_SECONDS = 60
+STFT_SECONDS = 10
+SEGMENT = 1024
+OVERLAP = 0.75
+
+
+def signal(seconds: float) -> np.ndarray:
+    return np.concatenate(list(dsp.class_ab_chunks(seconds)))
+
+
+def best_of(function, repeat: int = 3) -> tuple[float, object]:
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def filter_row(x: np.ndarray, taps: int) -> dict:
+    spec = dsp.FilterSpec("Windowed sinc", "bandpass", 800.0, 1_200.0, taps, "Hamming", None)
+    h = dsp.design(spec, dsp.SAMPLE_RATE)
+    chunks = [x[i:i + dsp.CHUNK_SAMPLES] for i in range(0, len(x), dsp.CHUNK_SAMPLES)]
+    fft_s, y = best_of(lambda: np.concatenate(list(dsp.overlap_add(chunks, h))))
+    direct_s, y_direct = best_of(lambda: np.convolve(x, h)[:len(x)])
+    return {
+        "taps": taps,
+        "overlap_add_msps": round(len(x) / fft_s / 1e6, 2),
+        "convolve_msps": round(len(x) / direct_s / 1e6, 2),
+        "speedup": round(direct_s / fft_s, 1),
+        "max_diff": float(np.abs(y - y_direct).max()),
+    }
+
+
+def stft_loop(x: np.ndarray, segment: int, hop: int, window: np.ndarray) -> np.ndarray:
+    frames = []
+    for i in range(dsp.frame_count(len(x), segment, hop)):
+        frames.append(np.abs(np.fft.rfft(x[i * hop:i * hop + segment] * window)) ** 2)
+    return np.array(frames) / np.sum(window) ** 2
+
+
+def stft_row(x: np.ndarray) -> dict:
+    hop = round(SEGMENT * (1 - OVERLAP))
+    window = np.hanning(SEGMENT)
+    chunks = [x[i:i + dsp.CHUNK_SAMPLES] for i in range(0, len(x), dsp.CHUNK_SAMPLES)]
+    stream_s, power = best_of(lambda: np.concatenate(list(dsp.stft(chunks, SEGMENT, hop, window)), axis=-2))
+    loop_s, power_loop = best_of(lambda: stft_loop(x, SEGMENT, hop, window), repeat=1)
+    return {
+        "segment": SEGMENT,
+        "hop": hop,
+        "stft_msps": round(len(x) / stream_s / 1e6, 2),
+        "loop_msps": round(len(x) / loop_s / 1e6, 2),
+        "speedup": round(loop_s / stream_s, 1),
+        "max_diff": float(np.abs(power - power_loop).max()),
+    }
+
+
+def pipeline_row(seconds: float) -> dict:
+    samples = int(seconds * dsp.SAMPLE_RATE)
+    source = dsp.Source(("synthetic", seconds, dsp.SAMPLE_RATE), "synthetic", dsp.SAMPLE_RATE, samples,
+                        lambda: dsp.class_ab_chunks(seconds))
+    spec = dsp.FilterSpec("Windowed sinc", "bandpass", 800.0, 1_200.0, 255, "Hamming", None)
+    params = dsp.AnalysisParams(source.key, SEGMENT, OVERLAP, "Hann", spec)
+    tracemalloc.start()
+    result = dsp.analyse(params, source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = best_of(lambda: dsp.analyse(params, source))[0]
+    return {
+        "seconds": seconds,
+        "samples": samples,
+        "pipeline_msps": round(samples / elapsed / 1e6, 2),
+        "peak_mb": round(peak / 1e6, 1),
+        "signal_mb": round(samples * 8 / 1e6, 1),
+        "image_shape": list(result.images[0].shape),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", default="10,60,600", help="comma-separated signal lengths for the pipeline")
+    parser.add_argument("--taps", default="63,255,1023", help="comma-separated filter lengths")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    x = signal(FILTER_SECONDS)
+    print(f"filtering {len(x):,} samples, M samples/s")
+    print(f"{'taps':>6}{'overlap-add':>13}{'convolve':>10}{'speed-up':>10}{'max diff':>10}")
+    filters = []
+    for taps in (int(n) for n in args.taps.split(",")):
+        row = filter_row(x, taps)
+        filters.append(row)
+        print(f"{taps:>6}{row['overlap_add_msps']:>13.1f}{row['convolve_msps']:>10.1f}{row['speedup']:>9.1f}x"
+              f"{row['max_diff']:>10.1e}")
+
+    stft = stft_row(x[:STFT_SECONDS * dsp.SAMPLE_RATE])
+    print(f"\nSTFT, {SEGMENT}-sample segments, hop {stft['hop']}: {stft['stft_msps']:.1f} M samples/s, "
+          f"per-frame loop {stft['loop_msps']:.1f} M samples/s ({stft['speedup']:.0f}x), "
+          f"max diff {stft['max_diff']:.1e}")
+
+    print(f"\nfilter demo pipeline\n{'seconds':>8}{'samples':>12}{'M samples/s':>13}{'peak MB':>9}{'signal MB':>11}")
+    pipelines = []
+    for seconds in (float(s) for s in args.seconds.split(",")):
+        row = pipeline_row(seconds)
+        pipelines.append(row)
+        print(f"{seconds:>8g}{row['samples']:>12,}{row['pipeline_msps']:>13.1f}{row['peak_mb']:>9.1f}"
+              f"{row['signal_mb']:>11.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"filter": filters, "stft": stft, "pipeline": pipelines}, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Vectorized heat solver versus plain Python loops.
+
+    python -m benchmarks.heat [--points 1001,10001,100001] [--steps 200] [--output heat.json]
+
+For each grid size this times one explicit step (``portfolio.heat.explicit_step``)
+and one implicit step (``portfolio.heat.implicit_solver``: SciPy's banded solver
+if installed, otherwise NumPy cyclic reduction) against straightforward
+reimplementations with a Python loop over the nodes: a stencil loop and the
+Thomas algorithm. The loop versions run fewer steps on large grids (their cost
+per step is what matters); both sides start from the same profile and the
+largest difference after the common number of steps is reported, so a
+speed-up can't come from computing something else.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from portfolio import heat
+
+# Loop versions get at most this many node-updates per measurement.
+LOOP_BUDGET = 2_000_000
+
+
+def explicit_loop(T: list[float], r: float) -> list[float]:
+    """One Dirichlet forward-Euler step, node by node."""
+    new = T[:]
+    for i in range(1, len(T) - 1):
+        new[i] = T[i] + r * (T[i + 1] - 2.0 * T[i] + T[i - 1])
+    return new
+
+
+def thomas(lower: list[float], diag: list[float], upper: list[float], rhs: list[float]) -> list[float]:
+    n = len(diag)
+    c, d = [0.0] * n, [0.0] * n
+    c[0], d[0] = upper[0] / diag[0], rhs[0] / diag[0]
+    for i in range(1, n):
+        m = diag[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / m
+        d[i] = (rhs[i] - lower[i] * d[i - 1]) / m
+    x = [0.0] * n
+    x[-1] = d[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d[i] - c[i] * x[i + 1]
+    return x
+
+
+def per_step(advance, state, steps: int) -> tuple[float, object]:
+    start = time.perf_counter()
+    for _ in range(steps):
+        state = advance(state)
+    return (time.perf_counter() - start) / steps, state
+
+
+def measure(points: int, steps: int, r: float) -> dict:
+    problem = heat.HeatProblem("Copper", points, r, steps, "dirichlet", 20.0, 50.0, "explicit")
+    x, _, _ = heat.grid(problem)
+    T0 = heat.initial_profile(problem, x)
+    loop_steps = max(1, min(steps, LOOP_BUDGET // points))
+
+    lap = np.empty_like(T0)
+    explicit_s, T = per_step(lambda T: heat.explicit_step(T, r, "dirichlet", lap), T0.copy(), steps)
+    _, T_short = per_step(lambda T: heat.explicit_step(T, r, "dirichlet", lap), T0.copy(), loop_steps)
+    explicit_loop_s, T_loop = per_step(lambda T: explicit_loop(T, r), T0.tolist(), loop_steps)
+    explicit_diff = float(np.abs(T_short - np.array(T_loop)).max())
+
+    solve = heat.implicit_solver(points, r, "dirichlet")
+    implicit_s, _ = per_step(solve, T0.copy(), steps)
+    _, T_short = per_step(solve, T0.copy(), loop_steps)
+    lower, diag, upper = (v.tolist() for v in heat.implicit_matrix(points, r, "dirichlet"))
+    implicit_loop_s, T_loop = per_step(lambda T: thomas(lower, diag, upper, T), T0.tolist(), loop_steps)
+    implicit_diff = float(np.abs(T_short - np.array(T_loop)).max())
+
+    return {
+        "points": points,
+        "explicit_ms": round(explicit_s * 1000, 4),
+        "explicit_loop_ms": round(explicit_loop_s * 1000, 3),
+        "explicit_speedup": round(explicit_loop_s / explicit_s, 1),
+        "explicit_max_diff": explicit_diff,
+        "implicit_ms": round(implicit_s * 1000, 4),
+        "implicit_loop_ms": round(implicit_loop_s * 1000, 3),
+        "implicit_speedup": round(implicit_loop_s / implicit_s, 1),
+        "implicit_max_diff": implicit_diff,
+        "implicit_backend": heat.backend(problem._replace(scheme="implicit")),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--points", default="1001,10001,100001", help="comma-separated grid sizes")
+    parser.add_argument("--steps", type=int, default=200, help="time steps per vectorized measurement")
+    parser.add_argument("--fourier", type=float, default=0.4, help="r = α·Δt/Δx², stable for both schemes")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'points':>8}{'explicit ms':>13}{'loop ms':>10}{'speed-up':>10}"
+          f"{'implicit ms':>13}{'loop ms':>10}{'speed-up':>10}{'max diff':>10}")
+    for points in (int(n) for n in args.points.split(",")):
+        row = measure(points, args.steps, args.fourier)
+        results.append(row)
+        print(f"{points:>8}{row['explicit_ms']:>13.3f}{row['explicit_loop_ms']:>10.2f}{row['explicit_speedup']:>9.0f}x"
+              f"{row['implicit_ms']:>13.3f}{row['implicit_loop_ms']:>10.2f}{row['implicit_speedup']:>9.0f}x"
+              f"{max(row['explicit_max_diff'], row['implicit_max_diff']):>10.1e}")
+    print(f"implicit backend: {results[-1]['implicit_backend']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Concurrent-session load test for ``app.py``.
+
+    python -m benchmarks.load [--sessions 1,10,25] [--clicks 10] [--think 0.5] [--output load.json]
+
+For each concurrency level this starts a fresh ``streamlit run app.py`` and
+opens that many sessions against it over the same websocket protocol the
+browser uses (``/_stcore/stream``). Every session loads Welcome and then clicks
+through the sidebar like a visitor would: mostly on to the next section,
+sometimes back, sometimes anywhere, with a random pause between clicks.
+
+Reported per level:
+
+* rerun latency percentiles - from sending the click to ``script_finished``
+* ``msgs/s`` and ``KB/s``   - forward messages and bytes the server pushed
+* ``cpu %``                 - server process CPU (including ffmpeg and other
+  children) over the run, 100 = one core
+* ``rss``                   - server RSS before any session and at its peak;
+  ``per session`` is the growth divided by the number of sessions
+* ``errors``                - timed-out reruns and exceptions shown by the app
+
+Everything stays on this machine. The server gets an empty asset cache, and
+``PORTFOLIO_REMOTE_BASE_URL`` points at a local HTTP server over the repository,
+so any remote fetch (the Welcome images included) is answered locally. Reading
+``/proc`` for CPU and memory makes this Linux-only.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+RSS_SAMPLE_INTERVAL = 0.1
+
+# Probability of each kind of click; the rest of the mass goes to "next".
+P_BACK = 0.2
+P_JUMP = 0.2
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_asset_stub() -> tuple[ThreadingHTTPServer, str]:
+    """Local stand-in for the remote asset host, serving the repository."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=REPO_ROOT))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def start_app(port: int, env: dict) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true",
+         "--server.port", str(port), "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("streamlit did not become healthy within 60 s")
+
+
+def cpu_seconds(pid: int) -> float:
+    """User + system time of ``pid`` and its reaped children."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    utime, stime, cutime, cstime = (int(v) for v in fields[11:15])
+    return (utime + stime + cutime + cstime) / CLOCK_TICKS
+
+
+def rss_bytes(pid: int) -> int:
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+def next_section(sections: list[str], current: str, rng: random.Random) -> str:
+    index = sections.index(current)
+    roll = rng.random()
+    if roll < P_BACK and index > 0:
+        return sections[index - 1]
+    if roll < P_BACK + P_JUMP:
+        return rng.choice(sections)
+    return sections[(index + 1) % len(sections)]
+
+
+class Session:
+    """One simulated visitor speaking Streamlit's websocket protocol."""
+
+    def __init__(self, url: str, timeout: float, stats: dict):
+        self.url = url
+        self.timeout = timeout
+        self.stats = stats
+        self.radio_id = None
+        self.sections = None
+
+    async def rerun(self, ws, section: str | None) -> float | None:
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        if section is not None:
+            widget = message.rerun_script.widget_states.widgets.add()
+            widget.id = self.radio_id
+            widget.string_value = section
+
+        start = time.perf_counter()
+        await ws.send(message.SerializeToString())
+        deadline = start + self.timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self.stats["errors"].append(f"timeout waiting for {section or 'first run'}")
+                return None
+            try:
+                data = await asyncio.wait_for(ws.recv(), remaining)
+            except asyncio.TimeoutError:
+                continue
+            self.stats["messages"] += 1
+            self.stats["bytes"] += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if element.WhichOneof("type") == "radio" and self.radio_id is None:
+                    self.radio_id = element.radio.id
+                    self.sections = list(element.radio.options)
+                elif element.WhichOneof("type") == "exception":
+                    self.stats["errors"].append(element.exception.message)
+            elif kind == "script_finished" and forward.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY:
+                return time.perf_counter() - start
+
+    async def run(self, clicks: int, think: float, rng: random.Random):
+        async with websockets.connect(self.url, max_size=None) as ws:
+            try:
+                await self.visit(ws, clicks, think, rng)
+            finally:
+                self.stats["finished"] += 1
+            # Hold the session open until every visitor is done, so RSS reflects all of them.
+            await self.stats["done"].wait()
+
+    async def visit(self, ws, clicks: int, think: float, rng: random.Random):
+        first = await self.rerun(ws, None)
+        if first is None or self.radio_id is None:
+            return
+        self.stats["first_load"].append(first)
+        current = self.sections[0]
+        for _ in range(clicks):
+            await asyncio.sleep(rng.uniform(0, 2 * think))
+            current = next_section(self.sections, current, rng)
+            latency = await self.rerun(ws, current)
+            if latency is not None:
+                self.stats["latencies"].append(latency)
+
+
+def percentile(values: list[float], q: int) -> float:
+    if not values:
+        return float("nan")
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+async def drive(port: int, pid: int, sessions: int, clicks: int, think: float, timeout: float, seed: int) -> dict:
+    stats = {"messages": 0, "bytes": 0, "latencies": [], "first_load": [], "errors": [],
+             "finished": 0, "done": asyncio.Event()}
+    rss = {"before": rss_bytes(pid), "peak": 0}
+
+    async def sample_rss():
+        while not stats["done"].is_set():
+            rss["peak"] = max(rss["peak"], rss_bytes(pid))
+            await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    visitors = [Session(url, timeout, stats) for _ in range(sessions)]
+    sampler = asyncio.create_task(sample_rss())
+    cpu_start, wall_start = cpu_seconds(pid), time.perf_counter()
+    tasks = [asyncio.create_task(v.run(clicks, think, random.Random(seed + i))) for i, v in enumerate(visitors)]
+
+    # Sessions wait on "done" once they have finished clicking; a task that is
+    # already done before then failed to connect.
+    while stats["finished"] + sum(t.done() for t in tasks) < sessions:
+        await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+    wall = time.perf_counter() - wall_start
+    cpu = cpu_seconds(pid) - cpu_start
+    rss["end"] = rss_bytes(pid)
+    stats["done"].set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    await sampler
+    stats["errors"] += [repr(r) for r in results if isinstance(r, BaseException)]
+
+    latencies = [t * 1000 for t in stats["latencies"]]
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "first_load_p50_ms": round(percentile([t * 1000 for t in stats["first_load"]], 50), 1),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p90_ms": round(percentile(latencies, 90), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(max(latencies, default=float("nan")), 1),
+        "msgs_per_s": round(stats["messages"] / wall, 1),
+        "kb_per_s": round(stats["bytes"] / 1024 / wall, 1),
+        "cpu_percent": round(100 * cpu / wall, 1),
+        "rss_before_mb": round(rss["before"] / 2**20, 1),
+        "rss_peak_mb": round(max(rss["peak"], rss["end"]) / 2**20, 1),
+        "rss_per_session_kb": round((max(rss["peak"], rss["end"]) - rss["before"]) / 1024 / sessions, 1),
+        "errors": len(stats["errors"]),
+        "error_samples": sorted(set(stats["errors"]))[:5],
+        "wall_s": round(wall, 2),
+    }
+
+
+def run_level(sessions: int, args) -> dict:
+    stub, stub_url = start_asset_stub()
+    port = free_port()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, PORTFOLIO_CACHE_DIR=cache_dir, PORTFOLIO_REMOTE_BASE_URL=stub_url)
+        env.pop("PORTFOLIO_OFFLINE", None)
+        process = start_app(port, env)
+        try:
+            return asyncio.run(drive(port, process.pid, sessions, args.clicks, args.think, args.timeout, args.seed))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+            stub.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", default="1,10,25", help="comma-separated concurrency levels")
+    parser.add_argument("--clicks", type=int, default=10, help="section changes per session")
+    parser.add_argument("--think", type=float, default=0.5, help="mean pause between clicks, in seconds")
+    parser.add_argument("--timeout", type=float, default=60.0, help="give up on a rerun after this many seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'sessions':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}{'msgs/s':>8}{'KB/s':>8}"
+          f"{'cpu %':>7}{'rss MB':>8}{'KB/sess':>9}{'errors':>8}")
+    for level in (int(n) for n in args.sessions.split(",")):
+        row = run_level(level, args)
+        results.append(row)
+        print(f"{level:>8}{row['p50_ms']:>8.0f}{row['p90_ms']:>8.0f}{row['p99_ms']:>8.0f}{row['max_ms']:>8.0f}"
+              f"{row['msgs_per_s']:>8.0f}{row['kb_per_s']:>8.0f}{row['cpu_percent']:>7.0f}"
+              f"{row['rss_peak_mb']:>8.0f}{row['rss_per_session_kb']:>9.0f}{row['errors']:>8}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
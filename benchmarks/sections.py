@@ -0,0 +1,191 @@
+"""Per-section performance benchmark for ``app.py``.
+
+    python -m portfolio.build_assets
+    python -m benchmarks.sections [--reruns 5] [--output bench_output.json]
+
+The baseline is recorded against the asset build, as the app is deployed, so
+``static/build`` (gitignored) must be built first: the benchmark refuses to run
+if the manifest is missing or doesn't cover every asset the sections use, and
+the sections run with ``PORTFOLIO_REQUIRE_MANIFEST=1`` so nothing is quietly
+derived on the fly instead.
+
+Every sidebar section is measured in its own fresh interpreter with an empty
+asset cache and no network access (``PORTFOLIO_OFFLINE=1``, sockets refused).
+The app is driven with Streamlit's ``AppTest``: it starts on Welcome, switches
+to the section, then reruns it. For each section we record
+
+* ``cold_start_ms``   - interpreter start to the end of the first Welcome run
+* ``first_visit_ms``  - the switch to the section, with cold derivative caches
+* ``rerun_ms``        - median of the following reruns
+* ``peak_rss_kb``     - peak resident set size of the worker
+* ``message_bytes``   - serialized size of the element protos in the page
+* ``media_bytes``     - bytes Streamlit registered as media for the rerun
+* ``static_bytes``    - size of the ``app/static`` files the page references
+* ``video_bytes``     - size of the referenced video renditions, which the
+  browser streams only when played (``preload="none"``)
+
+Compare the output with the committed baseline using ``benchmarks.compare``.
+"""
+
+import argparse
+import json
+import os
+import re
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_URL = re.compile(rb"app/static/([\w./-]+)")
+VIDEO_SUFFIXES = (".mp4", ".webm", ".mov")
+
+
+def _refuse_network(*args, **kwargs):
+    raise OSError("network access is disabled while benchmarking")
+
+
+def _walk_protos(node):
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        yield proto
+    children = getattr(node, "children", {})
+    for child in children.values() if isinstance(children, dict) else children:
+        yield from _walk_protos(child)
+
+
+def _page_bytes(app) -> tuple[int, int, int]:
+    message_bytes = 0
+    static_files = set()
+    for proto in _walk_protos(app._tree):
+        serialized = proto.SerializeToString()
+        message_bytes += len(serialized)
+        static_files.update(STATIC_URL.findall(serialized))
+    static_bytes = video_bytes = 0
+    for name in static_files:
+        path = os.path.join(REPO_ROOT, "static", name.decode())
+        if os.path.isfile(path):
+            if path.endswith(VIDEO_SUFFIXES):
+                video_bytes += os.path.getsize(path)
+            else:
+                static_bytes += os.path.getsize(path)
+    return message_bytes, static_bytes, video_bytes
+
+
+def run_worker(section: str, reruns: int) -> dict:
+    """Measure one section; runs inside a fresh interpreter."""
+    socket.socket.connect = _refuse_network
+
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.testing.v1 import AppTest
+
+    media = {}
+    load_and_get_id = MemoryMediaFileStorage.load_and_get_id
+
+    def counting_load_and_get_id(self, *args, **kwargs):
+        file_id = load_and_get_id(self, *args, **kwargs)
+        media[file_id] = self._files_by_id[file_id].content_size
+        return file_id
+
+    MemoryMediaFileStorage.load_and_get_id = counting_load_and_get_id
+
+    app = AppTest.from_file(os.path.join(REPO_ROOT, "app.py"), default_timeout=300)
+    app.run()
+    cold_start_ms = (time.time() - float(os.environ["BENCH_PROCESS_START"])) * 1000
+
+    start = time.perf_counter()
+    app.sidebar.radio[0].set_value(section).run()
+    first_visit_ms = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for _ in range(reruns):
+        media.clear()
+        start = time.perf_counter()
+        app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    message_bytes, static_bytes, video_bytes = _page_bytes(app)
+    return {
+        "cold_start_ms": round(cold_start_ms, 1),
+        "first_visit_ms": round(first_visit_ms, 1),
+        "rerun_ms": round(statistics.median(timings), 1),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "message_bytes": message_bytes,
+        "media_bytes": sum(media.values()),
+        "static_bytes": static_bytes,
+        "video_bytes": video_bytes,
+        "errors": [str(e.value) for e in app.exception],
+    }
+
+
+def measure(section: str, reruns: int) -> dict:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, PORTFOLIO_OFFLINE="1", PORTFOLIO_REQUIRE_MANIFEST="1", PORTFOLIO_CACHE_DIR=cache_dir,
+                   BENCH_PROCESS_START=repr(time.time()))
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.sections", "--worker", section, "--reruns", str(reruns)],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def missing_from_build() -> list[str] | None:
+    """Bundled assets the sections use that the build lacks; ``None`` if there is no build.
+
+    Assets that aren't in the checkout can't be built, so they don't count.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    from portfolio import manifest
+    from portfolio.build_assets import referenced_assets
+
+    if not manifest.MANIFEST_PATH.is_file():
+        return None
+    return [name for name in referenced_assets()
+            if manifest.asset(name) is None and os.path.isfile(os.path.join(REPO_ROOT, name))]
+
+
+def section_names() -> list[str]:
+    sys.path.insert(0, REPO_ROOT)
+    from portfolio.sections import SECTIONS
+
+    return list(SECTIONS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--section", action="append", help="only measure these sections")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.reruns)))
+        return
+
+    missing = missing_from_build()
+    if missing is None or missing:
+        problem = "static/build has not been built" if missing is None else (
+            f"static/build is out of date ({len(missing)} assets missing, e.g. {missing[0]})")
+        sys.exit(f"{problem}; run python -m portfolio.build_assets first")
+
+    results = {}
+    print(f"{'section':<40}{'cold':>8}{'first':>8}{'rerun':>8}{'rss MB':>8}{'msg KB':>8}{'media KB':>10}{'static KB':>10}")
+    for section in args.section or section_names():
+        row = results[section] = measure(section, args.reruns)
+        print(f"{section:<40}{row['cold_start_ms']:>8.0f}{row['first_visit_ms']:>8.0f}{row['rerun_ms']:>8.1f}"
+              f"{row['peak_rss_kb'] / 1024:>8.0f}{row['message_bytes'] / 1024:>8.1f}"
+              f"{row['media_bytes'] / 1024:>10.0f}{row['static_bytes'] / 1024:>10.0f}"
+              + ("  (errors)" if row["errors"] else ""))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared helpers for the Streamlit portfolio in ``app.py``."""
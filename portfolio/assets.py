@@ -0,0 +1,317 @@
+"""Asset resolution: bundled files first, remote fallback through a disk cache.
+
+Every media file the app shows ships in the repository, so the normal path is a
+plain ``Path`` lookup with no I/O beyond ``stat``. Only when a file is missing
+from the checkout is it fetched from GitHub; downloads are stored in a
+content-addressed cache under ``.cache/assets`` (blobs named by SHA-256) that
+is bounded in size and evicted least recently used first. A cached download
+older than ``REVALIDATE_AFTER`` is still served at once, and re-checked against
+the server in the background with the ETag it was stored with, so a rerun
+never waits on the network for an asset it already has.
+
+Set ``PORTFOLIO_OFFLINE=1`` to disable the remote fallback entirely, or
+``PORTFOLIO_REMOTE_BASE_URL`` to fetch from somewhere else (the load test
+points it at a local stub).
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from portfolio.profiling import timed
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REMOTE_BASE_URL = os.environ.get("PORTFOLIO_REMOTE_BASE_URL",
+                                 "https://raw.githubusercontent.com/choo12204/my-portfolio/main/")
+CACHE_DIR = Path(os.environ.get("PORTFOLIO_CACHE_DIR", REPO_ROOT / ".cache"))
+CACHE_MAX_BYTES = int(os.environ.get("PORTFOLIO_ASSET_CACHE_BYTES", 256 * 1024 * 1024))
+FETCH_TIMEOUT = float(os.environ.get("PORTFOLIO_FETCH_TIMEOUT", 5.0))
+# After a failed download, don't try the same asset again for this many seconds,
+# so an unreachable remote costs one timeout rather than one per rerun.
+FAILURE_BACKOFF = 60.0
+# Cached downloads older than this are revalidated with their ETag, in seconds.
+REVALIDATE_AFTER = float(os.environ.get("PORTFOLIO_ASSET_REVALIDATE_AFTER", 24 * 60 * 60))
+
+
+class AssetNotFound(FileNotFoundError):
+    pass
+
+
+def is_offline() -> bool:
+    return os.environ.get("PORTFOLIO_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Content-addressed blob store with an LRU size bound.
+
+    ``index.json`` maps an asset name to the hash of its blob, the ETag the
+    server returned for it, its size, the time the server last confirmed it
+    and the time it was last used. Use times change on every hit, so they are
+    kept in memory and written out with the next ``put`` or at exit.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index_path = self.root / "index.json"
+        self._index = self._load_index()
+        # Blobs whose hash has been checked by this process; re-hashing a
+        # multi-megabyte file on every rerun would defeat the point.
+        self._verified: set[str] = set()
+        self._dirty = False
+        atexit.register(self.flush)
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=1, sort_keys=True)
+        os.replace(tmp, self._index_path)
+        self._dirty = False
+
+    def flush(self):
+        """Write out use times recorded since the index was last saved."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.root / "blobs" / sha256[:2] / sha256
+
+    def entry(self, name: str) -> dict | None:
+        with self._lock:
+            entry = self._index.get(name)
+            return dict(entry) if entry else None
+
+    def get(self, name: str) -> Path | None:
+        """Return the cached blob for ``name`` if it is present and intact."""
+        with self._lock:
+            entry = self._index.get(name)
+            if entry is None:
+                return None
+            path = self._blob_path(entry["sha256"])
+            try:
+                valid = path.stat().st_size == entry["size"] and (
+                    entry["sha256"] in self._verified or file_sha256(path) == entry["sha256"])
+            except OSError:
+                valid = False
+            if not valid:
+                self._verified.discard(entry["sha256"])
+                del self._index[name]
+                path.unlink(missing_ok=True)
+                self._save_index()
+                return None
+            self._verified.add(entry["sha256"])
+            entry["atime"] = time.time()
+            self._dirty = True
+            return path
+
+    def confirm(self, name: str):
+        """Record that the server still has the cached version of ``name``."""
+        with self._lock:
+            if name in self._index:
+                self._index[name]["checked"] = time.time()
+                self._save_index()
+
+    def put(self, name: str, data: bytes, etag: str | None = None) -> Path:
+        """Store ``data`` as ``name``, evicting other blobs to stay within ``max_bytes``.
+
+        The new blob itself is never evicted, so the returned path exists even
+        when it is larger than the bound on its own.
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(sha256)
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            now = time.time()
+            self._index[name] = {"sha256": sha256, "etag": etag, "size": len(data), "atime": now, "checked": now}
+            self._evict(keep=sha256)
+            self._save_index()
+        return path
+
+    def _evict(self, keep: str):
+        blobs = {}
+        for name, entry in self._index.items():
+            blob = blobs.setdefault(entry["sha256"], {"size": entry["size"], "atime": 0.0, "names": []})
+            blob["atime"] = max(blob["atime"], entry["atime"])
+            blob["names"].append(name)
+        total = sum(b["size"] for b in blobs.values())
+        for sha256, blob in sorted(blobs.items(), key=lambda item: item[1]["atime"]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            for name in blob["names"]:
+                del self._index[name]
+            self._blob_path(sha256).unlink(missing_ok=True)
+            total -= blob["size"]
+
+
+def _http_get(url: str, etag: str | None):
+    import requests
+
+    headers = {"If-None-Match": etag} if etag else {}
+    response = requests.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+    return response.content, response.headers.get("ETag")
+
+
+class AssetResolver:
+    def __init__(self, root: Path = REPO_ROOT, cache: DiskCache | None = None,
+                 remote_base_url: str = REMOTE_BASE_URL, fetch=_http_get,
+                 revalidate_after: float = REVALIDATE_AFTER):
+        self.root = Path(root)
+        self.cache = cache if cache is not None else DiskCache(CACHE_DIR / "assets", CACHE_MAX_BYTES)
+        self.remote_base_url = remote_base_url
+        self.fetch = fetch
+        self.revalidate_after = revalidate_after
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        # Guards _fetch_locks and _failed, which prefetch and warm-up threads share.
+        self._lock = threading.Lock()
+        self._failed: dict[str, float] = {}
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._fetch_locks.setdefault(name, threading.Lock())
+
+    def resolve(self, name: str) -> Path:
+        """Return a local path for the asset ``name`` (a repo-relative filename)."""
+        local = self.root / name
+        if local.is_file():
+            return local
+
+        cached = self.cache.get(name)
+        if cached is not None:
+            if not is_offline() and self._is_stale(name):
+                self._revalidate_in_background(name)
+            return cached
+
+        if is_offline():
+            raise AssetNotFound(f"{name} is not bundled or cached and remote fetching is disabled")
+
+        # One download per asset, however many sessions ask for it at once.
+        with self._lock_for(name):
+            cached = self.cache.get(name)
+            if cached is not None:
+                return cached
+            return self._download(name)
+
+    def _is_stale(self, name: str) -> bool:
+        entry = self.cache.entry(name)
+        return entry is not None and time.time() - entry.get("checked", 0.0) > self.revalidate_after
+
+    def _revalidate_in_background(self, name: str):
+        lock = self._lock_for(name)
+        # Already being fetched or revalidated by another session.
+        if not lock.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                self._revalidate(name)
+            finally:
+                lock.release()
+
+        threading.Thread(target=run, name=f"revalidate {name}", daemon=True).start()
+
+    def revalidate(self, name: str) -> Path:
+        """Re-check a cached remote asset against the server using its ETag.
+
+        If the server can't be reached the cached copy is kept and returned.
+        """
+        if (self.root / name).is_file() or is_offline():
+            return self.resolve(name)
+        with self._lock_for(name):
+            return self._revalidate(name)
+
+    def _revalidate(self, name: str) -> Path:
+        entry = self.cache.entry(name)
+        try:
+            return self._download(name, entry and entry["etag"])
+        except AssetNotFound:
+            cached = self.cache.get(name)
+            if cached is None:
+                raise
+            return cached
+
+    def _download(self, name: str, etag: str | None = None) -> Path:
+        with timed("fetch", name):
+            return self._fetch_into_cache(name, etag)
+
+    def _fetch(self, name: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        """``self.fetch`` with the failure backoff; any error becomes ``AssetNotFound``."""
+        with self._lock:
+            failed_at = self._failed.get(name)
+        if failed_at is not None and time.monotonic() - failed_at < FAILURE_BACKOFF:
+            raise AssetNotFound(f"{name} could not be fetched recently; not retrying yet")
+
+        try:
+            result = self.fetch(self.remote_base_url + name, etag)
+        except Exception as exc:
+            with self._lock:
+                self._failed[name] = time.monotonic()
+            raise AssetNotFound(f"{name} is not bundled and could not be fetched: {exc}") from exc
+        with self._lock:
+            self._failed.pop(name, None)
+        return result
+
+    def _fetch_into_cache(self, name: str, etag: str | None) -> Path:
+        data, etag = self._fetch(name, etag)
+        if data is None:
+            # 304 Not Modified: the blob we already have is current.
+            self.cache.confirm(name)
+            cached = self.cache.get(name)
+            if cached is not None:
+                return cached
+            # ...unless it was evicted meanwhile: fetch it whole.
+            data, etag = self._fetch(name, None)
+        return self.cache.put(name, data, etag)
+
+    def read_bytes(self, name: str) -> bytes:
+        return self.resolve(name).read_bytes()
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver() -> AssetResolver:
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = AssetResolver()
+        return _resolver
+
+
+def resolve_asset(name: str) -> Path:
+    return get_resolver().resolve(name)
+
+
+def read_asset(name: str) -> bytes:
+    return get_resolver().read_bytes(name)
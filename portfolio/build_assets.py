@@ -0,0 +1,243 @@
+"""Offline asset build: optimize every referenced asset and write the manifest.
+
+    python -m portfolio.build_assets [--clean]
+
+Scans ``app.py``, the section modules and ``content/`` for the media files they
+reference, then for each one
+
+* strips metadata (EXIF is applied to the pixels first, then dropped) and
+  recompresses it: PNGs losslessly (kept as-is when that doesn't help), JPEGs
+  at quality 85, progressive,
+* builds every responsive variant ``portfolio.responsive`` can ask for, plus
+  the Welcome derivatives, PDF page thumbnails and video renditions/posters,
+* computes a ~20 px blurred placeholder (LQIP) for each opaque image,
+* writes everything to ``static/build/`` under content-fingerprinted names and
+  records hashes, sizes, dimensions, placeholders and URLs in
+  ``static/build/manifest.json``.
+
+The app then serves these files without ever opening an original. Run with
+``PORTFOLIO_REQUIRE_MANIFEST=1`` in production to make a missing entry fail
+loudly rather than fall back to on-the-fly processing.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from portfolio import content, manifest, pdf, placeholders, responsive, video
+from portfolio.assets import REPO_ROOT, AssetNotFound, file_sha256, resolve_asset
+from portfolio.derivatives import FORMAT_EXTENSIONS, get_derivative
+from portfolio.sections import IMAGE_EXTENSIONS, SECTIONS, VIDEO_EXTENSIONS, media_references, section_derivatives
+from portfolio.static import BUILD_DIR, publish_bytes
+
+JPEG_QUALITY = 85
+# PNG info keys that only affect how the image is drawn. Anything else Pillow
+# reports (tEXt/iTXt/zTXt chunks, eXIf, XMP, ICC profiles) is metadata, which
+# the re-encode drops.
+PNG_RENDERING_INFO = {"dpi", "gamma", "aspect", "srgb", "chromaticity", "transparency", "interlace"}
+
+
+def source_files() -> list[Path]:
+    files = [REPO_ROOT / "app.py"]
+    files += sorted((REPO_ROOT / "portfolio" / "sections").glob("*.py"))
+    return files
+
+
+def referenced_assets() -> list[str]:
+    """Media filenames in the app's string literals and in the content files."""
+    names = []
+    for path in source_files():
+        for name in media_references(path.read_text(encoding="utf-8")):
+            if name not in names:
+                names.append(name)
+    for module in SECTIONS.values():
+        if content.has_content(module):
+            names += [name for name in content.asset_names(module) if name not in names]
+    return names
+
+
+def optimize_image(img: Image.Image, format: str) -> bytes:
+    img = ImageOps.exif_transpose(img)
+    buffered = BytesIO()
+    if format == "JPEG":
+        img.convert("RGB").save(buffered, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        # Re-saving without passing info/exif drops text chunks and metadata.
+        img.save(buffered, format="PNG", optimize=True)
+    return buffered.getvalue()
+
+
+def has_metadata(img: Image.Image) -> bool:
+    """Whether a PNG carries text or metadata chunks, including ones after the image data."""
+    return bool(getattr(img, "text", None)) or any(key not in PNG_RENDERING_INFO for key in img.info)
+
+
+def build_image(name: str, path: Path, derivatives: dict) -> dict:
+    with Image.open(path) as img:
+        format = "JPEG" if img.format == "JPEG" else "PNG"
+        width, height = ImageOps.exif_transpose(img).size
+        has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        opaque = placeholders.is_opaque(img)
+        optimized = optimize_image(img, format)
+        if img.format == "PNG" and not has_metadata(img) and len(optimized) >= path.stat().st_size:
+            # Already tighter than Pillow manages; nothing private to strip.
+            optimized = path.read_bytes()
+
+    stem = Path(name).stem
+    url = publish_bytes(optimized, FORMAT_EXTENSIONS[format], stem, directory=BUILD_DIR)
+    entry = {
+        "kind": "image",
+        "sha256": file_sha256(path),
+        "bytes": path.stat().st_size,
+        "width": width,
+        "height": height,
+        "has_alpha": has_alpha,
+        "url": url,
+        "optimized_bytes": len(optimized),
+    }
+    if opaque:
+        entry["lqip"] = placeholders.build_data_uri(name)
+
+    variant_format = responsive.variant_format(has_alpha)
+    widths = {responsive.pick_width(width, display) for display in responsive.WIDTH_BUCKETS}
+    widths.add(responsive.pick_width(width, responsive.DEFAULT_DISPLAY_WIDTH))
+    for variant_width in widths:
+        data = get_derivative(name, "resize_width", format=variant_format,
+                              quality=responsive.VARIANT_QUALITY, width=variant_width)
+        spec = manifest.derivative_spec(name, "resize_width", {"width": variant_width},
+                                        variant_format, responsive.VARIANT_QUALITY)
+        if len(data) < len(optimized):
+            derivatives[spec] = {
+                "url": publish_bytes(data, FORMAT_EXTENSIONS[variant_format], stem, directory=BUILD_DIR),
+                "bytes": len(data),
+                "width": variant_width or width,
+                "format": variant_format,
+            }
+        else:
+            derivatives[spec] = {"url": url, "bytes": len(optimized), "width": width, "format": format}
+    return entry
+
+
+def build_pdf(name: str, path: Path, derivatives: dict) -> dict:
+    data = path.read_bytes()
+    entry = {
+        "kind": "pdf",
+        "sha256": file_sha256(path),
+        "bytes": len(data),
+        "url": publish_bytes(data, "pdf", Path(name).stem, directory=BUILD_DIR),
+        "optimized_bytes": len(data),
+        "pages": None,
+    }
+    if pdf.pdfium is None:
+        return entry
+
+    entry["pages"] = pdf.page_count(name)
+    for page in range(entry["pages"]):
+        _, thumbnail = pdf.page_thumbnail(name, page)
+        spec = manifest.derivative_spec(name, "pdf_page", {"page": page, "width": pdf.THUMBNAIL_WIDTH},
+                                        pdf.THUMBNAIL_FORMAT, pdf.THUMBNAIL_QUALITY)
+        derivatives[spec] = {
+            "url": publish_bytes(thumbnail, FORMAT_EXTENSIONS[pdf.THUMBNAIL_FORMAT],
+                                 f"{Path(name).stem}-p{page + 1}", directory=BUILD_DIR),
+            "bytes": len(thumbnail),
+        }
+    return entry
+
+
+def build_video(name: str, path: Path, derivatives: dict) -> dict:
+    built = video.build_video(name, directory=BUILD_DIR)
+    return {
+        "kind": "video",
+        "sha256": file_sha256(path),
+        "bytes": path.stat().st_size,
+        # What a desktop visitor streams: the default (last) source.
+        "optimized_bytes": built["sources"][-1]["bytes"],
+        **built,
+    }
+
+
+def build_file(name: str, path: Path, derivatives: dict) -> dict:
+    data = path.read_bytes()
+    return {
+        "kind": "file",
+        "sha256": file_sha256(path),
+        "bytes": len(data),
+        "url": publish_bytes(data, path.suffix.lstrip(".").lower(), Path(name).stem, directory=BUILD_DIR),
+        "optimized_bytes": len(data),
+    }
+
+
+def build_section_derivatives(derivatives: dict):
+    """Named derivatives the section registry declares in ``DERIVATIVES``."""
+    for section in SECTIONS:
+        for spec in section_derivatives(section):
+            spec = dict(spec)
+            name, transform = spec.pop("name"), spec.pop("transform")
+            format, quality = spec.pop("format", "PNG"), spec.pop("quality", None)
+            data = get_derivative(name, transform, format, quality, **spec)
+            derivatives[manifest.derivative_spec(name, transform, spec, format, quality)] = {
+                "url": publish_bytes(data, FORMAT_EXTENSIONS[format], Path(name).stem, directory=BUILD_DIR),
+                "bytes": len(data),
+            }
+
+
+def build(clean: bool = False) -> dict:
+    if clean and BUILD_DIR.exists():
+        shutil.rmtree(BUILD_DIR)
+    # Build from the originals, not from whatever an earlier build recorded.
+    manifest.reset()
+    os.environ.pop("PORTFOLIO_REQUIRE_MANIFEST", None)
+
+    assets, derivatives = {}, {}
+    for name in referenced_assets():
+        try:
+            path = resolve_asset(name)
+        except AssetNotFound as exc:
+            print(f"skip {name}: {exc}")
+            continue
+        suffix = path.suffix.lower()
+        if suffix in IMAGE_EXTENSIONS:
+            assets[name] = build_image(name, path, derivatives)
+        elif suffix == ".pdf":
+            assets[name] = build_pdf(name, path, derivatives)
+        elif suffix in VIDEO_EXTENSIONS:
+            assets[name] = build_video(name, path, derivatives)
+        else:
+            assets[name] = build_file(name, path, derivatives)
+        print(f"{name}: {assets[name]['bytes']} -> {assets[name]['optimized_bytes']} bytes")
+    build_section_derivatives(derivatives)
+
+    result = {
+        "version": manifest.MANIFEST_VERSION,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "assets": assets,
+        "derivatives": derivatives,
+    }
+    manifest.MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest.MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=1, sort_keys=True)
+    manifest.reload()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clean", action="store_true", help="remove static/build before building")
+    args = parser.parse_args(argv)
+
+    result = build(clean=args.clean)
+    original = sum(a["bytes"] for a in result["assets"].values())
+    optimized = sum(a["optimized_bytes"] for a in result["assets"].values())
+    print(f"{len(result['assets'])} assets, {len(result['derivatives'])} derivatives; "
+          f"originals {original} bytes -> optimized {optimized} bytes")
+    print(f"manifest: {manifest.MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Process-wide in-memory cache shared by every Streamlit session.
+
+Streamlit runs each browser session on its own thread of one process, so
+module-level state is already shared; what it lacked was a bound. Encoded
+derivatives, base64 strings, resolved variants and video renditions all go
+through ``shared_cache`` instead of ad-hoc dictionaries. It holds at most
+``PORTFOLIO_MEMORY_CACHE_BYTES`` (default 64 MiB) and evicts least recently
+used entries first, weighing each entry by its size. Concurrent misses on the
+same key run the loader once; the other callers wait for its result.
+
+``shared_cache.stats()`` reports hits, misses, loads and evictions; the
+profiling panel shows them.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+MEMORY_CACHE_MAX_BYTES = int(os.environ.get("PORTFOLIO_MEMORY_CACHE_BYTES", 64 * 1024 * 1024))
+# Charged for values whose size we can't measure cheaply (tuples, dicts, ...).
+DEFAULT_ENTRY_BYTES = 512
+
+
+def sizeof(value) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return DEFAULT_ENTRY_BYTES
+
+
+class MemoryCache:
+    """Size-aware LRU cache with single-flight loading."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loading: dict = {}  # key -> lock held by the thread loading it
+        self._counters = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[0]
+
+    def put(self, key, value, size: int | None = None):
+        size = sizeof(value) if size is None else size
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def get_or_load(self, key, load, size=None):
+        """Value under ``key``; on a miss, ``load()`` runs once however many threads ask.
+
+        ``size`` is a byte count or a function of the loaded value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry[0]
+            self._counters["misses"] += 1
+            lock = self._loading.setdefault(key, threading.Lock())
+
+        with lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                self._counters["loads"] += 1
+            try:
+                value = load()
+                self.put(key, value, size(value) if callable(size) else size)
+                return value
+            finally:
+                with self._lock:
+                    if self._loading.get(key) is lock:
+                        del self._loading[key]
+
+    def discard(self, key):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def discard_where(self, predicate) -> int:
+        """Drop every entry whose key satisfies ``predicate``; returns how many."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._counters["evictions"] += 1
+
+
+shared_cache = MemoryCache(MEMORY_CACHE_MAX_BYTES)
@@ -0,0 +1,28 @@
+"""Chart helpers shared by the simulation and signal demos.
+
+The demos chart arrays that can be far longer than a chart needs, so they are
+decimated to ``DISPLAY_POINTS`` first, then wrapped in a pandas frame for
+``st.line_chart``. A demo that streams a long computation redraws at most every
+``STREAM_INTERVAL`` seconds: each redraw sends a new chart to the browser.
+
+pandas is imported on first use, as it is only needed once a demo is switched on.
+"""
+
+import numpy as np
+
+DISPLAY_POINTS = 800
+STREAM_INTERVAL = 0.25
+
+
+def downsample(values: np.ndarray, points: int = DISPLAY_POINTS) -> np.ndarray:
+    """``points`` evenly spaced samples along the last axis, ends included."""
+    if values.shape[-1] <= points:
+        return values
+    return values[..., np.linspace(0, values.shape[-1] - 1, points).round().astype(int)]
+
+
+def chart_frame(index, columns: dict, index_name: str, decimals: int = 4):
+    """A DataFrame of ``columns`` over ``index``, rounded so the chart's axis labels stay short."""
+    import pandas as pd
+
+    return pd.DataFrame(columns, index=pd.Index(np.round(index, decimals), name=index_name))
@@ -0,0 +1,303 @@
+"""Section content as data, compiled into an in-memory index.
+
+Project text and asset lists live in ``content/<module>.toml`` rather than in
+Python literals, one ``[[projects]]`` table per project:
+
+    header = "PCB Design & Manufacture"
+    layout = "shared"                         # optional, see below
+
+    [[projects]]
+    id = "thermal-design"                     # unique within the file
+    title = "🔥 Thermal Design"                 # optional subheader
+    body = '''
+    - Markdown, usually the bullet list.
+    '''
+    assets = [ { image = "IMG_0877.jpeg", caption = "optional" }, { video = "..." }, { pdf = "..." } ]
+    demo = "heat"                             # optional, a key of DEMOS
+    spacer = 3                                # optional, ``layout = "shared"`` only
+
+``get(module)`` parses and validates a file once and keeps the result. Every
+later call only stats the file; when its modification time changes the file is
+parsed again and compared with the previous version project by project, and
+only the projects that changed or disappeared have their derived assets
+(resolved image variants, prefetch bookkeeping) dropped. A content edit
+therefore shows up on the next rerun, without restarting the app and without
+throwing away everything else that is warm. A file that fails validation is
+logged and the last good version stays in use.
+
+Projects with assets render as the usual two-column row, text on the left and
+media on the right; projects without assets render their text full width. A
+project's ``demo`` is rendered below that by the function ``DEMOS`` maps it
+to, whose module is imported only when the section is shown.
+
+With ``layout = "shared"`` the whole section is instead one pair of columns
+that every project adds to, text on the left and media on the right, as the
+Programming & Embedded Systems page has always been laid out. The columns don't
+line up row by row there, so a project's ``spacer`` puts that many blank lines
+above its media (or above its text, if it has no media) to keep the two
+together. The first project's title heads the pair; later titles go in the
+left column.
+"""
+
+import importlib
+import logging
+import threading
+import tomllib
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+from portfolio.assets import REPO_ROOT
+from portfolio.cache import shared_cache
+
+logger = logging.getLogger(__name__)
+
+CONTENT_DIR = REPO_ROOT / "content"
+ASSET_KINDS = ("image", "video", "pdf")
+SECTION_KEYS = {"header", "layout", "projects"}
+LAYOUTS = ("rows", "shared")
+PROJECT_KEYS = {"id", "title", "body", "assets", "demo", "spacer"}
+# Interactive widgets a project can embed: name -> "module:function".
+DEMOS = {
+    "heat": "portfolio.heat:demo",
+    "reflections": "portfolio.tline:reflection_demo",
+    "crosstalk": "portfolio.tline:crosstalk_demo",
+    "spectrogram": "portfolio.dsp:spectrogram_demo",
+    "fir": "portfolio.dsp:filter_demo",
+}
+# Each demo starts with an ``st.toggle`` whose key ends in this; the static
+# export leaves those off rather than run the demo.
+DEMO_TOGGLE_SUFFIX = "-demo"
+ASSET_KEYS = set(ASSET_KINDS) | {"caption"}
+
+Asset = namedtuple("Asset", "kind name caption")
+Project = namedtuple("Project", "id title body assets demo spacer")
+Section = namedtuple("Section", "module header layout projects mtime_ns")
+
+
+class ContentError(ValueError):
+    """A content file that doesn't match the schema above."""
+
+
+_index: dict[str, Section] = {}
+_lock = threading.Lock()
+_reloads = {"parsed": 0, "changed_projects": 0}
+
+
+def content_path(module: str) -> Path:
+    return CONTENT_DIR / f"{module}.toml"
+
+
+def has_content(module: str) -> bool:
+    return content_path(module).is_file()
+
+
+def _check_keys(table: dict, allowed: set, where: str):
+    unknown = set(table) - allowed
+    if unknown:
+        raise ContentError(f"{where}: unknown key(s) {', '.join(sorted(unknown))}")
+
+
+def _parse_asset(raw, where: str) -> Asset:
+    if not isinstance(raw, dict):
+        raise ContentError(f"{where}: expected a table, got {type(raw).__name__}")
+    _check_keys(raw, ASSET_KEYS, where)
+    kinds = [kind for kind in ASSET_KINDS if kind in raw]
+    if len(kinds) != 1:
+        raise ContentError(f"{where}: needs exactly one of {', '.join(ASSET_KINDS)}")
+    caption = raw.get("caption")
+    if caption is not None and not isinstance(caption, str):
+        raise ContentError(f"{where}: caption must be a string")
+    return Asset(kinds[0], str(raw[kinds[0]]), caption)
+
+
+def _parse_project(raw, where: str) -> Project:
+    if not isinstance(raw, dict):
+        raise ContentError(f"{where}: expected a table")
+    _check_keys(raw, PROJECT_KEYS, where)
+    if not isinstance(raw.get("id"), str) or not raw["id"]:
+        raise ContentError(f"{where}: needs a string id")
+    where = f"{where} ({raw['id']})"
+    for key in ("title", "body", "demo"):
+        if key in raw and not isinstance(raw[key], str):
+            raise ContentError(f"{where}: {key} must be a string")
+    if "demo" in raw and raw["demo"] not in DEMOS:
+        raise ContentError(f"{where}: unknown demo {raw['demo']!r}; expected one of {', '.join(DEMOS)}")
+    spacer = raw.get("spacer", 0)
+    if not isinstance(spacer, int) or isinstance(spacer, bool) or spacer < 0:
+        raise ContentError(f"{where}: spacer must be a non-negative integer")
+    assets = raw.get("assets", [])
+    if not isinstance(assets, list):
+        raise ContentError(f"{where}: assets must be an array")
+    return Project(
+        raw["id"],
+        raw.get("title"),
+        raw.get("body", "").strip(),
+        tuple(_parse_asset(asset, f"{where} asset {i + 1}") for i, asset in enumerate(assets)),
+        raw.get("demo"),
+        spacer,
+    )
+
+
+def parse(module: str, text: str, mtime_ns: int = 0) -> Section:
+    """Validate the TOML ``text`` of ``module``'s content file."""
+    where = f"{module}.toml"
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as exc:
+        raise ContentError(f"{where}: {exc}") from exc
+    _check_keys(data, SECTION_KEYS, where)
+    if not isinstance(data.get("header"), str):
+        raise ContentError(f"{where}: needs a string header")
+    layout = data.get("layout", "rows")
+    if layout not in LAYOUTS:
+        raise ContentError(f"{where}: unknown layout {layout!r}; expected one of {', '.join(LAYOUTS)}")
+    projects = tuple(_parse_project(raw, f"{where} project {i + 1}") for i, raw in enumerate(data.get("projects", [])))
+    ids = [project.id for project in projects]
+    duplicates = sorted({i for i in ids if ids.count(i) > 1})
+    if duplicates:
+        raise ContentError(f"{where}: duplicate project id(s) {', '.join(duplicates)}")
+    return Section(module, data["header"], layout, projects, mtime_ns)
+
+
+def changed_projects(old: Section, new: Section) -> list[Project]:
+    """Projects of ``old`` that ``new`` changed or dropped, plus ones it added."""
+    before = {project.id: project for project in old.projects}
+    after = {project.id: project for project in new.projects}
+    changed = [project for pid, project in before.items() if after.get(pid) != project]
+    changed += [project for pid, project in after.items() if before.get(pid) != project]
+    return changed
+
+
+def invalidate(names: set[str]):
+    """Forget what has been derived for assets ``names``, so it is resolved afresh."""
+    if not names:
+        return
+    from portfolio import prefetch
+
+    shared_cache.discard_where(lambda key: key[0] == "variant" and key[1] in names)
+    prefetch.forget(names)
+
+
+def get(module: str) -> Section:
+    """``module``'s content, re-read only if its file changed since the last call."""
+    path = content_path(module)
+    mtime_ns = path.stat().st_mtime_ns
+    section = _index.get(module)
+    if section is not None and section.mtime_ns == mtime_ns:
+        return section
+    with _lock:
+        section = _index.get(module)
+        if section is not None and section.mtime_ns == mtime_ns:
+            return section
+        try:
+            fresh = parse(module, path.read_text(encoding="utf-8"), mtime_ns)
+        except ContentError:
+            if section is None:
+                raise
+            logger.exception("keeping the previous content of %s", module)
+            # Don't re-parse the broken file on every rerun; wait for the next edit.
+            _index[module] = section._replace(mtime_ns=mtime_ns)
+            return section
+        _reloads["parsed"] += 1
+        if section is not None:
+            changed = changed_projects(section, fresh)
+            ids = {project.id for project in changed}
+            _reloads["changed_projects"] += len(ids)
+            invalidate({asset.name for project in changed for asset in project.assets})
+            logger.info("reloaded %s: %d project(s) changed", path.name, len(ids))
+        _index[module] = fresh
+        return fresh
+
+
+def asset_names(module: str) -> list[str]:
+    names = []
+    for project in get(module).projects:
+        for asset in project.assets:
+            if asset.name not in names:
+                names.append(asset.name)
+    return names
+
+
+def stats() -> dict:
+    return dict(_reloads, sections=len(_index))
+
+
+def render_asset(asset: Asset):
+    # Imported here so that a text-only section doesn't load PIL or pypdfium2.
+    if asset.kind == "image":
+        from portfolio.responsive import image
+
+        image(asset.name, caption=asset.caption, width="stretch")
+    elif asset.kind == "video":
+        from portfolio.video import video
+
+        video(asset.name, caption=asset.caption)
+    else:
+        from portfolio.pdf import pdf_preview
+
+        pdf_preview(asset.name, caption=asset.caption)
+
+
+def render_demo(project: Project):
+    module, function = DEMOS[project.demo].split(":")
+    # Its own container, so a demo's widgets (and the static export's
+    # <details> for its toggle) end with the demo, not the section.
+    with st.container():
+        getattr(importlib.import_module(module), function)()
+
+
+def _spacer(lines: int):
+    if lines:
+        st.markdown("<br>" * lines, unsafe_allow_html=True)
+
+
+def render_shared_columns(section: Section):
+    """Every project in one pair of columns: text on the left, media on the right."""
+    col1 = col2 = None
+    for project in section.projects:
+        if col1 is None:
+            if project.title:
+                st.subheader(project.title)
+            col1, col2 = st.columns([2, 1])
+        elif project.title:
+            with col1:
+                st.subheader(project.title)
+        with col1:
+            if not project.assets:
+                _spacer(project.spacer)
+            if project.body:
+                st.markdown(project.body)
+            if project.demo:
+                render_demo(project)
+        if project.assets:
+            with col2:
+                _spacer(project.spacer)
+                for asset in project.assets:
+                    render_asset(asset)
+
+
+def render_content(module: str):
+    """Render ``content/<module>.toml``: the header, then each project in order."""
+    section = get(module)
+    st.header(section.header)
+    if section.layout == "shared":
+        render_shared_columns(section)
+        return
+    for project in section.projects:
+        if project.title:
+            st.subheader(project.title)
+        if not project.assets:
+            if project.body:
+                st.markdown(project.body)
+        else:
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                if project.body:
+                    st.markdown(project.body)
+            with col2:
+                for asset in project.assets:
+                    render_asset(asset)
+        if project.demo:
+            render_demo(project)
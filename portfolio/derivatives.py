@@ -0,0 +1,176 @@
+"""Precomputed image derivatives for the Welcome page.
+
+Cropping, masking and re-encoding the banner and profile photo used to run on
+every visit. Each derivative is now produced once, keyed by the SHA-256 of its
+source file plus the transform name and parameters, and kept both in the
+process-wide memory cache (:mod:`portfolio.cache`) and on disk under
+``.cache/derivatives`` (for restarts and other worker processes). A render is
+then a dictionary lookup.
+
+Derivatives prebuilt by ``python -m portfolio.build_assets`` are taken from the
+build manifest instead, without touching the original at all.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter, ImageOps
+
+from portfolio import manifest
+from portfolio.assets import CACHE_DIR, file_sha256, resolve_asset
+from portfolio.cache import shared_cache
+from portfolio.profiling import timed
+from portfolio.static import publish_bytes
+
+DERIVATIVES_DIR = CACHE_DIR / "derivatives"
+
+FORMAT_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "AVIF": "avif"}
+FORMAT_MIME_TYPES = {"JPEG": "image/jpeg", "PNG": "image/png", "WEBP": "image/webp", "AVIF": "image/avif"}
+
+
+def circular_crop(img: Image.Image, size: int | None = None) -> Image.Image:
+    img = img.convert("RGBA")
+    side = min(img.size)
+    left = (img.width - side) // 2
+    top = (img.height - side) // 2
+    cropped = img.crop((left, top, left + side, top + side))
+
+    size = size or side
+    mask = Image.new("L", (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0, size, size), fill=255)
+
+    circular = ImageOps.fit(cropped, (size, size))
+    circular.putalpha(mask)
+    return circular
+
+
+def fit_width(img: Image.Image, max_width: int | None = None) -> Image.Image:
+    img = img.convert("RGB")
+    if max_width and img.width > max_width:
+        height = round(img.height * max_width / img.width)
+        img = img.resize((max_width, height), Image.LANCZOS)
+    return img
+
+
+def resize_width(img: Image.Image, width: int | None = None) -> Image.Image:
+    """Downscale to ``width`` keeping aspect ratio and any alpha channel."""
+    img = ImageOps.exif_transpose(img)
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    img = img.convert("RGBA" if has_alpha else "RGB")
+    if width and img.width > width:
+        height = round(img.height * width / img.width)
+        img = img.resize((width, height), Image.LANCZOS)
+    return img
+
+
+def lqip(img: Image.Image, width: int = 20, blur: float = 1.0) -> Image.Image:
+    """Tiny, softened thumbnail to stand in for the image while it loads."""
+    img = ImageOps.exif_transpose(img).convert("RGB")
+    height = max(1, round(img.height * width / img.width))
+    img = img.resize((width, height), Image.BOX)
+    return img.filter(ImageFilter.GaussianBlur(blur)) if blur else img
+
+
+TRANSFORMS = {
+    "circular": circular_crop,
+    "fit_width": fit_width,
+    "resize_width": resize_width,
+    "lqip": lqip,
+}
+
+_source_hashes: dict[tuple, str] = {}
+
+
+def source_hash(path: Path) -> str:
+    """SHA-256 of ``path``, memoized on its size and modification time."""
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    digest = _source_hashes.get(key)
+    if digest is None:
+        digest = _source_hashes[key] = file_sha256(path)
+    return digest
+
+
+def derivative_key(source_sha256: str, transform: str, params: dict, format: str, quality: int | None) -> str:
+    spec = json.dumps([source_sha256, transform, params, format, quality], sort_keys=True)
+    return hashlib.sha256(spec.encode()).hexdigest()
+
+
+def encode(img: Image.Image, format: str, quality: int | None) -> bytes:
+    buffered = BytesIO()
+    options = {"optimize": True}
+    if quality is not None:
+        options["quality"] = quality
+    if format == "JPEG":
+        options["progressive"] = True
+    img.save(buffered, format=format, **options)
+    return buffered.getvalue()
+
+
+def cached_bytes(key: str, extension: str, produce) -> bytes:
+    """Return the bytes stored under ``key``, calling ``produce()`` only on a miss.
+
+    Results live in the shared memory cache and in ``DERIVATIVES_DIR``;
+    concurrent callers asking for the same key wait for a single ``produce()``.
+    """
+    def load():
+        path = DERIVATIVES_DIR / f"{key}.{extension}"
+        try:
+            return path.read_bytes()
+        except OSError:
+            data = produce()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            return data
+
+    return shared_cache.get_or_load(("derivative", key), load)
+
+
+def _derivative(name: str, transform: str, format: str, quality: int | None, params: dict) -> tuple[str, bytes]:
+    source = resolve_asset(name)
+    key = derivative_key(source_hash(source), transform, params, format, quality)
+
+    def produce():
+        with Image.open(source) as img:
+            return encode(TRANSFORMS[transform](img, **params), format, quality)
+
+    with timed("derivative", f"{name}:{transform}"):
+        return key, cached_bytes(key, FORMAT_EXTENSIONS[format], produce)
+
+
+def get_derivative(name: str, transform: str, format: str = "PNG", quality: int | None = None, **params) -> bytes:
+    """Return the encoded bytes of ``TRANSFORMS[transform]`` applied to asset ``name``."""
+    return _derivative(name, transform, format, quality, params)[1]
+
+
+def get_derivative_base64(name: str, transform: str, format: str = "PNG", quality: int | None = None, **params) -> str:
+    key, data = _derivative(name, transform, format, quality, params)
+
+    def load():
+        with timed("base64", name):
+            return base64.b64encode(data).decode()
+
+    return shared_cache.get_or_load(("base64", key), load)
+
+
+def get_derivative_info(name: str, transform: str, format: str = "PNG", quality: int | None = None,
+                        **params) -> tuple[str, int]:
+    """URL and size of the derivative, prebuilt or published on first use."""
+    built = manifest.derivative(manifest.derivative_spec(name, transform, params, format, quality))
+    if built is not None:
+        return built["url"], built["bytes"]
+    manifest.check_unbuilt(f"{name} ({transform} {params})")
+    key, data = _derivative(name, transform, format, quality, params)
+    return publish_bytes(data, FORMAT_EXTENSIONS[format], stem=Path(name).stem, cache_key=key), len(data)
+
+
+def get_derivative_url(name: str, transform: str, format: str = "PNG", quality: int | None = None, **params) -> str:
+    """Fingerprinted static URL of the derivative."""
+    return get_derivative_info(name, transform, format, quality, **params)[0]
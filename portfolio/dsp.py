@@ -0,0 +1,485 @@
+"""Spectrogram and FIR filter playground for Signal & Communication Systems.
+
+Everything runs on a stream of fixed-size chunks, so a long recording is never
+held as one signal array:
+
+* sources are generators of float chunks: the Class AB amplifier output from
+  the MATLAB project (a 1 kHz tone with a little crossover distortion, a weak
+  chirp interferer and noise), synthesized chunk by chunk, or an uploaded PCM
+  WAV file read ``CHUNK_SAMPLES`` frames at a time with the ``wave`` module,
+* ``design()`` builds a linear-phase FIR filter: windowed sinc, evaluated for
+  every tap and band edge in one broadcast ``np.sinc`` expression, or
+  Parks-McClellan when SciPy is installed,
+* ``overlap_add()`` filters the stream by FFT convolution: each chunk is cut
+  into blocks that are transformed, multiplied by the filter's spectrum and
+  transformed back in one batched ``rfft``/``irfft`` call, and the filter's
+  tail is carried into the next chunk,
+* ``stft()`` turns the stream into power spectra, framing each chunk (plus
+  the few samples left over from the previous one) with a strided view,
+* ``accumulate()`` max-pools those frames straight into a
+  ``SPECTROGRAM_COLUMNS`` × ``SPECTROGRAM_ROWS`` grid, about the size the
+  image is shown at, so the spectrogram costs the same memory for a two
+  second clip as for an hour.
+
+The input and the filtered output travel through the STFT as one ``(2, n)``
+batch. Results are cached per source and settings in the shared memory cache.
+
+``python -m benchmarks.dsp`` measures throughput in samples per second.
+"""
+
+import time
+import wave
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+from numpy.lib.stride_tricks import sliding_window_view
+
+from portfolio.cache import shared_cache
+from portfolio.charts import STREAM_INTERVAL, chart_frame, downsample
+from portfolio.profiling import record_element, timed
+
+try:
+    from scipy.signal import remez
+except ImportError:
+    remez = None
+
+SAMPLE_RATE = 16_000  # Hz, synthetic signal
+CHUNK_SAMPLES = 1 << 16
+DURATION_OPTIONS = (2, 10, 30, 60, 300)  # s, synthetic signal
+# Tap counts are odd, so every band type has a linear-phase (type I) design.
+TAP_OPTIONS = (31, 63, 127, 255, 511, 1023)
+SEGMENT_OPTIONS = (256, 512, 1024, 2048)
+OVERLAP_OPTIONS = (0.0, 0.5, 0.75, 0.875)
+WINDOWS = {
+    "Hamming": np.hamming,
+    "Hann": np.hanning,
+    "Blackman": np.blackman,
+    "Kaiser (β = 8.6)": lambda n: np.kaiser(n, 8.6),
+}
+BANDS = ("lowpass", "highpass", "bandpass", "bandstop")
+METHODS = ("Windowed sinc",) + (("Parks-McClellan",) if remez is not None else ())
+# Spectrogram settings used by the filter demo.
+FILTER_SEGMENT = 1024
+FILTER_OVERLAP = 0.75
+SPECTROGRAM_COLUMNS = 600
+SPECTROGRAM_ROWS = 200
+DYNAMIC_RANGE_DB = 90.0
+RESPONSE_POINTS = 4_096
+EXCERPT_SECONDS = 0.01
+# Viridis, sampled at five points.
+COLORMAP = np.array([(68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)], dtype=float)
+
+FilterSpec = namedtuple("FilterSpec", "method band low_hz high_hz taps window transition_hz")
+AnalysisParams = namedtuple("AnalysisParams", "source segment overlap window filter")
+Source = namedtuple("Source", "key label sample_rate samples chunks")
+Analysis = namedtuple("Analysis", "images excerpt response taps sample_rate samples elapsed_s")
+
+
+def class_ab_chunks(seconds: float, sample_rate: int = SAMPLE_RATE, chunk: int = CHUNK_SAMPLES, seed: int = 0):
+    """The amplifier project's output, generated ``chunk`` samples at a time.
+
+    A 1 kHz tone through a push-pull stage whose small residual dead zone
+    (what's left of crossover distortion once the stage is biased into class
+    AB) adds odd harmonics, plus a weak chirp sweeping the whole band and
+    white noise.
+    """
+    total = int(seconds * sample_rate)
+    sweep = (sample_rate / 2 - 100.0) / max(seconds, 1e-9)  # Hz/s
+    for start in range(0, total, chunk):
+        t = np.arange(start, min(start + chunk, total)) / sample_rate
+        drive = 0.8 * np.sin(2 * np.pi * 1_000.0 * t)
+        output = np.sign(drive) * np.maximum(np.abs(drive) - 0.05, 0.0)
+        interferer = 0.05 * np.sin(2 * np.pi * (100.0 * t + sweep / 2 * t * t))
+        noise = 0.02 * np.random.default_rng((seed, start)).standard_normal(len(t))
+        yield output + interferer + noise
+
+
+def wav_info(file) -> tuple[int, int]:
+    """Sample rate and frame count of a PCM WAV file object."""
+    file.seek(0)
+    with wave.open(file, "rb") as w:
+        return w.getframerate(), w.getnframes()
+
+
+def pcm_to_float(data: bytes, width: int, channels: int) -> np.ndarray:
+    """Interleaved PCM frames as mono floats in [-1, 1)."""
+    if width == 1:
+        samples = np.frombuffer(data, np.uint8).astype(np.float32) - 128.0
+    elif width == 3:
+        # Little-endian 24-bit: widen to 32 bits, the arithmetic shift keeps the sign.
+        padded = np.zeros((len(data) // 3, 4), np.uint8)
+        padded[:, 1:] = np.frombuffer(data, np.uint8).reshape(-1, 3)
+        samples = (padded.view("<i4").ravel() >> 8).astype(np.float32)
+    else:
+        samples = np.frombuffer(data, f"<i{width}").astype(np.float32)
+    samples /= float(1 << (8 * width - 1))
+    return samples.reshape(-1, channels).mean(axis=1)
+
+
+def wav_chunks(file, chunk: int = CHUNK_SAMPLES):
+    """Mono float chunks of a PCM WAV file object, ``chunk`` frames at a time."""
+    file.seek(0)
+    with wave.open(file, "rb") as w:
+        width, channels = w.getsampwidth(), w.getnchannels()
+        while data := w.readframes(chunk):
+            yield pcm_to_float(data, width, channels)
+
+
+def lowpass_sum(taps: int, edges, weights) -> np.ndarray:
+    """``Σ weights[k] · ideal lowpass(edges[k])`` over ``taps`` centred samples.
+
+    ``edges`` are fractions of the Nyquist frequency; an edge of 1 is the
+    all-pass (a unit impulse), so every band type is a signed sum of lowpasses.
+    """
+    n = np.arange(taps) - (taps - 1) / 2
+    edges = np.asarray(edges, dtype=float)[:, None]
+    return np.asarray(weights, dtype=float) @ (edges * np.sinc(edges * n))
+
+
+def band_layout(band: str, low: float, high: float) -> tuple[list, list, float]:
+    """Lowpass edges and signs for ``band``, and the frequency normalized to unit gain."""
+    if band == "lowpass":
+        return [low], [1], 0.0
+    if band == "highpass":
+        return [1.0, low], [1, -1], 1.0
+    if band == "bandpass":
+        return [high, low], [1, -1], (low + high) / 2
+    return [1.0, high, low], [1, -1, 1], 0.0
+
+
+def gain_at(h: np.ndarray, frequency: float) -> float:
+    """Magnitude of ``h``'s response at ``frequency`` (a fraction of Nyquist)."""
+    return float(np.abs(h @ np.exp(-1j * np.pi * frequency * np.arange(len(h)))))
+
+
+def windowed_sinc(taps: int, band: str, low: float, high: float, window) -> np.ndarray:
+    edges, signs, unity = band_layout(band, low, high)
+    h = lowpass_sum(taps, edges, signs) * window(taps)
+    return h / gain_at(h, unity)
+
+
+def parks_mcclellan(taps: int, band: str, low: float, high: float, transition: float) -> np.ndarray:
+    cutoffs = [low] if band in ("lowpass", "highpass") else [low, high]
+    edges = [0.0]
+    for cutoff in cutoffs:
+        edges += [max(cutoff - transition / 2, 1e-3), min(cutoff + transition / 2, 1 - 1e-3)]
+    edges.append(1.0)
+    first = 1.0 if band in ("lowpass", "bandstop") else 0.0
+    desired = [first if i % 2 == 0 else 1.0 - first for i in range(len(edges) // 2)]
+    return remez(taps, edges, desired, fs=2.0)
+
+
+def design(spec: FilterSpec, sample_rate: int) -> np.ndarray:
+    """Impulse response of the filter ``spec`` describes, at ``sample_rate``."""
+    nyquist = sample_rate / 2
+    low, high = spec.low_hz / nyquist, spec.high_hz / nyquist
+    if spec.method == "Parks-McClellan":
+        return parks_mcclellan(spec.taps, spec.band, low, high, spec.transition_hz / nyquist)
+    return windowed_sinc(spec.taps, spec.band, low, high, WINDOWS[spec.window])
+
+
+def frequency_response(h: np.ndarray, sample_rate: int, points: int = RESPONSE_POINTS):
+    """Frequencies (Hz) and gain (dB, floored at -150) from 0 to Nyquist."""
+    response = np.fft.rfft(h, 2 * points)
+    freqs = np.fft.rfftfreq(2 * points, 1 / sample_rate)
+    return freqs, 20 * np.log10(np.maximum(np.abs(response), 10 ** (-150 / 20)))
+
+
+def fft_size(taps: int) -> int:
+    """Overlap-add FFT length: a power of two about eight times the filter, at least 256."""
+    return max(256, 1 << int(np.ceil(np.log2(8 * taps))))
+
+
+def overlap_add(chunks, h: np.ndarray, nfft: int | None = None):
+    """Filter a stream of chunks with ``h`` by FFT convolution.
+
+    Yields one output chunk per input chunk, of the same length: together
+    they are ``np.convolve(signal, h)[:len(signal)]``.
+    """
+    taps = len(h)
+    nfft = nfft or fft_size(taps)
+    block = nfft - taps + 1  # > taps - 1, so only neighbouring blocks overlap
+    spectrum = np.fft.rfft(h, nfft)
+    tail = np.zeros(taps - 1)
+    for chunk in chunks:
+        n = len(chunk)
+        blocks = -(-n // block)
+        padded = np.zeros(blocks * block)
+        padded[:n] = chunk
+        segments = np.fft.irfft(np.fft.rfft(padded.reshape(blocks, block), nfft) * spectrum, nfft)
+        out = np.zeros((blocks + 1) * block)
+        out[:blocks * block] = segments[:, :block].ravel()
+        out[block:].reshape(blocks, block)[:, :taps - 1] += segments[:, block:block + taps - 1]
+        out[:taps - 1] += tail
+        tail = out[n:n + taps - 1].copy()
+        yield out[:n]
+
+
+def fft_filter(signal: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """``np.convolve(signal, h)[:len(signal)]`` by overlap-add."""
+    return next(overlap_add([signal], h))
+
+
+def with_filtered(chunks, h: np.ndarray):
+    """Yield each chunk stacked with the filter's output for it, shape ``(2, n)``."""
+    pending = []
+
+    def inputs():
+        for chunk in chunks:
+            pending.append(chunk)
+            yield chunk
+
+    for filtered in overlap_add(inputs(), h):
+        yield np.stack([pending.pop(), filtered])
+
+
+def stft(chunks, segment: int, hop: int, window: np.ndarray):
+    """Power spectra of a stream of ``(..., n)`` chunks, one array of frames per chunk.
+
+    Frames start every ``hop`` samples; the samples after the last complete
+    frame of a chunk are kept and prepended to the next one, so memory stays at
+    one chunk (times the overlap) whatever the stream's length. Each yielded
+    array has shape ``(..., frames, segment // 2 + 1)``; a chunk that doesn't
+    complete a frame yields nothing.
+    """
+    scale = 1.0 / np.sum(window) ** 2
+    buffer = None
+    for chunk in chunks:
+        buffer = chunk if buffer is None else np.concatenate([buffer, chunk], axis=-1)
+        if buffer.shape[-1] < segment:
+            continue
+        frames = sliding_window_view(buffer, segment, axis=-1)[..., ::hop, :]
+        spectrum = np.fft.rfft(frames * window, axis=-1)
+        yield scale * (spectrum.real ** 2 + spectrum.imag ** 2)
+        buffer = buffer[..., frames.shape[-2] * hop:]
+
+
+def frame_count(samples: int, segment: int, hop: int) -> int:
+    return max(0, (samples - segment) // hop + 1)
+
+
+def row_edges(bins: int, rows: int = SPECTROGRAM_ROWS) -> np.ndarray:
+    """First frequency bin of each display row."""
+    return np.unique(np.linspace(0, bins, min(rows, bins) + 1)[:-1].astype(int))
+
+
+def accumulate(grid: np.ndarray, power: np.ndarray, first: int, total_frames: int, edges: np.ndarray) -> int:
+    """Max-pool STFT frames ``first, first + 1, …`` into ``grid``, shape ``(..., columns, rows)``.
+
+    Maximum rather than mean, so a click shorter than one column still shows.
+    Returns the index of the next frame.
+    """
+    frames = power.shape[-2]
+    columns = grid.shape[-2]
+    column = np.minimum(np.arange(first, first + frames) * columns // total_frames, columns - 1)
+    starts = np.flatnonzero(np.diff(column, prepend=-1))
+    pooled = np.maximum.reduceat(np.maximum.reduceat(power, starts, axis=-2), edges, axis=-1)
+    grid[..., column[starts], :] = np.maximum(grid[..., column[starts], :], pooled)
+    return first + frames
+
+
+def to_image(grid: np.ndarray, reference: float) -> np.ndarray:
+    """A ``(columns, rows)`` power grid as an RGB image, low frequencies at the bottom."""
+    db = 10 * np.log10(np.maximum(grid, reference * 10 ** (-DYNAMIC_RANGE_DB / 10)) / reference)
+    level = (db.T[::-1] + DYNAMIC_RANGE_DB) / DYNAMIC_RANGE_DB * (len(COLORMAP) - 1)
+    anchors = np.arange(len(COLORMAP))
+    rgb = np.stack([np.interp(level, anchors, COLORMAP[:, c]) for c in range(3)], axis=-1)
+    return rgb.round().astype(np.uint8)
+
+
+def analysis_size(result: Analysis) -> int:
+    return sum(image.nbytes for image in result.images) + result.excerpt.nbytes + sum(
+        v.nbytes for v in result.response)
+
+
+def analyse(params: AnalysisParams, source: Source, on_progress=None) -> Analysis:
+    """Stream ``source`` through the filter (if any) and the STFT in one pass."""
+    start = time.perf_counter()
+    hop = max(1, round(params.segment * (1 - params.overlap)))
+    total_frames = frame_count(source.samples, params.segment, hop)
+    edges = row_edges(params.segment // 2 + 1)
+    grid = np.zeros((1 if params.filter is None else 2, min(SPECTROGRAM_COLUMNS, total_frames), len(edges)))
+
+    if params.filter is None:
+        h = np.ones(1)
+        stream = (chunk[None] for chunk in source.chunks())
+    else:
+        h = design(params.filter, source.sample_rate)
+        stream = with_filtered(source.chunks(), h)
+
+    # A short stretch after the filter has settled; the output is advanced by
+    # the linear-phase group delay so the two line up.
+    delay = (len(h) - 1) // 2
+    skip, length = len(h), max(1, round(EXCERPT_SECONDS * source.sample_rate))
+    excerpt = None
+
+    def chunks():
+        nonlocal excerpt
+        done = 0
+        for chunk in stream:
+            if excerpt is None and chunk.shape[-1] >= skip + delay + length:
+                excerpt = np.stack([chunk[0, skip:skip + length], chunk[-1, skip + delay:skip + delay + length]])
+            done += chunk.shape[-1]
+            if on_progress is not None:
+                on_progress(done / max(source.samples, 1))
+            yield chunk
+
+    frame = 0
+    for power in stft(chunks(), params.segment, hop, WINDOWS[params.window](params.segment)):
+        frame = accumulate(grid, power, frame, total_frames, edges)
+
+    reference = grid.max() if grid.size and grid.max() > 0 else 1.0
+    response = tuple(downsample(v) for v in frequency_response(h, source.sample_rate))
+    return Analysis([to_image(g, reference) for g in grid], np.zeros((0, 0)) if excerpt is None else excerpt,
+                    response, h, source.sample_rate, source.samples, time.perf_counter() - start)
+
+
+def run(params: AnalysisParams, source: Source, on_progress=None) -> Analysis:
+    """``analyse()``, or its cached result for the same source and settings."""
+    key = ("dsp", params)
+    cached = shared_cache.get(key)
+    if cached is not None:
+        return cached
+    with timed("dsp", "spectrogram" if params.filter is None else "filter"):
+        result = analyse(params, source, on_progress)
+    shared_cache.put(key, result, analysis_size(result))
+    return result
+
+
+def _source(prefix: str) -> Source | None:
+    kind = st.radio("Signal", ("synthetic", "upload"), horizontal=True, key=f"{prefix}-source",
+                    format_func={"synthetic": "Class AB amplifier output", "upload": "Upload a WAV file"}.get)
+    if kind == "synthetic":
+        seconds = st.select_slider("Duration (s)", DURATION_OPTIONS, value=10, key=f"{prefix}-seconds")
+        return Source(("synthetic", seconds, SAMPLE_RATE), "the simulated amplifier output", SAMPLE_RATE,
+                      int(seconds * SAMPLE_RATE), lambda: class_ab_chunks(seconds))
+
+    upload = st.file_uploader("Uncompressed PCM WAV file", type=["wav"], key=f"{prefix}-upload")
+    if upload is None:
+        return None
+    try:
+        sample_rate, samples = wav_info(upload)
+    except (wave.Error, EOFError) as exc:
+        st.error(f"Couldn't read {upload.name} as a PCM WAV file: {exc}")
+        return None
+    return Source(("wav", upload.file_id, upload.size), upload.name, sample_rate, samples,
+                  lambda: wav_chunks(upload))
+
+
+def _run_with_progress(params: AnalysisParams, source: Source) -> Analysis:
+    progress = st.empty()
+    last_draw = time.perf_counter()
+
+    def on_progress(fraction):
+        nonlocal last_draw
+        if time.perf_counter() - last_draw < STREAM_INTERVAL:
+            return
+        progress.progress(min(fraction, 1.0), text=f"Processing {source.label}…")
+        last_draw = time.perf_counter()
+
+    result = run(params, source, on_progress)
+    progress.empty()
+    return result
+
+
+def _throughput(result: Analysis, what: str) -> str:
+    seconds = result.samples / result.sample_rate
+    return (f"{what} {result.samples:,} samples ({seconds:.1f} s at {result.sample_rate:,} Hz) in "
+            f"{result.elapsed_s * 1000:.0f} ms, {result.samples / max(result.elapsed_s, 1e-9) / 1e6:.1f} M samples/s, "
+            f"in chunks of {CHUNK_SAMPLES:,} (cached for these settings).")
+
+
+def _axes(result: Analysis) -> str:
+    return (f"Time 0–{result.samples / result.sample_rate:.1f} s left to right, "
+            f"frequency 0–{result.sample_rate / 2:,.0f} Hz bottom to top, {DYNAMIC_RANGE_DB:.0f} dB range.")
+
+
+def spectrogram_demo():
+    """Streaming spectrogram of the simulated amplifier output or an uploaded recording."""
+    if not st.toggle("Run the spectrogram here", key="stft-demo"):
+        return
+    source = _source("stft")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        segment = st.select_slider("Segment length", SEGMENT_OPTIONS, value=1024, key="stft-segment")
+    with col2:
+        overlap = st.select_slider("Overlap", OVERLAP_OPTIONS, value=0.75, key="stft-overlap",
+                                   format_func=lambda v: f"{v:.0%}")
+    with col3:
+        window = st.selectbox("Window", list(WINDOWS), index=1, key="stft-window")
+    if source is None:
+        return
+    if source.samples < segment:
+        st.warning("The recording is shorter than one segment.")
+        return
+
+    result = _run_with_progress(AnalysisParams(source.key, segment, overlap, window, None), source)
+    st.image(result.images[0], caption=_axes(result), width="stretch", output_format="PNG")
+    record_element("dsp", "spectrogram", analysis_size(result))
+    st.caption(_throughput(result, "Short-time Fourier transform of"))
+
+
+def _filter_controls(nyquist: float) -> FilterSpec:
+    col1, col2 = st.columns(2)
+    with col1:
+        method = st.selectbox("Design method", METHODS, key="fir-method")
+        band = st.radio("Response", BANDS, index=2, horizontal=True, format_func=str.capitalize, key="fir-band")
+        taps = st.select_slider("Taps", TAP_OPTIONS, value=255, key="fir-taps")
+    with col2:
+        top = int(nyquist) - 1
+        # Keyed by Nyquist frequency, so switching sources resets rather than clamps the edges.
+        if band in ("lowpass", "highpass"):
+            low = high = st.slider("Cut-off (Hz)", 1, top, min(1_000, top // 2), key=f"fir-cutoff-{top}")
+        else:
+            low, high = st.slider("Band edges (Hz)", 1, top, (min(800, top // 3), min(1_200, 2 * top // 3)),
+                                  key=f"fir-edges-{top}")
+            high = max(high, low + 1)
+        if method == "Parks-McClellan":
+            window = None
+            transition = st.slider("Transition width (Hz)", 10, max(11, top // 4), min(200, top // 8),
+                                   key=f"fir-transition-{top}")
+        else:
+            window = st.selectbox("Window", list(WINDOWS), key="fir-window")
+            transition = None
+    return FilterSpec(method, band, float(low), float(high), taps, window, transition)
+
+
+def filter_demo():
+    """Design an FIR filter and see what it does to the amplifier output or a recording."""
+    if not st.toggle("Run the filter designer here", key="fir-demo"):
+        return
+    source = _source("fir")
+    if source is None:
+        return
+    if source.samples < FILTER_SEGMENT:
+        st.warning("The recording is shorter than one spectrogram segment.")
+        return
+    spec = _filter_controls(source.sample_rate / 2)
+    try:
+        result = _run_with_progress(
+            AnalysisParams(source.key, FILTER_SEGMENT, FILTER_OVERLAP, "Hann", spec), source)
+    except ValueError as exc:
+        # remez rejects band edges it can't meet.
+        st.error(f"Couldn't design this filter: {exc}")
+        return
+
+    freqs, gain = result.response
+    response_tab, waveform_tab, spectrogram_tab = st.tabs(["Frequency response", "Waveform", "Spectrograms"])
+    with response_tab:
+        st.line_chart(chart_frame(freqs, {"Gain": gain.clip(-120, None)}, "f (Hz)"), x_label="f (Hz)", y_label="dB")
+    with waveform_tab:
+        if result.excerpt.size:
+            t_ms = np.arange(result.excerpt.shape[-1]) / result.sample_rate * 1000
+            excerpt = downsample(result.excerpt)
+            st.line_chart(chart_frame(downsample(t_ms), {"Input": excerpt[0], "Filtered": excerpt[1]}, "t (ms)"),
+                          x_label="t (ms)", y_label="Amplitude")
+            st.caption(f"The output is shown advanced by the filter's group delay, "
+                       f"{(spec.taps - 1) // 2} samples.")
+    with spectrogram_tab:
+        col1, col2 = st.columns(2)
+        col1.image(result.images[0], caption="Input", width="stretch", output_format="PNG")
+        col2.image(result.images[1], caption="Filtered", width="stretch", output_format="PNG")
+        st.caption(_axes(result))
+    record_element("dsp", "filter", analysis_size(result))
+    st.caption(_throughput(result, f"{spec.taps}-tap {spec.method.lower()} {spec.band} filter and spectrograms of"))
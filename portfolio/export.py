@@ -0,0 +1,249 @@
+"""Static site export of every section.
+
+    python -m portfolio.export [--output dist] [--clean] [--no-build]
+
+Read-only visitors don't need a live Streamlit session. This runs ``app.py``
+headless with ``AppTest``, once per sidebar section, and translates the
+resulting element tree into plain HTML: markdown and headings, column layouts,
+captions, alerts and the images, videos and PDF previews (which the app
+already renders as ``<img>``/``<video>``/``<a>`` pointing at ``app/static/``).
+Every static file a page references is copied into the bundle under its
+content-fingerprinted name, and the stylesheet is fingerprinted too, so the
+whole directory can sit behind a CDN with long-lived caching. Only the HTML
+pages need short cache lifetimes.
+
+A toggle becomes a collapsed ``<details>`` holding whatever follows it in its
+container; the export switches toggles on so that content is present. The
+interactive demos (``content.DEMOS``) are the exception: their toggles stay off,
+so none of them runs, and each is replaced by a short note pointing at the live
+app. Elements with no static equivalent are left out with a warning.
+
+The asset build (``portfolio.build_assets``) runs first unless ``--no-build``
+is given, so the bundle carries the optimized files. Markdown rendering needs
+``markdown-it-py``.
+"""
+
+import argparse
+import html
+import os
+import re
+import shutil
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+from portfolio.assets import REPO_ROOT
+from portfolio.content import DEMO_TOGGLE_SUFFIX
+from portfolio.sections import SECTIONS
+from portfolio.static import STATIC_DIR, fingerprinted_name
+
+DEFAULT_OUTPUT = REPO_ROOT / "dist"
+PAGE_TITLE = "Shinn Gee Choo | Portfolio"
+STATIC_URL = re.compile(r"""(?<=["'(])/?app/static/([^"')\s]+)""")
+
+STYLESHEET = """\
+*, *::before, *::after { box-sizing: border-box; }
+body { margin: 0; font-family: "Source Sans Pro", system-ui, -apple-system, "Segoe UI", sans-serif;
+       line-height: 1.6; color: #31333f; background: #fff; }
+a { color: #0068c9; }
+.layout { display: flex; min-height: 100vh; }
+nav { flex: 0 0 16rem; padding: 2rem 1rem; background: #f0f2f6; }
+nav h1 { font-size: 1.25rem; margin: 0 0 1rem; }
+nav ul { list-style: none; margin: 0; padding: 0; }
+nav li a { display: block; padding: 0.35rem 0.5rem; border-radius: 0.4rem; color: inherit; text-decoration: none; }
+nav li a[aria-current="page"], nav li a:hover { background: #e0e3ea; }
+main { flex: 1; min-width: 0; max-width: 90rem; padding: 2rem 3rem; }
+.row { display: flex; gap: 1rem; }
+.row > .column { min-width: 0; }
+.demo-note { font-style: italic; color: rgba(49, 51, 63, 0.6); }
+.caption { font-size: 0.875rem; color: rgba(49, 51, 63, 0.6); margin: 0.25rem 0 1rem; }
+.alert { padding: 0.75rem 1rem; border-radius: 0.5rem; margin: 0.5rem 0; }
+.alert-warning { background: #fffce7; color: #926c05; }
+.alert-error { background: #ffecec; color: #7d353b; }
+.alert-info { background: #e8f2fc; color: #004280; }
+.alert-success { background: #e8f9ee; color: #177233; }
+details summary { cursor: pointer; margin: 0.5rem 0; }
+img, video { max-width: 100%; }
+@media (max-width: 640px) {
+  .layout, .row { flex-direction: column; }
+  nav { flex-basis: auto; }
+  main { padding: 1rem; }
+}
+"""
+
+PAGE_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body>
+<div class="layout">
+<nav>
+<h1>Portfolio Navigation</h1>
+<ul>
+{nav}
+</ul>
+</nav>
+<main>
+{body}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def page_filename(section: str) -> str:
+    return "index.html" if section == next(iter(SECTIONS)) else f"{SECTIONS[section]}.html"
+
+
+class Renderer:
+    """Turns an ``AppTest`` element tree into HTML, collecting static files."""
+
+    def __init__(self):
+        try:
+            from markdown_it import MarkdownIt
+        except ImportError as exc:
+            raise SystemExit("the static export needs markdown-it-py: pip install markdown-it-py") from exc
+        self._markdown = MarkdownIt("commonmark", {"html": True, "breaks": False}).enable(["table", "strikethrough"])
+        self._markdown_safe = MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+        self.static_files: set[str] = set()
+        self.skipped: set[str] = set()
+
+    def markdown(self, body: str, allow_html: bool = False) -> str:
+        return (self._markdown if allow_html else self._markdown_safe).render(body)
+
+    def block(self, node) -> str:
+        children = list(node.children.values()) if isinstance(node.children, dict) else list(node.children)
+        parts = []
+        for index, child in enumerate(children):
+            if getattr(child, "type", None) == "toggle" and not child.value:
+                parts.append(f'<p class="demo-note">{html.escape(child.proto.label)}: '
+                             "interactive, available in the live app.</p>")
+                break
+            if getattr(child, "type", None) == "toggle":
+                rest = "".join(self.node(c) for c in children[index + 1:])
+                parts.append(f"<details><summary>{html.escape(child.proto.label)}</summary>{rest}</details>")
+                break
+            parts.append(self.node(child))
+        return "".join(parts)
+
+    def node(self, node) -> str:
+        kind = getattr(node, "type", None)
+        proto = getattr(node, "proto", None)
+        if kind == "flex_container" and proto.flex_container.direction == proto.flex_container.HORIZONTAL:
+            return f'<div class="row">{self.block(node)}</div>'
+        if kind == "column":
+            return f'<div class="column" style="flex: {proto.weight:.4f} 1 0;">{self.block(node)}</div>'
+        if isinstance(node, Block):
+            return f"<div>{self.block(node)}</div>"
+        if kind in ("markdown", "divider"):
+            return self.markdown(proto.body, proto.allow_html)
+        if kind == "caption":
+            return f'<div class="caption">{self.markdown(proto.body, proto.allow_html)}</div>'
+        if kind in ("title", "header", "subheader"):
+            tag = proto.tag or "h2"
+            return f"<{tag}>{self._markdown_safe.renderInline(proto.body)}</{tag}>"
+        if kind in ("warning", "error", "info", "success"):
+            return f'<div class="alert alert-{kind}">{self.markdown(proto.body)}</div>'
+        if kind == "image":
+            return "".join(
+                f'<figure><img src="{img.url}" alt="{html.escape(img.caption)}" loading="lazy">'
+                + (f'<figcaption class="caption">{html.escape(img.caption)}</figcaption>' if img.caption else "")
+                + "</figure>"
+                for img in proto.imgs
+            )
+        self.skipped.add(str(kind))
+        return ""
+
+    def page(self, app) -> str:
+        body = self.block(app._tree.children[0])
+        return STATIC_URL.sub(self._rewrite_url, body)
+
+    def _rewrite_url(self, match) -> str:
+        self.static_files.add(match.group(1))
+        return f"static/{match.group(1)}"
+
+
+def render_section(section: str, renderer: Renderer) -> str:
+    app = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=600)
+    app.run()
+    app.sidebar.radio[0].set_value(section).run()
+    # Switch on every toggle but the demos' (each may reveal more), so the export has their content.
+    seen = set()
+    while True:
+        pending = [t for t in app.toggle
+                   if t.key not in seen and not t.value and not t.key.endswith(DEMO_TOGGLE_SUFFIX)]
+        if not pending:
+            break
+        for toggle in pending:
+            seen.add(toggle.key)
+            toggle.set_value(True)
+        app.run()
+    if app.exception:
+        raise RuntimeError(f"{section}: {app.exception[0].value}")
+    return renderer.page(app)
+
+
+def export(output: Path = DEFAULT_OUTPUT, clean: bool = False, build: bool = True) -> list[Path]:
+    output = Path(output)
+    if build:
+        from portfolio import build_assets
+
+        build_assets.build()
+    if clean and output.exists():
+        shutil.rmtree(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    stylesheet = fingerprinted_name(STYLESHEET.encode(), "css", "style")
+    (output / stylesheet).write_text(STYLESHEET, encoding="utf-8")
+
+    renderer = Renderer()
+    pages = []
+    for section in SECTIONS:
+        body = render_section(section, renderer)
+        nav = "\n".join(
+            f'<li><a href="{page_filename(s)}"' + (' aria-current="page"' if s == section else "")
+            + f">{html.escape(s)}</a></li>"
+            for s in SECTIONS
+        )
+        page = output / page_filename(section)
+        page.write_text(PAGE_TEMPLATE.format(title=html.escape(f"{section} | {PAGE_TITLE}"), stylesheet=stylesheet,
+                                             nav=nav, body=body), encoding="utf-8")
+        pages.append(page)
+        print(f"{section}: {page.name} ({page.stat().st_size} bytes)")
+
+    for name in sorted(renderer.static_files):
+        source, target = STATIC_DIR / name, output / "static" / name
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+    if renderer.skipped:
+        print(f"warning: left out elements with no static equivalent: {', '.join(sorted(renderer.skipped))}")
+    return pages
+
+
+def bundle_bytes(output: Path) -> int:
+    return sum(f.stat().st_size for f in Path(output).rglob("*") if f.is_file())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="bundle directory (default: dist)")
+    parser.add_argument("--clean", action="store_true", help="empty the output directory first")
+    parser.add_argument("--no-build", action="store_true", help="use static/ as it is instead of running the asset build")
+    args = parser.parse_args(argv)
+
+    # Every asset is bundled; the export should never wait on the network.
+    os.environ.setdefault("PORTFOLIO_OFFLINE", "1")
+    pages = export(Path(args.output), clean=args.clean, build=not args.no_build)
+    print(f"{len(pages)} pages, {bundle_bytes(Path(args.output))} bytes in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
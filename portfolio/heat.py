@@ -0,0 +1,289 @@
+"""1D heat equation solver behind the Computational Simulation demo.
+
+Solves ∂T/∂t = α ∂²T/∂x² on a rod with the two schemes the MATLAB project
+compared, both vectorized over the grid with NumPy:
+
+* explicit (forward Euler): one array expression per step; unstable once
+  ``r = α·Δt/Δx²`` exceeds 1/2, which the demo is meant to show,
+* implicit (backward Euler): one tridiagonal solve per step; stable for any
+  ``r``. ``scipy.linalg.solve_banded`` is used when SciPy is installed,
+  otherwise the system is factored once by cyclic reduction and each step is
+  ``2·log2(n)`` vectorized passes. That is a few times slower than SciPy, so
+  without it the demo caps the implicit grid at ``IMPLICIT_MAX_POINTS``.
+
+Ends are either held at fixed temperatures (Dirichlet) or insulated (Neumann);
+the rod starts at a linear profile between the end temperatures plus a
+sinusoidal bump, as in the original project.
+
+``simulate()`` is a generator of frames, so a long run can be drawn while it
+is still going (at most every ``charts.STREAM_INTERVAL`` seconds: each redraw
+sends a new chart). Frames carry the profile downsampled to ``DISPLAY_POINTS``,
+which keeps both the chart and the cached result small however fine the grid
+is. Finished runs are kept in the shared memory cache under their parameter
+tuple; the cache's byte bound limits how many are held.
+
+``python -m benchmarks.heat`` compares the solvers with plain-loop versions.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+from portfolio.cache import shared_cache
+from portfolio.charts import STREAM_INTERVAL, chart_frame, downsample
+from portfolio.profiling import record_element, timed
+
+try:
+    from scipy.linalg import solve_banded
+except ImportError:
+    solve_banded = None
+
+ROD_LENGTH = 0.1  # m
+INITIAL_BUMP = 80.0  # °C, height of the sinusoidal start profile above the ends
+# Thermal diffusivity, m²/s
+MATERIALS = {
+    "Copper": 1.11e-4,
+    "Aluminium": 9.7e-5,
+    "Stainless steel": 4.2e-6,
+    "Glass": 3.4e-7,
+}
+BOUNDARIES = ("dirichlet", "neumann")
+SCHEMES = ("explicit", "implicit")
+GRID_OPTIONS = (101, 1_001, 10_001, 100_001, 200_001)
+FOURIER_OPTIONS = (0.1, 0.25, 0.4, 0.5, 0.55, 1, 5, 25, 100, 1_000)
+MAX_STEPS = 2_000
+FRAMES = 40
+BLOW_UP_FACTOR = 10.0
+DISPLAY_POINTS = 600
+# Cyclic reduction takes about 1.5 s for MAX_STEPS steps at this size.
+IMPLICIT_MAX_POINTS = None if solve_banded is not None else 50_001
+
+HeatProblem = namedtuple("HeatProblem", "material points fourier steps boundary left right scheme")
+Frame = namedtuple("Frame", "step time profile")
+HeatResult = namedtuple("HeatResult", "x initial frames stable elapsed_s backend")
+
+
+def grid(problem: HeatProblem) -> tuple[np.ndarray, float, float]:
+    """Node positions, ``Δx`` and ``Δt`` of ``problem``."""
+    x = np.linspace(0.0, ROD_LENGTH, problem.points)
+    dx = ROD_LENGTH / (problem.points - 1)
+    return x, dx, problem.fourier * dx * dx / MATERIALS[problem.material]
+
+
+def initial_profile(problem: HeatProblem, x: np.ndarray) -> np.ndarray:
+    ends = problem.left + (problem.right - problem.left) * x / ROD_LENGTH
+    return ends + INITIAL_BUMP * np.sin(np.pi * x / ROD_LENGTH)
+
+
+def explicit_step(T: np.ndarray, r: float, boundary: str, lap: np.ndarray) -> np.ndarray:
+    """Advance ``T`` in place by one forward-Euler step; ``lap`` is scratch space."""
+    np.subtract(T[2:], T[1:-1], out=lap[1:-1])
+    lap[1:-1] -= T[1:-1]
+    lap[1:-1] += T[:-2]
+    if boundary == "neumann":
+        # Mirror ghost nodes: no flux through the ends.
+        lap[0] = 2.0 * (T[1] - T[0])
+        lap[-1] = 2.0 * (T[-2] - T[-1])
+    else:
+        lap[0] = lap[-1] = 0.0
+    lap *= r
+    T += lap
+    return T
+
+
+def implicit_matrix(n: int, r: float, boundary: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sub-, main and super-diagonal of the backward-Euler system ``(I - r·L) T' = T``."""
+    lower = np.full(n, -r)
+    diag = np.full(n, 1.0 + 2.0 * r)
+    upper = np.full(n, -r)
+    if boundary == "neumann":
+        upper[0] = lower[-1] = -2.0 * r
+    else:
+        # Fixed ends: identity rows, the right-hand side holds the end temperatures.
+        diag[0] = diag[-1] = 1.0
+        upper[0] = lower[-1] = 0.0
+    lower[0] = upper[-1] = 0.0
+    return lower, diag, upper
+
+
+def tridiagonal_factor(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray) -> list[tuple]:
+    """Cyclic-reduction factorization of a tridiagonal matrix, for ``tridiagonal_solve``.
+
+    Row ``i`` reads ``lower[i]·x[i-1] + diag[i]·x[i] + upper[i]·x[i+1]``. Each
+    level eliminates the even-numbered unknowns from the odd-numbered rows,
+    halving the system; only the right-hand side work is left for each solve.
+    Stable for diagonally dominant matrices such as the heat equation's.
+    """
+    a, b, c = (np.array(v, dtype=float) for v in (lower, diag, upper))
+    a[0] = c[-1] = 0.0
+    levels = []
+    while len(b) > 1:
+        n = len(b)
+        if n % 2 == 0:
+            # A trailing identity row, so every odd row has neighbours on both sides.
+            a, b, c = np.append(a, 0.0), np.append(b, 1.0), np.append(c, 0.0)
+        alpha = -a[1::2] / b[:-1:2]
+        gamma = -c[1::2] / b[2::2]
+        inv_b = 1.0 / b[::2]
+        levels.append((n, a[::2] * inv_b, inv_b, c[::2] * inv_b, alpha, gamma))
+        a, b, c = alpha * a[:-1:2], b[1::2] + alpha * c[:-1:2] + gamma * a[2::2], gamma * c[2::2]
+    levels.append((1, None, 1.0 / b, None, None, None))
+    return levels
+
+
+def tridiagonal_solve(levels: list[tuple], rhs: np.ndarray) -> np.ndarray:
+    d = np.asarray(rhs, dtype=float)
+    reduced = []
+    for n, _, _, _, alpha, gamma in levels[:-1]:
+        if n % 2 == 0:
+            d = np.append(d, 0.0)
+        reduced.append(d)
+        d = d[1::2] + alpha * d[:-1:2] + gamma * d[2::2]
+    x = d * levels[-1][2]
+    for (n, a_scaled, inv_b, c_scaled, _, _), d in zip(reversed(levels[:-1]), reversed(reduced)):
+        full = np.empty(len(d))
+        full[1::2] = x
+        evens = full[::2]
+        np.multiply(d[::2], inv_b, out=evens)
+        evens[1:] -= a_scaled[1:] * x
+        evens[:-1] -= c_scaled[:-1] * x
+        x = full[:n]
+    return x
+
+
+def implicit_solver(n: int, r: float, boundary: str):
+    """``solve(T)`` returning the next implicit step of ``T``."""
+    lower, diag, upper = implicit_matrix(n, r, boundary)
+    if solve_banded is not None:
+        banded = np.zeros((3, n))
+        banded[0, 1:] = upper[:-1]
+        banded[1] = diag
+        banded[2, :-1] = lower[1:]
+        return lambda T: solve_banded((1, 1), banded, T, check_finite=False)
+    levels = tridiagonal_factor(lower, diag, upper)
+    return lambda T: tridiagonal_solve(levels, T)
+
+
+def display_profile(T: np.ndarray, points: int = DISPLAY_POINTS) -> np.ndarray:
+    # A copy even when nothing is dropped: the solver updates T in place.
+    return T.copy() if len(T) <= points else downsample(T, points)
+
+
+def frame_steps(steps: int, frames: int = FRAMES) -> set[int]:
+    return set(np.linspace(0, steps, min(frames, steps) + 1).round().astype(int).tolist())
+
+
+def simulate(problem: HeatProblem, frames: int = FRAMES):
+    """Yield ``Frame``s from step 0 to ``problem.steps``, stopping early if the run blows up."""
+    x, _, dt = grid(problem)
+    T = initial_profile(problem, x)
+    wanted = frame_steps(problem.steps, frames)
+    # The exact solution never leaves the range it starts in; far outside it
+    # the explicit scheme has gone unstable.
+    limit = BLOW_UP_FACTOR * max(np.abs(T).max(), 1.0)
+    yield Frame(0, 0.0, display_profile(T))
+
+    if problem.scheme == "explicit":
+        lap = np.empty_like(T)
+
+        def advance(T):
+            return explicit_step(T, problem.fourier, problem.boundary, lap)
+    else:
+        advance = implicit_solver(problem.points, problem.fourier, problem.boundary)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for step in range(1, problem.steps + 1):
+            T = advance(T)
+            if step in wanted:
+                yield Frame(step, step * dt, display_profile(T))
+                if not np.abs(T).max() <= limit:
+                    return
+
+
+def backend(problem: HeatProblem) -> str:
+    if problem.scheme == "explicit":
+        return "NumPy explicit"
+    return "scipy.linalg.solve_banded" if solve_banded is not None else "NumPy cyclic reduction"
+
+
+def result_size(result: HeatResult) -> int:
+    return result.x.nbytes + result.initial.nbytes + sum(f.profile.nbytes for f in result.frames)
+
+
+def run(problem: HeatProblem, on_frame=None) -> HeatResult:
+    """Solve ``problem`` (or fetch it from the cache), calling ``on_frame`` as frames arrive."""
+    key = ("heat", problem)
+    cached = shared_cache.get(key)
+    if cached is not None:
+        return cached
+    start = time.perf_counter()
+    frames = []
+    with timed("heat", f"{problem.scheme} n={problem.points}"):
+        for frame in simulate(problem):
+            frames.append(frame)
+            if on_frame is not None:
+                on_frame(frame, frames[0])
+    x, _, _ = grid(problem)
+    result = HeatResult(display_profile(x), frames[0].profile, frames, frames[-1].step == problem.steps,
+                        time.perf_counter() - start, backend(problem))
+    shared_cache.put(key, result, result_size(result))
+    return result
+
+
+def _chart(x: np.ndarray, initial: np.ndarray, frame: Frame):
+    data = chart_frame(x * 100, {"t = 0 s": initial, f"t = {frame.time:.3g} s": frame.profile}, "x (cm)", decimals=3)
+    return data.clip(-1e4, 1e4)
+
+
+def demo():
+    """Sliders, a live temperature chart and the run's statistics."""
+    if not st.toggle("Run the solver here", key="heat-demo"):
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        points = st.select_slider("Grid points", GRID_OPTIONS, value=1_001, key="heat-points")
+        fourier = st.select_slider("Time step, as r = α·Δt/Δx²", FOURIER_OPTIONS, value=0.4, key="heat-r")
+        steps = st.slider("Time steps", 10, MAX_STEPS, 500, step=10, key="heat-steps")
+    with col2:
+        material = st.selectbox("Material", list(MATERIALS), key="heat-material")
+        scheme = st.radio("Scheme", SCHEMES, format_func=str.capitalize, horizontal=True, key="heat-scheme")
+        boundary = st.radio("Ends", BOUNDARIES, horizontal=True, key="heat-boundary",
+                            format_func={"dirichlet": "Fixed (Dirichlet)", "neumann": "Insulated (Neumann)"}.get)
+        left, right = st.slider("End temperatures (°C)", 0, 200, (20, 20), key="heat-ends",
+                                disabled=boundary == "neumann")
+
+    if scheme == "implicit" and IMPLICIT_MAX_POINTS and points > IMPLICIT_MAX_POINTS:
+        points = IMPLICIT_MAX_POINTS
+        st.caption(f"Without SciPy the implicit scheme is limited to {points:,} grid points.")
+
+    problem = HeatProblem(material, points, float(fourier), steps, boundary, float(left), float(right), scheme)
+    x_display = display_profile(grid(problem)[0])
+    chart = st.empty()
+    progress = st.progress(0.0)
+
+    last_draw = time.perf_counter()
+
+    def on_frame(frame, first):
+        nonlocal last_draw
+        if time.perf_counter() - last_draw < STREAM_INTERVAL:
+            return
+        chart.line_chart(_chart(x_display, first.profile, frame), x_label="x (cm)", y_label="T (°C)")
+        progress.progress(frame.step / steps)
+        last_draw = time.perf_counter()
+
+    result = run(problem, on_frame)
+    chart.line_chart(_chart(result.x, result.initial, result.frames[-1]), x_label="x (cm)", y_label="T (°C)")
+    progress.empty()
+    record_element("heat", f"{scheme} n={points}", result_size(result))
+
+    _, dx, dt = grid(problem)
+    last = result.frames[-1]
+    st.caption(f"Δx = {dx * 1000:.3g} mm, Δt = {dt:.3g} s, {last.step} steps = {last.time:.3g} s simulated; "
+               f"solved in {result.elapsed_s * 1000:.0f} ms with {result.backend}.")
+    if not result.stable:
+        st.warning(f"The explicit scheme blew up after {last.step} steps: it is only stable for r ≤ 0.5. "
+                   "Lower the time step or switch to the implicit scheme.")
+    elif scheme == "explicit" and fourier > 0.5:
+        st.warning("r > 0.5: the explicit scheme is unstable and errors grow with every step.")
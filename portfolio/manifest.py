@@ -0,0 +1,77 @@
+"""Lookup side of the asset build manifest.
+
+``python -m portfolio.build_assets`` writes ``static/build/manifest.json``.
+It records, for every asset the app references, its content hash, size and
+dimensions plus the URL of its optimized copy, and for every derivative the
+app asks for (responsive variants, Welcome images, PDF thumbnails) the URL and
+size of the prebuilt file. The rendering helpers consult it before doing any
+work of their own.
+
+With ``PORTFOLIO_REQUIRE_MANIFEST=1`` (production) an asset or derivative
+missing from the manifest is an error instead of being built on the fly from
+the original.
+"""
+
+import json
+import os
+import threading
+
+from portfolio.assets import AssetNotFound
+from portfolio.static import BUILD_DIR
+
+MANIFEST_PATH = BUILD_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+_manifest = None
+_lock = threading.Lock()
+
+
+def require_manifest() -> bool:
+    return os.environ.get("PORTFOLIO_REQUIRE_MANIFEST", "").lower() in ("1", "true", "yes")
+
+
+def derivative_spec(name: str, transform: str, params: dict, format: str, quality: int | None) -> str:
+    return json.dumps([name, transform, params, format, quality], sort_keys=True)
+
+
+def load() -> dict:
+    global _manifest
+    with _lock:
+        if _manifest is None:
+            try:
+                with open(MANIFEST_PATH, encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get("version") != MANIFEST_VERSION:
+                manifest = {"version": MANIFEST_VERSION, "assets": {}, "derivatives": {}}
+            _manifest = manifest
+        return _manifest
+
+
+def reset():
+    """Use an empty manifest in this process (the build starts from scratch)."""
+    global _manifest
+    with _lock:
+        _manifest = {"version": MANIFEST_VERSION, "assets": {}, "derivatives": {}}
+
+
+def reload():
+    global _manifest
+    with _lock:
+        _manifest = None
+    return load()
+
+
+def asset(name: str) -> dict | None:
+    return load()["assets"].get(name)
+
+
+def derivative(spec: str) -> dict | None:
+    return load()["derivatives"].get(spec)
+
+
+def check_unbuilt(what: str):
+    """Called before falling back to an original; refuses in production."""
+    if require_manifest():
+        raise AssetNotFound(f"{what} is not in {MANIFEST_PATH}; run python -m portfolio.build_assets")
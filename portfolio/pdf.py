@@ -0,0 +1,152 @@
+"""Lazy PDF previews.
+
+``pdf_preview()`` shows a rasterized thumbnail of page 1 straight away and
+links to the full document as a static file, which the browser fetches (and
+streams) only if the visitor opens it. Remaining pages are rendered only when
+asked for. Thumbnails go through the derivative cache, so each page of each PDF
+is rasterized once.
+
+Rasterizing needs ``pypdfium2``; without it, or if a PDF can't be rendered,
+the preview degrades to the link.
+PDFs processed by ``python -m portfolio.build_assets`` come from the manifest.
+"""
+
+import html
+import logging
+import threading
+from pathlib import Path
+
+import streamlit as st
+from PIL import Image, features
+
+from portfolio import manifest
+from portfolio.assets import resolve_asset
+from portfolio.derivatives import FORMAT_EXTENSIONS, cached_bytes, derivative_key, encode, source_hash
+from portfolio.profiling import record_element, timed
+from portfolio.static import publish_bytes, publish_file
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTH = 960
+# Pillow can be built without WebP; PNG keeps rasterized text sharp too.
+THUMBNAIL_FORMAT = "WEBP" if features.check("webp") else "PNG"
+THUMBNAIL_QUALITY = 80
+
+# pdfium is not thread-safe; Streamlit runs each session on its own thread.
+_pdfium_lock = threading.Lock()
+_page_counts: dict[str, int] = {}
+
+
+def page_count(name: str) -> int:
+    entry = manifest.asset(name)
+    if entry is not None:
+        return entry["pages"]
+    path = resolve_asset(name)
+    key = source_hash(path)
+    count = _page_counts.get(key)
+    if count is None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(str(path))
+            try:
+                count = _page_counts[key] = len(pdf)
+            finally:
+                pdf.close()
+    return count
+
+
+def render_page(path: Path, page: int, width: int) -> Image.Image:
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(str(path))
+        try:
+            pdf_page = pdf[page]
+            scale = width / pdf_page.get_width()
+            return pdf_page.render(scale=scale).to_pil().convert("RGB")
+        finally:
+            pdf.close()
+
+
+def page_thumbnail_info(name: str, page: int = 0, width: int = THUMBNAIL_WIDTH) -> tuple[str, int]:
+    spec = manifest.derivative_spec(name, "pdf_page", {"page": page, "width": width},
+                                    THUMBNAIL_FORMAT, THUMBNAIL_QUALITY)
+    built = manifest.derivative(spec)
+    if built is not None:
+        return built["url"], built["bytes"]
+    manifest.check_unbuilt(f"{name} page {page + 1}")
+
+    key, data = page_thumbnail(name, page, width)
+    stem = f"{Path(name).stem}-p{page + 1}"
+    return publish_bytes(data, FORMAT_EXTENSIONS[THUMBNAIL_FORMAT], stem=stem, cache_key=key), len(data)
+
+
+def page_thumbnail(name: str, page: int = 0, width: int = THUMBNAIL_WIDTH) -> tuple[str, bytes]:
+    """Cache key and encoded thumbnail of one page, rasterized on first use."""
+    path = resolve_asset(name)
+    key = derivative_key(source_hash(path), "pdf_page", {"page": page, "width": width},
+                         THUMBNAIL_FORMAT, THUMBNAIL_QUALITY)
+    with timed("pdf_page", f"{name}#{page + 1}"):
+        data = cached_bytes(key, FORMAT_EXTENSIONS[THUMBNAIL_FORMAT],
+                            lambda: encode(render_page(path, page, width), THUMBNAIL_FORMAT, THUMBNAIL_QUALITY))
+    return key, data
+
+
+def page_thumbnail_url(name: str, page: int = 0, width: int = THUMBNAIL_WIDTH) -> str:
+    url, nbytes = page_thumbnail_info(name, page, width)
+    record_element("pdf_page", f"{name}#{page + 1}", nbytes)
+    return url
+
+
+def pdf_info(name: str) -> tuple[str, int]:
+    entry = manifest.asset(name)
+    if entry is not None:
+        return entry["url"], entry["optimized_bytes"]
+    manifest.check_unbuilt(name)
+    path = resolve_asset(name)
+    return publish_file(path), path.stat().st_size
+
+
+def pdf_url(name: str) -> str:
+    return pdf_info(name)[0]
+
+
+def pdf_preview(name: str, caption: str | None = None, width: int = THUMBNAIL_WIDTH):
+    """Page-1 thumbnail, a link to the full PDF and the other pages on request."""
+    url, nbytes = pdf_info(name)
+    size_kb = nbytes // 1024
+    link = f'<a href="{url}" target="_blank" rel="noopener">Open full PDF ({size_kb} KB)</a>'
+
+    if pdfium is None:
+        st.markdown(link, unsafe_allow_html=True)
+        return
+
+    try:
+        first_page = page_thumbnail_url(name, 0, width)
+        pages = page_count(name)
+    except (pdfium.PdfiumError, OSError, ValueError) as exc:
+        logger.warning("pdf preview %s unavailable: %s", name, exc)
+        st.markdown(link, unsafe_allow_html=True)
+        return
+
+    alt = html.escape(caption or Path(name).stem, quote=True)
+    st.markdown(
+        f'<a href="{url}" target="_blank" rel="noopener">'
+        f'<img src="{first_page}" alt="{alt}" style="width: 100%; border-radius: 4px;"></a>',
+        unsafe_allow_html=True,
+    )
+    if caption:
+        st.caption(caption)
+    st.markdown(link, unsafe_allow_html=True)
+
+    if pages > 1 and st.toggle(f"Show all {pages} pages", key=f"pdf-pages-{name}"):
+        for page in range(1, pages):
+            try:
+                page_url = page_thumbnail_url(name, page, width)
+            except (pdfium.PdfiumError, OSError, ValueError) as exc:
+                logger.warning("pdf page %s#%d unavailable: %s", name, page + 1, exc)
+                st.warning(f"Page {page + 1} could not be rendered; open the full PDF instead.")
+                break
+            st.markdown(f'<img src="{page_url}" loading="lazy" style="width: 100%;">', unsafe_allow_html=True)
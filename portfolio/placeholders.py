@@ -0,0 +1,60 @@
+"""Low-quality image placeholders (LQIP) for the blur-up effect.
+
+A lazy ``<img>`` reserves its box from ``width``/``height`` but stays blank
+until the file arrives, and a large photo then pops in. Each opaque image
+instead gets a ~20 px wide, slightly blurred thumbnail, a few hundred bytes
+once base64-encoded, that is inlined as a ``data:`` URI and painted as the
+``<img>`` background. The browser stretches it over the reserved box straight
+away, so the visitor sees a soft preview of the picture which the real image
+then covers as it decodes. Transparent images get no placeholder: it would
+show through their transparent parts.
+
+``python -m portfolio.build_assets`` stores the data URI of every opaque image
+in the manifest (``lqip``), including screenshots saved with an alpha channel
+they don't use; otherwise it is computed on first use through the derivative
+cache, for images without an alpha channel. Placeholders are a nicety, so in production
+(``PORTFOLIO_REQUIRE_MANIFEST=1``) a missing one is simply left out.
+"""
+
+from PIL import Image, features
+
+from portfolio import manifest
+from portfolio.derivatives import FORMAT_MIME_TYPES, get_derivative_base64
+
+LQIP_WIDTH = 20
+LQIP_BLUR = 1.0
+LQIP_QUALITY = 40
+LQIP_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+
+
+def is_opaque(img: Image.Image) -> bool:
+    """Whether ``img`` has no pixel that is even partly transparent."""
+    if img.mode in ("RGBA", "LA"):
+        return img.getchannel("A").getextrema()[0] == 255
+    if img.mode == "P" and "transparency" in img.info:
+        return is_opaque(img.convert("RGBA"))
+    return True
+
+
+def build_data_uri(name: str) -> str:
+    """Encode the placeholder of asset ``name`` as a ``data:`` URI."""
+    data = get_derivative_base64(name, "lqip", format=LQIP_FORMAT, quality=LQIP_QUALITY,
+                                 width=LQIP_WIDTH, blur=LQIP_BLUR)
+    return f"data:{FORMAT_MIME_TYPES[LQIP_FORMAT]};base64,{data}"
+
+
+def data_uri(name: str, has_alpha: bool = False) -> str | None:
+    """Placeholder for asset ``name``, or ``None`` if it shouldn't or can't have one."""
+    entry = manifest.asset(name)
+    if entry is not None and "lqip" in entry:
+        return entry["lqip"]
+    if has_alpha or manifest.require_manifest():
+        return None
+    return build_data_uri(name)
+
+
+def background_style(uri: str | None, fallback: str) -> str:
+    """CSS ``background`` showing ``uri`` stretched over the element, else ``fallback``."""
+    if uri is None:
+        return f"background: {fallback};"
+    return f"background: {fallback} url('{uri}') center / cover no-repeat;"
@@ -0,0 +1,184 @@
+"""Parallel asset preparation and adjacent-section prefetch.
+
+Rendering a section resolves its images, PDFs and videos one after another in
+script order, and on a cold cache each one may mean decoding, resizing,
+rasterizing or transcoding. ``prepare_section()`` instead submits every asset
+the section references to a shared thread pool and waits for them together,
+so the render itself only does cache lookups. ``warm_adjacent()`` then queues
+the sections before and after it in the sidebar without waiting, so the next
+click is usually warm as well.
+
+Preparation calls the same functions the render does (``get_variant``,
+``pdf_info``, ``video_info``, ``get_derivative_info``), so results land in the
+shared memory cache, the derivative cache on disk and ``static/``. Failures are
+logged and otherwise ignored: the render will surface them in its own way.
+Work done for the section being viewed is recorded in that rerun's profile,
+as it would be without the pool.
+
+``PORTFOLIO_PREFETCH_WORKERS`` (default 4) sizes the pool and
+``PORTFOLIO_PREFETCH_QUEUE`` (default 64) caps how many tasks may be queued or
+running; background warming beyond that is dropped rather than queued.
+``PORTFOLIO_PREFETCH_WORKERS=0`` disables the pool and prepares nothing.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from portfolio import profiling
+from portfolio.profiling import timed
+from portfolio.sections import IMAGE_EXTENSIONS, SECTIONS, VIDEO_EXTENSIONS, section_assets, section_derivatives
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_WORKERS = int(os.environ.get("PORTFOLIO_PREFETCH_WORKERS", 4))
+PREFETCH_QUEUE_DEPTH = int(os.environ.get("PORTFOLIO_PREFETCH_QUEUE", 64))
+PREFETCH_TIMEOUT = float(os.environ.get("PORTFOLIO_PREFETCH_TIMEOUT", 30))
+# How many sections on each side of the current one to warm.
+ADJACENT_SECTIONS = 1
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = 0
+# Tasks already attempted, successfully or not; failures are left to the render.
+_done: set[tuple] = set()
+_in_flight: dict[tuple, object] = {}
+_state_lock = threading.Lock()
+# section -> (its asset names, the tasks built from them)
+_tasks: dict[str, tuple[list, list]] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="prefetch")
+        return _executor
+
+
+def section_tasks(section: str) -> list[tuple]:
+    """``(kind, name, args)`` for every asset ``section`` renders.
+
+    Built from the registry without importing the section, and rebuilt only
+    when its asset list changes (its content file was edited).
+    """
+    names = section_assets(section)
+    cached = _tasks.get(section)
+    if cached is not None and cached[0] == names:
+        return cached[1]
+    derivatives = section_derivatives(section)
+    derived = {spec["name"] for spec in derivatives}
+    tasks = [("derivative", spec["name"], tuple(sorted(spec.items()))) for spec in derivatives]
+    for name in names:
+        if name in derived:
+            continue
+        suffix = Path(name).suffix.lower()
+        if suffix in IMAGE_EXTENSIONS:
+            tasks.append(("image", name, ()))
+        elif suffix in VIDEO_EXTENSIONS:
+            tasks.append(("video", name, ()))
+        elif suffix == ".pdf":
+            tasks.append(("pdf", name, ()))
+    _tasks[section] = (names, tasks)
+    return tasks
+
+
+def prepare(kind: str, name: str, args: tuple = ()):
+    """Do the work rendering asset ``name`` would do, leaving the results cached."""
+    # Imported here so that startup doesn't pay for pypdfium2 and friends.
+    from portfolio import pdf, responsive, video
+    from portfolio.derivatives import get_derivative_info
+
+    if kind == "image":
+        responsive.get_variant(name)
+    elif kind == "video":
+        video.video_info(name)
+    elif kind == "video_renditions":
+        video.build_renditions(name)
+    elif kind == "pdf":
+        pdf.pdf_info(name)
+        if pdf.pdfium is not None:
+            pdf.page_thumbnail_info(name, 0)
+    elif kind == "derivative":
+        spec = dict(args)
+        spec.pop("name")
+        transform = spec.pop("transform")
+        format, quality = spec.pop("format", "PNG"), spec.pop("quality", None)
+        get_derivative_info(name, transform, format, quality, **spec)
+
+
+def _run(task: tuple, profile) -> bool:
+    global _pending
+    try:
+        with profiling.use(profile):
+            prepare(*task)
+        return True
+    except Exception as exc:
+        logger.warning("prefetch of %s %s failed: %s", task[0], task[1], exc)
+        return False
+    finally:
+        with _state_lock:
+            _done.add(task)
+            _pending -= 1
+            _in_flight.pop(task, None)
+
+
+def submit(task: tuple, block: bool = False, profile=None):
+    """Queue ``task``; returns its future, or ``None`` if done already or dropped.
+
+    Background submissions are dropped once ``PREFETCH_QUEUE_DEPTH`` tasks are
+    outstanding; ``block=True`` (the section being viewed) always queues.
+    The task's timings and elements go to ``profile``, if given.
+    """
+    global _pending
+    if PREFETCH_WORKERS <= 0:
+        return None
+    with _state_lock:
+        if task in _done:
+            return None
+        future = _in_flight.get(task)
+        if future is not None:
+            return future
+        if not block and _pending >= PREFETCH_QUEUE_DEPTH:
+            return None
+        _pending += 1
+        future = _in_flight[task] = _get_executor().submit(_run, task, profile)
+    return future
+
+
+def forget(names: set[str]):
+    """Let tasks for assets ``names`` run again, e.g. after their content changed."""
+    with _state_lock:
+        _done.difference_update([task for task in _done if task[1] in names])
+
+
+def prepare_section(section: str):
+    """Prepare all of ``section``'s assets concurrently and wait for them."""
+    profile = profiling.active()
+    with timed("prefetch", section):
+        futures = [f for f in (submit(task, block=True, profile=profile) for task in section_tasks(section))
+                   if f is not None]
+        if futures:
+            wait(futures, timeout=PREFETCH_TIMEOUT)
+
+
+def adjacent_sections(section: str) -> list[str]:
+    names = list(SECTIONS)
+    index = names.index(section)
+    nearby = []
+    for offset in range(1, ADJACENT_SECTIONS + 1):
+        for neighbour in (index + offset, index - offset):
+            if 0 <= neighbour < len(names):
+                nearby.append(names[neighbour])
+    return nearby
+
+
+def warm_adjacent(section: str):
+    """Queue the assets of the sections next to ``section`` without waiting."""
+    if PREFETCH_WORKERS <= 0:
+        return
+    for neighbour in adjacent_sections(section):
+        for task in section_tasks(neighbour):
+            submit(task)
@@ -0,0 +1,170 @@
+"""Opt-in render profiling.
+
+Enable with ``PORTFOLIO_PROFILE=1`` or by opening the app with ``?profile=1``.
+Each rerun then records how long the section took, how long each asset step
+took (remote fetches, PIL transforms, PDF rasterizing, base64 encoding) and how
+many bytes each media element sent. The record is logged as one JSON line on
+the ``portfolio.profile`` logger and the last few reruns of the session are
+shown in a collapsed sidebar panel.
+
+When profiling is off, ``timed()`` and ``record_element()`` do nothing. The
+profile is per thread; work handed to another thread on a rerun's behalf
+records into it by running under ``use(profile)``.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from portfolio.cache import shared_cache
+
+logger = logging.getLogger("portfolio.profile")
+
+ENV_VAR = "PORTFOLIO_PROFILE"
+QUERY_PARAM = "profile"
+HISTORY_SIZE = int(os.environ.get("PORTFOLIO_PROFILE_HISTORY", 20))
+HISTORY_KEY = "_profile_history"
+
+_local = threading.local()
+_handler_installed = False
+
+
+class RerunProfile:
+    def __init__(self, section: str):
+        self.section = section
+        self.started_at = time.time()
+        self.timings = []
+        self.elements = []
+        self.total_ms = None
+
+    def as_dict(self) -> dict:
+        return {
+            "section": self.section,
+            "started_at": round(self.started_at, 3),
+            "total_ms": self.total_ms,
+            "bytes_sent": sum(e["bytes"] for e in self.elements),
+            "timings": self.timings,
+            "elements": self.elements,
+        }
+
+
+def enabled() -> bool:
+    if os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return True
+    import streamlit as st
+
+    try:
+        return st.query_params.get(QUERY_PARAM) == "1"
+    except Exception:
+        # No script run context (e.g. called from a CLI).
+        return False
+
+
+def active() -> RerunProfile | None:
+    return getattr(_local, "profile", None)
+
+
+@contextmanager
+def use(profile: RerunProfile | None):
+    """Record into ``profile`` on this thread, e.g. a pool worker doing a rerun's work."""
+    previous = active()
+    _local.profile = profile
+    try:
+        yield profile
+    finally:
+        _local.profile = previous
+
+
+@contextmanager
+def profile_rerun(section: str):
+    if not enabled():
+        yield None
+        return
+
+    _install_handler()
+    profile = _local.profile = RerunProfile(section)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_ms = round((time.perf_counter() - start) * 1000, 3)
+        _local.profile = None
+        record = profile.as_dict()
+        logger.info(json.dumps(record))
+        _remember(record)
+
+
+def _install_handler():
+    global _handler_installed
+    if not _handler_installed and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    _handler_installed = True
+
+
+def _remember(record: dict):
+    import streamlit as st
+
+    try:
+        history = st.session_state.setdefault(HISTORY_KEY, [])
+    except Exception:
+        return
+    history.append(record)
+    del history[:-HISTORY_SIZE]
+
+
+@contextmanager
+def timed(kind: str, name: str):
+    profile = active()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.timings.append({
+            "kind": kind,
+            "name": name,
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+        })
+
+
+def record_element(kind: str, name: str, nbytes: int):
+    profile = active()
+    if profile is not None:
+        profile.elements.append({"kind": kind, "name": name, "bytes": nbytes})
+
+
+def render_panel():
+    """Collapsed sidebar summary of this session's last reruns (profiling only)."""
+    if not enabled():
+        return
+    import streamlit as st
+
+    history = st.session_state.get(HISTORY_KEY, [])
+    with st.sidebar.expander(f"Profiling (last {len(history)} reruns)", expanded=False):
+        st.table([
+            {
+                "section": r["section"],
+                "total ms": r["total_ms"],
+                "KB sent": round(r["bytes_sent"] / 1024, 1),
+                "slowest step": max(r["timings"], key=lambda t: t["ms"])["name"] if r["timings"] else "",
+            }
+            for r in reversed(history)
+        ])
+        if history:
+            st.json(history[-1], expanded=False)
+
+        stats = shared_cache.stats()
+        st.caption(
+            f"Shared cache: {stats['bytes'] / 2**20:.1f} of {stats['max_bytes'] / 2**20:.0f} MiB, "
+            f"{stats['entries']} entries; {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['loads']} loads, {stats['evictions']} evictions"
+        )
@@ -0,0 +1,232 @@
+"""Width-bucketed image variants and an ``st.image`` wrapper that serves them.
+
+Most screenshots and photos are shown in the narrow right-hand column, yet the
+originals are up to 3840 px wide and several megabytes. ``image()`` picks the
+smallest width bucket that covers the display width, generates that variant on
+first use through :mod:`portfolio.derivatives` (so it is cached in memory and on
+disk) and renders it as a native ``loading="lazy"`` image from its static URL,
+so images below the fold are only fetched as the visitor scrolls to them.
+Until it arrives, the image's box shows its blurred placeholder from
+:mod:`portfolio.placeholders`. If the variant would not be smaller than the
+original, the original is published unchanged.
+
+Assets processed by ``python -m portfolio.build_assets`` are served straight
+from the build manifest. Passing a static URL matters: given bytes or a file path, ``st.image`` decodes
+the image on every rerun and re-encodes anything that isn't JPEG/PNG/GIF to
+PNG before sending it through the media manager.
+
+Bytes sent versus the originals are tallied per section; run
+``python -m portfolio.responsive`` to print the savings for every section.
+"""
+
+import html
+import logging
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+from PIL import ExifTags, Image, features
+
+from portfolio import manifest
+from portfolio.assets import resolve_asset
+from portfolio.cache import shared_cache
+from portfolio.derivatives import get_derivative, get_derivative_url, source_hash
+from portfolio.placeholders import background_style, data_uri
+from portfolio.profiling import record_element, timed
+from portfolio.sections import current_section
+from portfolio.static import publish_file
+
+logger = logging.getLogger(__name__)
+
+WIDTH_BUCKETS = (480, 960, 1440)
+# The right-hand column is a third of the wide layout (~450 CSS px on a typical
+# laptop); 960 px keeps it sharp on 2x displays.
+DEFAULT_DISPLAY_WIDTH = 960
+VARIANT_QUALITY = 80
+PLACEHOLDER_COLOR = "#f0f2f6"
+PREFERRED_FORMATS = tuple(
+    os.environ.get("PORTFOLIO_IMAGE_FORMATS", "WEBP").upper().split(","))
+
+# ``url`` points at either the published variant or the published original;
+# ``placeholder`` is the LQIP data URI, if the image has one.
+Variant = namedtuple("Variant", "url served_bytes width height format original_bytes placeholder")
+
+_dimensions: dict[str, tuple[int, int, bool]] = {}
+_payload: dict[str, dict[str, tuple[int, int]]] = {}
+_payload_lock = threading.Lock()
+
+
+def variant_format(has_alpha: bool) -> str:
+    for format in PREFERRED_FORMATS:
+        if format in ("WEBP", "AVIF") and features.check(format.lower()):
+            return format
+    return "PNG" if has_alpha else "JPEG"
+
+
+def pick_width(source_width: int, display_width: int) -> int | None:
+    """Smallest bucket that covers ``display_width``; ``None`` if no downscale is needed."""
+    for bucket in WIDTH_BUCKETS:
+        if bucket >= display_width:
+            return bucket if bucket < source_width else None
+    return WIDTH_BUCKETS[-1] if WIDTH_BUCKETS[-1] < source_width else None
+
+
+def _source_info(name: str) -> tuple[int, int, bool]:
+    """Display width and height (after EXIF rotation) and alpha of asset ``name``."""
+    path = resolve_asset(name)
+    key = source_hash(path)
+    info = _dimensions.get(key)
+    if info is None:
+        with Image.open(path) as img:
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            width, height = img.size
+            if img.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8):
+                width, height = height, width
+            info = _dimensions[key] = (width, height, has_alpha)
+    return info
+
+
+def _scaled_height(source_width: int, source_height: int, width: int) -> int:
+    return round(source_height * width / source_width)
+
+
+def source_size(name: str) -> tuple[int, int]:
+    """Display size of asset ``name``, from the manifest when it is built."""
+    entry = manifest.asset(name)
+    if entry is not None and "width" in entry:
+        return entry["width"], entry["height"]
+    manifest.check_unbuilt(name)
+    return _source_info(name)[:2]
+
+
+def get_variant(name: str, display_width: int = DEFAULT_DISPLAY_WIDTH) -> Variant:
+    """The variant ``image()`` serves, resolved once per process for all sessions."""
+    return shared_cache.get_or_load(("variant", name, display_width),
+                                    lambda: _resolve_variant(name, display_width))
+
+
+def _resolve_variant(name: str, display_width: int) -> Variant:
+    entry = manifest.asset(name)
+    if entry is not None:
+        original_bytes, has_alpha = entry["bytes"], entry["has_alpha"]
+        source_width, source_height = entry["width"], entry["height"]
+    else:
+        manifest.check_unbuilt(name)
+        original_bytes = resolve_asset(name).stat().st_size
+        source_width, source_height, has_alpha = _source_info(name)
+    width = pick_width(source_width, display_width)
+    format = variant_format(has_alpha)
+    placeholder = data_uri(name, has_alpha)
+
+    spec = manifest.derivative_spec(name, "resize_width", {"width": width}, format, VARIANT_QUALITY)
+    built = manifest.derivative(spec)
+    if built is not None:
+        return Variant(built["url"], built["bytes"], built["width"],
+                       _scaled_height(source_width, source_height, built["width"]), built["format"], original_bytes,
+                       placeholder)
+
+    manifest.check_unbuilt(f"{name} at {width or source_width} px")
+    return _lazy_variant(name, width, format, source_width, source_height, original_bytes, placeholder)
+
+
+def _lazy_variant(name: str, width: int | None, format: str, source_width: int, source_height: int,
+                  original_bytes: int, placeholder: str | None) -> Variant:
+    path = resolve_asset(name)
+    data = get_derivative(name, "resize_width", format=format, quality=VARIANT_QUALITY, width=width)
+    if len(data) >= original_bytes:
+        return Variant(publish_file(path), original_bytes, source_width, source_height, None, original_bytes,
+                       placeholder)
+    url = get_derivative_url(name, "resize_width", format=format, quality=VARIANT_QUALITY, width=width)
+    width = width or source_width
+    return Variant(url, len(data), width, _scaled_height(source_width, source_height, width), format, original_bytes,
+                   placeholder)
+
+
+def record_payload(name: str, original_bytes: int, served_bytes: int):
+    section = current_section() or "(none)"
+    with _payload_lock:
+        entries = _payload.setdefault(section, {})
+        if name not in entries:
+            logger.info("%s: %s served %d of %d bytes", section, name, served_bytes, original_bytes)
+        entries[name] = (original_bytes, served_bytes)
+
+
+def lazy_img_html(variant: Variant, alt: str = "", stretch: bool = True) -> str:
+    """``<img>`` that the browser fetches only as it nears the viewport.
+
+    ``width``/``height`` give the box its aspect ratio before the image
+    arrives, so nothing below it shifts, and the blurred placeholder (grey for
+    images without one) fills that box meanwhile; the image paints over it.
+    """
+    sizing = "width: 100%;" if stretch else "max-width: 100%;"
+    background = background_style(variant.placeholder, PLACEHOLDER_COLOR)
+    return (
+        f'<img src="{variant.url}" alt="{html.escape(alt, quote=True)}" width="{variant.width}" '
+        f'height="{variant.height}" loading="lazy" decoding="async" '
+        f'style="{sizing} height: auto; {background} border-radius: 4px;">'
+    )
+
+
+def image(name: str, display_width: int = DEFAULT_DISPLAY_WIDTH, caption: str | None = None,
+          width: int | str = "content", lazy: bool = True, **kwargs):
+    """``st.image`` for a bundled asset, sending the smallest adequate variant.
+
+    By default the image is a native lazy ``<img>`` (see ``lazy_img_html``),
+    so a section costs the same to first paint however many images it lists.
+    ``width`` is ``st.image``'s: ``"stretch"`` fills the column. Pass
+    ``lazy=False``, or any other ``st.image`` argument, to get ``st.image``
+    itself.
+    """
+    with timed("image", name):
+        variant = get_variant(name, display_width)
+        record_payload(name, variant.original_bytes, variant.served_bytes)
+        record_element("image", name, variant.served_bytes)
+        if lazy and not kwargs:
+            st.markdown(lazy_img_html(variant, caption or Path(name).stem, width == "stretch"),
+                        unsafe_allow_html=True)
+            if caption:
+                st.caption(caption)
+        else:
+            # st.image only passes through static URLs written as "/app/static/..."
+            st.image("/" + variant.url, caption=caption, width=width, **kwargs)
+
+
+def payload_report() -> dict[str, dict[str, int]]:
+    with _payload_lock:
+        report = {}
+        for section, entries in _payload.items():
+            original = sum(o for o, _ in entries.values())
+            served = sum(s for _, s in entries.values())
+            report[section] = {
+                "images": len(entries),
+                "original_bytes": original,
+                "served_bytes": served,
+                "saved_bytes": original - served,
+            }
+        return report
+
+
+def main():
+    from streamlit.testing.v1 import AppTest
+
+    from portfolio.assets import REPO_ROOT
+    # Run as ``python -m`` this module is ``__main__``; the app records into the
+    # imported copy.
+    from portfolio.responsive import payload_report
+
+    app = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=120)
+    app.run()
+    for section in app.sidebar.radio[0].options:
+        app.sidebar.radio[0].set_value(section).run()
+
+    report = payload_report()
+    print(f"{'section':<40}{'images':>7}{'original':>12}{'served':>12}{'saved':>8}")
+    for section, row in report.items():
+        saved = row["saved_bytes"] / row["original_bytes"] if row["original_bytes"] else 0.0
+        print(f"{section:<40}{row['images']:>7}{row['original_bytes']:>12}{row['served_bytes']:>12}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Section registry.
+
+Each sidebar entry is rendered by its own module in this package, exposing a
+``render()`` function. Modules are imported the first time their section is
+selected, so a rerun only executes the page being viewed and cold start only
+pays for the landing page. Most modules just hand their text and assets over
+to ``portfolio.content``, which reads them from ``content/<module>.toml``.
+"""
+
+import importlib
+import re
+import threading
+from pathlib import Path
+
+SECTIONS = {
+    "Welcome": "welcome",
+    "About Me": "about",
+    "Programming & Embedded Systems": "embedded",
+    "Circuits, Instrumentation and Power": "circuits",
+    "PCB Design & Manufacture": "pcb",
+    "Mechanical Design & Manufacture": "mechanical",
+    "Signal & Communication Systems": "signals",
+    "Computational Simulation": "simulation",
+    "Data Analysis & Visualization": "data_analysis",
+    "Linux & Development Environment": "linux",
+    "Contact": "contact",
+}
+
+# Named derivatives a section renders, as ``get_derivative_*`` keyword
+# arguments, keyed by module. Declared here rather than in the module so that
+# prefetch and the asset build can read them without importing the section.
+DERIVATIVES = {
+    "welcome": (
+        dict(name="DSC01631.JPG", transform="fit_width", format="JPEG", quality=85, max_width=2400),
+        dict(name="IMG_4185.JPG", transform="circular", size=300),
+    ),
+}
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov"}
+MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS | {".pdf"}
+_STRING_LITERAL = re.compile(r"""["']([^"'\n]+?\.[A-Za-z0-9]{3,4})["']""")
+
+_local = threading.local()
+_assets: dict[str, list[str]] = {}
+
+
+def load(section: str):
+    return importlib.import_module(f"{__name__}.{SECTIONS[section]}")
+
+
+def media_references(source: str) -> list[str]:
+    """Media filenames that appear as string literals in Python ``source``."""
+    names = []
+    for name in _STRING_LITERAL.findall(source):
+        if Path(name).suffix.lower() in MEDIA_EXTENSIONS and name not in names:
+            names.append(name)
+    return names
+
+
+def source_path(section: str) -> Path:
+    return Path(__file__).with_name(f"{SECTIONS[section]}.py")
+
+
+def section_assets(section: str) -> list[str]:
+    """Media files ``section`` shows, found without importing its module."""
+    from portfolio import content
+
+    names = _assets.get(section)
+    if names is None:
+        names = [spec["name"] for spec in section_derivatives(section)]
+        names += [name for name in media_references(source_path(section).read_text(encoding="utf-8"))
+                  if name not in names]
+        _assets[section] = names
+    module = SECTIONS[section]
+    if not content.has_content(module):
+        return names
+    # Not memoized: the content file may have been edited since the last call.
+    return names + [name for name in content.asset_names(module) if name not in names]
+
+
+def section_derivatives(section: str) -> tuple[dict, ...]:
+    return DERIVATIVES.get(SECTIONS[section], ())
+
+
+def current_section() -> str | None:
+    """The section being rendered on this script thread, if any."""
+    return getattr(_local, "section", None)
+
+
+def render(section: str):
+    _local.section = section
+    try:
+        load(section).render()
+    finally:
+        _local.section = None
@@ -0,0 +1,7 @@
+"""About Me; the text and assets live in ``content/about.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("about")
@@ -0,0 +1,7 @@
+"""Circuits, Instrumentation and Power projects; the text and assets live in ``content/circuits.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("circuits")
@@ -0,0 +1,7 @@
+"""Contact details; the text and assets live in ``content/contact.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("contact")
@@ -0,0 +1,7 @@
+"""Data Analysis & Visualization projects; the text and assets live in ``content/data_analysis.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("data_analysis")
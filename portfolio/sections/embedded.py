@@ -0,0 +1,7 @@
+"""Programming & Embedded Systems projects; the text and assets live in ``content/embedded.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("embedded")
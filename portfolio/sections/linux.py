@@ -0,0 +1,7 @@
+"""Linux & Development Environment; the text and assets live in ``content/linux.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("linux")
@@ -0,0 +1,7 @@
+"""Mechanical Design & Manufacture projects; the text and assets live in ``content/mechanical.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("mechanical")
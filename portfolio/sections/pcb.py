@@ -0,0 +1,7 @@
+"""PCB Design & Manufacture projects; the text and assets live in ``content/pcb.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("pcb")
@@ -0,0 +1,7 @@
+"""Signal & Communication Systems projects; the text and assets live in ``content/signals.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("signals")
@@ -0,0 +1,7 @@
+"""Computational Simulation projects; the text and assets live in ``content/simulation.toml``."""
+
+from portfolio.content import render_content
+
+
+def render():
+    render_content("simulation")
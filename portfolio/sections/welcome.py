@@ -0,0 +1,51 @@
+"""Landing page: banner, profile photo and headline."""
+
+import streamlit as st
+
+from portfolio.derivatives import get_derivative_url
+from portfolio.placeholders import background_style, data_uri
+from portfolio.profiling import record_element
+from portfolio.responsive import PLACEHOLDER_COLOR, source_size
+from portfolio.sections import DERIVATIVES
+
+# Declared in the registry, so they are prebuilt by portfolio.build_assets
+BANNER, AVATAR = DERIVATIVES["welcome"]
+
+
+def render():
+    # Banner and circular profile photo are computed once and served as
+    # cacheable static files rather than inlined into every rerun
+    banner_url = get_derivative_url(**BANNER)
+    circular_url = get_derivative_url(**AVATAR)
+    # Sized and backed by its blurred placeholder, so the banner's space is
+    # filled from the first paint instead of popping in
+    source_width, source_height = source_size(BANNER["name"])
+    banner_width = min(source_width, BANNER["max_width"])
+    banner_height = round(source_height * banner_width / source_width)
+    banner_background = background_style(data_uri(BANNER["name"]), PLACEHOLDER_COLOR)
+
+    # HTML layout with overlap
+    html = f"""
+    <div style="position: relative; text-align: left;">
+        <img src="{banner_url}" width="{banner_width}" height="{banner_height}"
+             style="width: 100%; height: auto; {banner_background} border-radius: 10px;">
+        <img src="{circular_url}" width="150" height="150"
+             style="position: absolute; bottom: -60px; left: 40px;
+                    width: 150px; height: 150px; border-radius: 50%; border: 5px solid white;">
+    </div>
+    <br><br>
+    """
+
+    record_element("markdown", "welcome banner", len(html.encode()))
+    st.markdown(html, unsafe_allow_html=True)
+
+    # Profile Header
+    st.markdown("## Shinn Gee Choo  \n**Meng Robotics Engineering Student at the University of Bath** \n**University of Bath**  \n📍 Bath, England, United Kingdom")
+
+    # Open to Work
+    st.markdown("### ✅ Open to Work")
+    st.write("Mechanical Engineer, Electrical Engineer and Software Engineer Internship")
+
+    # Final note
+    st.markdown("---")
+    st.markdown("👈 Use the sidebar to navigate through my portfolio and explore my engineering projects.")
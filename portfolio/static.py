@@ -0,0 +1,89 @@
+"""Publish generated files through Streamlit's static file serving.
+
+Files written here land in ``static/gen/`` (generated lazily at runtime) or
+``static/build/`` (written by ``python -m portfolio.build_assets``) and are
+served by Streamlit at ``app/static/...`` (``server.enableStaticServing`` is
+switched on in ``.streamlit/config.toml``). Names carry a content hash, so a URL never changes
+meaning: browsers and proxies can cache it forever and a new version of an
+image simply gets a new URL. ``serve.py`` adds the matching long-lived
+``Cache-Control`` header; under plain ``streamlit run`` browsers still
+revalidate cheaply with the ETag Streamlit sends.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+
+from portfolio.assets import REPO_ROOT, file_sha256
+
+STATIC_DIR = REPO_ROOT / "static"
+GENERATED_DIR = STATIC_DIR / "gen"
+BUILD_DIR = STATIC_DIR / "build"
+URL_PREFIX = "app/static/gen/"
+# Everything under these prefixes has a content hash in its file name.
+IMMUTABLE_URL_PREFIXES = (URL_PREFIX, "app/static/build/")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_published: set[str] = set()
+_urls_by_key: dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def fingerprinted_name(data: bytes, extension: str, stem: str = "") -> str:
+    return _fingerprint(hashlib.sha256(data).hexdigest(), extension, stem)
+
+
+def _fingerprint(sha256: str, extension: str, stem: str) -> str:
+    stem = re.sub(r"[^A-Za-z0-9_-]+", "-", stem).strip("-")
+    return f"{stem}.{sha256[:16]}.{extension}" if stem else f"{sha256[:16]}.{extension}"
+
+
+def static_url(path: Path) -> str:
+    return "app/static/" + Path(path).relative_to(STATIC_DIR).as_posix()
+
+
+def publish_bytes(data: bytes, extension: str, stem: str = "", cache_key: str | None = None,
+                  directory: Path = GENERATED_DIR) -> str:
+    """Write ``data`` under a content-hashed name and return its URL.
+
+    Callers that already have a stable key for ``data`` can pass it as
+    ``cache_key`` to skip re-hashing on later calls.
+    """
+    if cache_key is not None and cache_key in _urls_by_key:
+        return _urls_by_key[cache_key]
+    path = Path(directory) / fingerprinted_name(data, extension, stem)
+    if str(path) not in _published:
+        with _lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            _published.add(str(path))
+    url = static_url(path)
+    if cache_key is not None:
+        _urls_by_key[cache_key] = url
+    return url
+
+
+def publish_file(path: Path, stem: str = "", directory: Path = GENERATED_DIR) -> str:
+    """Publish a file on disk, streaming it rather than reading it into memory."""
+    path = Path(path)
+    stat = path.stat()
+    cache_key = f"{path}:{stat.st_size}:{stat.st_mtime_ns}:{directory}"
+    if cache_key in _urls_by_key:
+        return _urls_by_key[cache_key]
+
+    target = Path(directory) / _fingerprint(file_sha256(path), path.suffix.lstrip(".").lower(), stem or path.stem)
+    with _lock:
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, target)
+        _published.add(str(target))
+    url = _urls_by_key[cache_key] = static_url(target)
+    return url
@@ -0,0 +1,258 @@
+"""Transmission-line reflection and crosstalk simulators for Signal & Communication Systems.
+
+Both demos work in the frequency domain. A line of characteristic impedance
+``Z0``, one-way delay ``td`` and skin-effect loss (``loss_db`` at 1 GHz,
+growing with √f), driven through ``Rs`` and terminated in ``ZL``, has the
+closed-form transfer functions
+
+    V_near / Vs = Z0/(Z0+Rs) · (1 + ΓL·p²) / (1 − ΓS·ΓL·p²)
+    V_far  / Vs = Z0/(Z0+Rs) · (1 + ΓL)·p / (1 − ΓS·ΓL·p²)
+
+with ``p = e^(−γl)`` and ``Γ = (Z − Z0)/(Z + Z0)`` at each end, which include
+every reflection at once. ``line_response`` evaluates them for a whole batch
+of lines and loads in one broadcast NumPy expression over frequency; the
+time-domain waveforms are the inverse real FFT of the source pulse's spectrum
+times those transfer functions, again for the whole batch in one call.
+
+* ``reflections()`` batches the four termination cases of the lab (open,
+  short, matched and a resistive mismatch).
+* ``crosstalk()`` treats a symmetric coupled pair by even/odd modes: each
+  mode is a single line (``Ze``/``Zo`` from the coupling coefficient, with its
+  own delay), so the pair is a batch of two, and the four port voltages are
+  sums and differences of the modal ones.
+
+Results are cached per parameter tuple in the shared memory cache, so
+returning to a slider position costs nothing and a new one costs one FFT.
+Waveforms are downsampled to ``charts.DISPLAY_POINTS`` before they are charted.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+from portfolio.cache import shared_cache
+from portfolio.charts import chart_frame, downsample
+from portfolio.profiling import record_element, timed
+
+RESPONSE_POINTS = 1_000
+MAX_SAMPLES = 2 ** 15
+# Round trips shown after the pulse has been launched.
+ROUND_TRIPS = 6
+CASES = ("Open", "Short", "Matched", "Mismatched")
+# Responses are clamped here, so a shorted far end doesn't flatten the chart.
+RESPONSE_FLOOR_DB = -80.0
+
+ReflectionParams = namedtuple("ReflectionParams", "amplitude z0 source_r load_r delay_ns loss_db rise_ns width_ns")
+CrosstalkParams = namedtuple(
+    "CrosstalkParams", "amplitude z0 coupling velocity_skew source_r load_r delay_ns loss_db rise_ns width_ns")
+Waveforms = namedtuple("Waveforms", "t_ns traces f_ghz response elapsed_s")
+
+
+def reflection_coefficient(z, z0):
+    """``(Z − Z0)/(Z + Z0)``, with ``np.inf`` standing for an open circuit."""
+    z = np.asarray(z, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.where(np.isinf(z), 1.0, (z - z0) / (z + z0))
+
+
+def line_response(freqs, z0, delay, loss_db, source_r, load_z):
+    """Near- and far-end transfer functions ``V/Vs`` of a batch of lines.
+
+    ``freqs`` (Hz) has shape ``(F,)``; the other arguments broadcast against
+    each other, typically as ``(cases, 1)`` columns, and the results have
+    shape ``(cases, F)``.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    attenuation = 10.0 ** (-np.asarray(loss_db) * np.sqrt(freqs / 1e9) / 20.0)
+    p = attenuation * np.exp(-2j * np.pi * freqs * np.asarray(delay))
+    gamma_s = reflection_coefficient(source_r, z0)
+    gamma_l = reflection_coefficient(load_z, z0)
+    source_r = np.asarray(source_r, dtype=float)
+    launch = z0 / (z0 + source_r)
+    denominator = 1.0 - gamma_s * gamma_l * p * p
+    # A lossless line between two total reflectors resonates without bound.
+    denominator = np.where(np.abs(denominator) < 1e-9, 1e-9, denominator)
+    # V_near = Vs − Rs·I_in, the same as launch·(1 + ΓL·p²)/denominator, but
+    # an ideal source (Rs = 0) gives exactly Vs even where the denominator
+    # vanishes: into a short the DC bin is 0/0 and would otherwise come out 0,
+    # offsetting the whole trace.
+    near = 1.0 - source_r / (z0 + source_r) * (1.0 - gamma_l * p * p) / denominator
+    far = launch * (1.0 + gamma_l) * p / denominator
+    return near, far
+
+
+def pulse(t, amplitude: float, rise: float, width: float) -> np.ndarray:
+    """Trapezoidal pulse: linear ``rise`` from 0, flat for ``width``, linear fall."""
+    up = np.clip(t / rise, 0.0, 1.0)
+    down = np.clip((t - rise - width) / rise, 0.0, 1.0)
+    return amplitude * (up - down)
+
+
+def time_grid(delay_ns: float, rise_ns: float, width_ns: float) -> tuple[int, float]:
+    """Sample count (a power of two) and step, in seconds, covering the pulse and its echoes."""
+    window = (2 * rise_ns + width_ns + 2 * ROUND_TRIPS * delay_ns) * 1e-9
+    step = min(rise_ns / 8, delay_ns / 20) * 1e-9
+    samples = min(MAX_SAMPLES, 1 << int(np.ceil(np.log2(window / step))))
+    return samples, window / samples
+
+
+def propagate(source, step: float, z0, delay, loss_db, source_r, load_z):
+    """Near- and far-end waveforms for the batch, by FFT of the source voltage."""
+    freqs = np.fft.rfftfreq(len(source), step)
+    near, far = line_response(freqs, z0, delay, loss_db, source_r, load_z)
+    spectrum = np.fft.rfft(source)
+    return np.fft.irfft(near * spectrum, len(source)), np.fft.irfft(far * spectrum, len(source))
+
+
+def response_freqs(delay_ns: float, rise_ns: float) -> np.ndarray:
+    """Frequencies for the response plot: up to the pulse's bandwidth, at least ten resonances."""
+    f_max = max(0.35 / rise_ns, 10 / (2 * delay_ns)) * 1e9
+    return np.linspace(0.0, f_max, RESPONSE_POINTS)
+
+
+def decibels(ratio) -> np.ndarray:
+    return 20 * np.log10(np.maximum(np.abs(ratio), 10 ** (RESPONSE_FLOOR_DB / 20)))
+
+
+def _waveforms_size(result: Waveforms) -> int:
+    return result.t_ns.nbytes + result.f_ghz.nbytes + sum(v.nbytes for v in result.traces.values()) + sum(
+        v.nbytes for v in result.response.values())
+
+
+def _reflections(params: ReflectionParams) -> Waveforms:
+    start = time.perf_counter()
+    samples, step = time_grid(params.delay_ns, params.rise_ns, params.width_ns)
+    t = np.arange(samples) * step
+    source = pulse(t, params.amplitude, params.rise_ns * 1e-9, params.width_ns * 1e-9)
+    loads = np.array([np.inf, 0.0, params.z0, params.load_r])[:, None]
+    delay, z0 = params.delay_ns * 1e-9, float(params.z0)
+
+    near, far = propagate(source, step, z0, delay, params.loss_db, params.source_r, loads)
+    freqs = response_freqs(params.delay_ns, params.rise_ns)
+    _, response = line_response(freqs, z0, delay, params.loss_db, params.source_r, loads)
+    response_db = decibels(response)
+
+    traces = {}
+    for i, case in enumerate(CASES):
+        traces[f"{case}: near end"] = downsample(near[i])
+        traces[f"{case}: far end"] = downsample(far[i])
+    return Waveforms(downsample(t) * 1e9, traces, freqs / 1e9, dict(zip(CASES, response_db)),
+                     time.perf_counter() - start)
+
+
+def reflections(params: ReflectionParams) -> Waveforms:
+    """Near- and far-end waveforms and far-end response for every termination case."""
+    with timed("tline", "reflections"):
+        return shared_cache.get_or_load(("tline", params), lambda: _reflections(params), _waveforms_size)
+
+
+def modal_impedances(z0: float, coupling: float) -> tuple[float, float]:
+    """Even- and odd-mode impedances of a symmetric pair with coupling coefficient ``coupling``."""
+    ratio = np.sqrt((1 + coupling) / (1 - coupling))
+    return z0 * ratio, z0 / ratio
+
+
+def _crosstalk(params: CrosstalkParams) -> Waveforms:
+    start = time.perf_counter()
+    samples, step = time_grid(params.delay_ns * (1 + params.velocity_skew / 2), params.rise_ns, params.width_ns)
+    t = np.arange(samples) * step
+    # Driving one line with Vs is driving both modes with Vs/2.
+    source = pulse(t, params.amplitude / 2, params.rise_ns * 1e-9, params.width_ns * 1e-9)
+    z_even, z_odd = modal_impedances(params.z0, params.coupling)
+    z0 = np.array([z_even, z_odd])[:, None]
+    # The even mode travels slower on microstrip: more of its field is in the dielectric.
+    delay = params.delay_ns * 1e-9 * np.array([1 + params.velocity_skew / 2, 1 - params.velocity_skew / 2])[:, None]
+
+    (near_even, near_odd), (far_even, far_odd) = propagate(source, step, z0, delay, params.loss_db,
+                                                           params.source_r, params.load_r)
+    freqs = response_freqs(params.delay_ns, params.rise_ns)
+    near_f, far_f = line_response(freqs, z0, delay, params.loss_db, params.source_r, params.load_r)
+    response = {
+        "Vout (through)": decibels((far_f[0] + far_f[1]) / 2),
+        "Vnear (NEXT)": decibels((near_f[0] - near_f[1]) / 2),
+        "Vfar (FEXT)": decibels((far_f[0] - far_f[1]) / 2),
+    }
+
+    traces = {
+        "Vin": downsample(near_even + near_odd),
+        "Vout": downsample(far_even + far_odd),
+        "Vnear": downsample(near_even - near_odd),
+        "Vfar": downsample(far_even - far_odd),
+    }
+    return Waveforms(downsample(t) * 1e9, traces, freqs / 1e9, response, time.perf_counter() - start)
+
+
+def crosstalk(params: CrosstalkParams) -> Waveforms:
+    """Aggressor and victim waveforms at both ends of a coupled pair, and their responses."""
+    with timed("tline", "crosstalk"):
+        return shared_cache.get_or_load(("tline-coupled", params), lambda: _crosstalk(params), _waveforms_size)
+
+
+def _line_controls(prefix: str) -> dict:
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        amplitude = st.select_slider("Source amplitude (V)", (1.0, 1.8, 2.5, 3.3, 5.0), value=3.3,
+                                     key=f"{prefix}-amplitude")
+        z0 = st.slider("Z0 (Ω)", 25, 150, 50, step=5, key=f"{prefix}-z0")
+    with col2:
+        delay_ns = st.slider("Line delay (ns)", 0.2, 10.0, 2.0, step=0.1, key=f"{prefix}-delay")
+        loss_db = st.slider("Loss at 1 GHz (dB)", 0.0, 10.0, 1.0, step=0.5, key=f"{prefix}-loss")
+    with col3:
+        rise_ns = st.slider("Rise time (ns)", 0.05, 2.0, 0.2, step=0.05, key=f"{prefix}-rise")
+        width_ns = st.slider("Pulse width (ns)", 1.0, 20.0, 5.0, step=0.5, key=f"{prefix}-width")
+    return dict(amplitude=amplitude, z0=float(z0), delay_ns=delay_ns, loss_db=loss_db, rise_ns=rise_ns,
+                width_ns=width_ns)
+
+
+def _show(result: Waveforms, name: str, time_columns: list[list[str]], labels: list[str]):
+    tabs = st.tabs(labels + ["Frequency response"])
+    for tab, columns in zip(tabs, time_columns):
+        with tab:
+            st.line_chart(chart_frame(result.t_ns, {c: result.traces[c] for c in columns}, "t (ns)"),
+                          x_label="t (ns)", y_label="V")
+    with tabs[-1]:
+        st.line_chart(chart_frame(result.f_ghz, result.response, "f (GHz)"), x_label="f (GHz)", y_label="|V/Vs| (dB)")
+    record_element("tline", name, _waveforms_size(result))
+
+
+def reflection_demo():
+    """Open, short, matched and mismatched terminations of one line, side by side."""
+    if not st.toggle("Run the reflection simulator", key="tline-demo"):
+        return
+    line = _line_controls("tline")
+    col1, col2 = st.columns(2)
+    with col1:
+        source_r = st.slider("Source resistance (Ω)", 0, 200, 50, step=5, key="tline-rs")
+    with col2:
+        load_r = st.slider("Mismatched load (Ω)", 0, 1000, 100, step=5, key="tline-rl")
+    params = ReflectionParams(source_r=float(source_r), load_r=float(load_r), **line)
+    result = reflections(params)
+    _show(result, "reflections", [[f"{case}: near end" for case in CASES], [f"{case}: far end" for case in CASES]],
+          ["Near end (Vin)", "Far end (Vout)"])
+    st.caption(f"All four terminations evaluated in one batched FFT in {result.elapsed_s * 1000:.1f} ms "
+               f"(cached for these settings).")
+
+
+def crosstalk_demo():
+    """Near- and far-end crosstalk on a coupled pair, with one line driven."""
+    if not st.toggle("Run the crosstalk simulator", key="coupled-demo"):
+        return
+    line = _line_controls("coupled")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        coupling = st.slider("Coupling coefficient", 0.0, 0.6, 0.2, step=0.02, key="coupled-k")
+    with col2:
+        velocity_skew = st.slider("Even/odd mode delay skew", 0.0, 0.3, 0.05, step=0.01, key="coupled-skew",
+                                  help="0 for stripline; microstrip has some, which causes far-end crosstalk")
+    with col3:
+        load_r = st.select_slider("Terminations (Ω)", (10, 25, 50, 100, 200, 500, 2000), value=50, key="coupled-r",
+                                  help="Every end of both lines; the source resistance too")
+    params = CrosstalkParams(coupling=coupling, velocity_skew=velocity_skew, source_r=float(load_r),
+                             load_r=float(load_r), **line)
+    result = crosstalk(params)
+    z_even, z_odd = modal_impedances(params.z0, coupling)
+    _show(result, "crosstalk", [["Vin", "Vout"], ["Vnear", "Vfar"]], ["Driven line", "Victim line"])
+    st.caption(f"Even/odd modes (Ze = {z_even:.0f} Ω, Zo = {z_odd:.0f} Ω) evaluated in one batched FFT in "
+               f"{result.elapsed_s * 1000:.1f} ms (cached for these settings).")
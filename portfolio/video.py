@@ -0,0 +1,270 @@
+"""Web-optimized video renditions served from the static route.
+
+``st.video`` on a bundled file reads the whole file into the server's media
+store for every session that shows it. ``video()`` instead transcodes each
+source once with ffmpeg into
+
+* H.264/AAC MP4 renditions at a few heights and bitrates (never upscaled),
+  with the ``moov`` atom at the front (``+faststart``) so playback can start
+  before the download finishes,
+* a poster frame,
+
+publishes them as fingerprinted files under ``app/static/`` and renders a
+``<video preload="none">`` element pointing at them. The browser shows the
+poster straight away and fetches only the byte ranges that are played; the
+Streamlit process never holds the video in memory.
+
+ffmpeg is looked up in ``PORTFOLIO_FFMPEG``, on ``PATH`` and in the optional
+``imageio-ffmpeg`` package. Without it the original file is published and
+streamed as-is (``preload="metadata"``, no poster). Videos processed by
+``python -m portfolio.build_assets`` come from the manifest.
+
+A video missing from the manifest is transcoded at runtime, but never while a
+rerun waits: the original is shown at once and the renditions are built on the
+prefetch pool (with the faster ``RUNTIME_PRESET``), then served from the next
+rerun on. With the pool disabled the original is all that is served.
+"""
+
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from portfolio import manifest
+from portfolio.assets import AssetNotFound, resolve_asset
+from portfolio.cache import shared_cache
+from portfolio.derivatives import DERIVATIVES_DIR, derivative_key, source_hash
+from portfolio.profiling import record_element, timed
+from portfolio.static import GENERATED_DIR, publish_file
+
+try:
+    import imageio_ffmpeg
+except ImportError:
+    imageio_ffmpeg = None
+
+logger = logging.getLogger(__name__)
+
+# (height, video kbit/s, media query). Listed in <source> order: the browser
+# plays the first one whose media query matches.
+RENDITIONS = (
+    (720, 2000, "(min-width: 1600px)"),
+    (360, 450, "(max-width: 640px)"),
+    (480, 900, None),
+)
+AUDIO_BITRATE = "96k"
+# x264 presets: the asset build can afford to spend time on compression, a
+# running app building a missing video in the background should not.
+BUILD_PRESET = "slow"
+RUNTIME_PRESET = "veryfast"
+POSTER_HEIGHT = 720
+POSTER_OFFSET = 1.0
+FFMPEG_TIMEOUT = float(os.environ.get("PORTFOLIO_FFMPEG_TIMEOUT", "600"))
+
+_VIDEO_SIZE = re.compile(r"Stream #.*Video:.*?\b(\d{2,5})x(\d{2,5})\b")
+_DURATION = re.compile(r"Duration: (\d+):(\d+):(\d+\.\d+)")
+
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+_probes: dict[str, dict] = {}
+
+
+def ffmpeg_exe() -> str | None:
+    exe = os.environ.get("PORTFOLIO_FFMPEG") or shutil.which("ffmpeg")
+    if exe is None and imageio_ffmpeg is not None:
+        try:
+            exe = imageio_ffmpeg.get_ffmpeg_exe()
+        except RuntimeError:
+            exe = None
+    return exe
+
+
+def _run_ffmpeg(args: list[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([ffmpeg_exe(), "-hide_banner", "-nostdin", *args],
+                          capture_output=True, text=True, timeout=FFMPEG_TIMEOUT)
+
+
+def probe(path: Path) -> dict:
+    """Width, height and duration of the first video stream (from ``ffmpeg -i``)."""
+    key = source_hash(path)
+    info = _probes.get(key)
+    if info is None:
+        # ffmpeg without an output file exits non-zero but still describes the input.
+        stderr = _run_ffmpeg(["-i", str(path)]).stderr
+        size, duration = _VIDEO_SIZE.search(stderr), _DURATION.search(stderr)
+        if size is None:
+            raise ValueError(f"{path.name}: no video stream found")
+        seconds = None
+        if duration is not None:
+            hours, minutes, secs = duration.groups()
+            seconds = int(hours) * 3600 + int(minutes) * 60 + float(secs)
+        info = _probes[key] = {"width": int(size.group(1)), "height": int(size.group(2)), "duration": seconds}
+    return info
+
+
+def rendition_heights(source_height: int) -> list[int]:
+    """Rendition heights to build for a source, in ``RENDITIONS`` order."""
+    heights = [height for height, _, _ in RENDITIONS if height <= source_height]
+    return heights or [source_height - source_height % 2]
+
+
+def cached_file(key: str, extension: str, produce) -> Path:
+    """Path of the file stored under ``key``, calling ``produce(tmp_path)`` on a miss.
+
+    Like ``derivatives.cached_bytes`` but the result stays on disk only, so
+    large outputs never pass through memory.
+    """
+    path = DERIVATIVES_DIR / f"{key}.{extension}"
+    if path.exists():
+        return path
+    with _locks_guard:
+        lock = _locks.setdefault(key, threading.Lock())
+    with lock:
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{key}.{os.getpid()}.tmp.{extension}")
+            try:
+                produce(tmp)
+                os.replace(tmp, path)
+            finally:
+                tmp.unlink(missing_ok=True)
+    return path
+
+
+def _check(result: subprocess.CompletedProcess, what: str):
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed on {what}: {result.stderr.strip().splitlines()[-1:]}")
+
+
+def rendition(name: str, height: int, preset: str = BUILD_PRESET) -> Path:
+    """Faststart H.264 MP4 of asset ``name`` scaled to ``height``."""
+    source = resolve_asset(name)
+    kbps = next((rate for h, rate, _ in RENDITIONS if h == height), RENDITIONS[-1][1])
+    params = {"height": height, "kbps": kbps, "audio": AUDIO_BITRATE, "preset": preset}
+    key = derivative_key(source_hash(source), "video_rendition", params, "MP4", None)
+
+    def produce(tmp: Path):
+        _check(_run_ffmpeg([
+            "-y", "-i", str(source),
+            "-vf", f"scale=-2:{height}", "-c:v", "libx264", "-preset", preset, "-profile:v", "main",
+            "-pix_fmt", "yuv420p", "-b:v", f"{kbps}k", "-maxrate", f"{kbps * 3 // 2}k", "-bufsize", f"{kbps * 2}k",
+            "-c:a", "aac", "-b:a", AUDIO_BITRATE, "-ac", "2",
+            "-movflags", "+faststart", str(tmp),
+        ]), f"{name} {height}p")
+
+    with timed("video_rendition", f"{name}@{height}p"):
+        return cached_file(key, "mp4", produce)
+
+
+def poster(name: str) -> Path:
+    """JPEG frame from ``POSTER_OFFSET`` seconds into asset ``name``."""
+    source = resolve_asset(name)
+    info = probe(source)
+    offset = min(POSTER_OFFSET, (info["duration"] or 0) / 2)
+    height = min(POSTER_HEIGHT, info["height"])
+    params = {"height": height, "offset": offset}
+    key = derivative_key(source_hash(source), "video_poster", params, "JPEG", None)
+
+    def produce(tmp: Path):
+        _check(_run_ffmpeg([
+            "-y", "-ss", f"{offset:.2f}", "-i", str(source), "-frames:v", "1",
+            "-vf", f"scale=-2:{height}", "-q:v", "4", str(tmp),
+        ]), f"{name} poster")
+
+    with timed("video_poster", name):
+        return cached_file(key, "jpg", produce)
+
+
+def original(name: str, directory: Path = GENERATED_DIR) -> dict:
+    """The source file itself, untranscoded, in the shape of a manifest entry."""
+    source = resolve_asset(name)
+    return {"poster": None, "width": None, "height": None,
+            "sources": [{"url": publish_file(source, Path(name).stem, directory), "bytes": source.stat().st_size,
+                         "height": None, "media": None}]}
+
+
+def build_video(name: str, directory: Path = GENERATED_DIR, preset: str = BUILD_PRESET) -> dict:
+    """Renditions and poster for ``name``, in the shape of its manifest entry."""
+    if ffmpeg_exe() is None:
+        return original(name, directory)
+    source = resolve_asset(name)
+    stem = Path(name).stem
+
+    info = probe(source)
+    media = {height: query for height, _, query in RENDITIONS}
+    sources = []
+    for height in rendition_heights(info["height"]):
+        path = rendition(name, height, preset)
+        sources.append({"url": publish_file(path, f"{stem}-{height}p", directory), "bytes": path.stat().st_size,
+                        "height": height, "media": media.get(height)})
+    return {"poster": publish_file(poster(name), f"{stem}-poster", directory),
+            "width": info["width"], "height": info["height"], "sources": sources}
+
+
+def build_renditions(name: str):
+    """Build ``name``'s renditions at runtime and cache its entry for ``video_info``.
+
+    Runs on the prefetch pool. A failed build caches the original instead, so
+    it isn't retried on every rerun.
+    """
+    key = source_hash(resolve_asset(name))
+    try:
+        info = build_video(name, preset=RUNTIME_PRESET)
+    except (RuntimeError, ValueError, subprocess.TimeoutExpired) as exc:
+        logger.warning("video %s: serving the original, renditions failed: %s", name, exc)
+        info = original(name)
+    shared_cache.put(("video", key), info)
+
+
+def video_info(name: str) -> dict:
+    entry = manifest.asset(name)
+    if entry is not None and "sources" in entry:
+        return entry
+    manifest.check_unbuilt(name)
+    key = source_hash(resolve_asset(name))
+    info = shared_cache.get(("video", key))
+    if info is not None:
+        return info
+    if ffmpeg_exe() is None:
+        return shared_cache.get_or_load(("video", key), lambda: original(name))
+    # Imported here: prefetch imports this module for its own tasks.
+    from portfolio import prefetch
+
+    # Let the build run again if an earlier result was evicted from the cache;
+    # one already queued or running is reused. Finished renditions are on disk,
+    # so a rebuild only publishes them.
+    prefetch.forget({name})
+    prefetch.submit(("video_renditions", name, ()))
+    return original(name)
+
+
+def video(name: str, caption: str | None = None):
+    """Poster-first ``<video>`` element streaming prebuilt renditions from the static route."""
+    with timed("video", name):
+        try:
+            info = video_info(name)
+        except (AssetNotFound, RuntimeError, ValueError, subprocess.TimeoutExpired) as exc:
+            logger.warning("video %s unavailable: %s", name, exc)
+            st.warning(f"Video unavailable: {Path(name).stem}")
+            return
+
+        sources = "".join(
+            f'<source src="{source["url"]}" type="video/mp4"'
+            + (f' media="{source["media"]}"' if source["media"] else "") + ">"
+            for source in info["sources"]
+        )
+        attributes = 'controls playsinline preload="none"' if info["poster"] else 'controls playsinline preload="metadata"'
+        if info["poster"]:
+            attributes += f' poster="{info["poster"]}"'
+        if info["width"] and info["height"]:
+            attributes += f' width="{info["width"]}" height="{info["height"]}"'
+        html = (f'<video {attributes} style="width: 100%; height: auto; border-radius: 4px;">'
+                f"{sources}</video>")
+        record_element("video", name, len(html))
+        st.markdown(html, unsafe_allow_html=True)
+        if caption:
+            st.caption(caption)
@@ -0,0 +1,156 @@
+"""Boot-time warm-up and readiness signal.
+
+Without it the first visitor after a deploy pays for importing PIL, requests
+and pypdfium2, for any remote downloads and for building every derivative the
+page needs. ``warm_up()`` does all of that up front: it imports the heavy
+modules, loads the build manifest and prepares every asset of every section
+through :mod:`portfolio.prefetch`, so they land in the shared memory cache, the
+disk cache and ``static/``.
+
+When it is done it logs how long the instance took to become ready and writes
+a JSON marker to ``PORTFOLIO_READY_FILE`` (default ``.cache/ready.json``). The
+marker is removed when a warm-up starts and when ``serve.py`` shuts down.
+``serve.py`` warms up in the background at boot and answers ``/readyz`` with
+503 until the warm-up has finished, then 200. A warm-up that fails outright is
+logged and the instance is reported ready anyway: it serves, only colder, and
+sessions prepare their assets as they would without a warm-up.
+
+    python -m portfolio.warmup
+
+does the same warm-up in a separate process, for ``streamlit run`` setups or
+as a pre-start step; that fills the disk cache and ``static/`` but not the
+memory of a server started afterwards.
+"""
+
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import wait
+from pathlib import Path
+
+from portfolio import manifest, prefetch
+from portfolio.assets import CACHE_DIR
+from portfolio.sections import SECTIONS
+
+logger = logging.getLogger(__name__)
+
+READY_FILE = Path(os.environ.get("PORTFOLIO_READY_FILE", CACHE_DIR / "ready.json"))
+# Imported up front so that no session pays for them.
+HEAVY_MODULES = ("PIL.Image", "requests", "pypdfium2", "imageio_ffmpeg", "portfolio.pdf",
+                 "portfolio.responsive", "portfolio.video")
+
+
+def _process_start_time() -> float:
+    """Wall-clock start of this process (Linux), else the time of this import."""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+        return boot + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, StopIteration):
+        return time.time()
+
+
+BOOT_TIME = _process_start_time()
+
+_ready = threading.Event()
+_status: dict = {"state": "starting"}
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def status() -> dict:
+    return dict(_status)
+
+
+def clear_marker():
+    READY_FILE.unlink(missing_ok=True)
+
+
+def _import_heavy_modules():
+    for name in HEAVY_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def warm_up() -> dict:
+    """Prepare everything the app serves; returns the readiness report."""
+    clear_marker()
+    start = time.perf_counter()
+    _status.update(state="warming")
+
+    _import_heavy_modules()
+    manifest.load()
+    tasks = [task for section in SECTIONS for task in prefetch.section_tasks(section)]
+    if prefetch.PREFETCH_WORKERS > 0:
+        futures = [f for f in (prefetch.submit(task, block=True) for task in tasks) if f is not None]
+        wait(futures)
+        failed = sum(not f.result() for f in futures)
+    else:
+        failed = 0
+        for task in tasks:
+            try:
+                prefetch.prepare(*task)
+            except Exception as exc:
+                logger.warning("warm-up of %s %s failed: %s", task[0], task[1], exc)
+                failed += 1
+
+    report = {
+        "state": "ready",
+        "pid": os.getpid(),
+        "assets": len(tasks),
+        "failed": failed,
+        "warmup_s": round(time.perf_counter() - start, 3),
+        "since_boot_s": round(time.time() - BOOT_TIME, 3),
+        "ready_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    READY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = READY_FILE.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    os.replace(tmp, READY_FILE)
+
+    _status.clear()
+    _status.update(report)
+    _ready.set()
+    logger.info("ready in %.1f s after boot (warm-up %.1f s, %d assets, %d failed)",
+                report["since_boot_s"], report["warmup_s"], report["assets"], failed)
+    return report
+
+
+def _warm_up_logged():
+    try:
+        warm_up()
+    except Exception as exc:
+        _status.update(state="failed", error=str(exc))
+        logger.exception("warm-up failed; serving without it")
+        _ready.set()
+
+
+def start_background() -> threading.Thread:
+    """Run ``warm_up()`` on a daemon thread, once per process."""
+    global _thread
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_warm_up_logged, name="warmup", daemon=True)
+            _thread.start()
+        return _thread
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = warm_up()
+    print(json.dumps(report, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""ASGI entry point that serves ``app.py`` with long-lived caching of static assets.
+
+    uvicorn serve:app --port 8501
+
+Files under ``app/static/gen/`` and ``app/static/build/`` are
+content-fingerprinted (see ``portfolio.static``), so they are marked immutable
+for a year. Everything else is served exactly as ``streamlit run app.py``
+would serve it.
+
+At boot the assets of every section are prepared in the background (see
+``portfolio.warmup``). ``/readyz`` answers 503 until that has finished and 200
+afterwards; point the orchestrator's readiness probe at it and keep
+``/_stcore/health`` for liveness.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from portfolio import warmup
+from portfolio.static import IMMUTABLE_CACHE_CONTROL, IMMUTABLE_URL_PREFIXES
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+
+class ImmutableStaticCacheMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(f"/{prefix}" in scope["path"] for prefix in IMMUTABLE_URL_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] in (200, 206):
+                MutableHeaders(scope=message)["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+
+async def readyz(request):
+    return JSONResponse(warmup.status(), status_code=200 if warmup.is_ready() else 503)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    warmup.start_background()
+    try:
+        yield
+    finally:
+        warmup.clear_marker()
+
+
+app = st.App(
+    "app.py",
+    lifespan=lifespan,
+    routes=[Route("/readyz", readyz)],
+    middleware=[Middleware(ImmutableStaticCacheMiddleware)],
+)
@@ -0,0 +1,178 @@
+"""AssetResolver and DiskCache with the network replaced by an injected ``fetch``."""
+
+import pytest
+
+from portfolio.assets import AssetNotFound, AssetResolver, DiskCache
+
+
+class FakeRemote:
+    """``fetch`` stand-in: serves ``files`` with ETags and records every request."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+        self.calls: list[tuple[str, str | None]] = []
+        self.down = False
+
+    def __call__(self, url: str, etag: str | None):
+        self.calls.append((url, etag))
+        if self.down:
+            raise ConnectionError("network is off")
+        name = url.rsplit("/", 1)[-1]
+        current = f'"{name}-{len(self.files[name])}"'
+        if etag == current:
+            return None, etag
+        return self.files[name], current
+
+
+@pytest.fixture(autouse=True)
+def online(monkeypatch):
+    monkeypatch.delenv("PORTFOLIO_OFFLINE", raising=False)
+
+
+def make_resolver(tmp_path, remote, max_bytes=1_000, **kwargs):
+    root = tmp_path / "repo"
+    root.mkdir(exist_ok=True)
+    cache = DiskCache(tmp_path / "cache", max_bytes)
+    return AssetResolver(root, cache, "https://example.invalid/", remote, **kwargs)
+
+
+def test_bundled_file_is_served_without_fetching(tmp_path):
+    remote = FakeRemote({})
+    resolver = make_resolver(tmp_path, remote)
+    (resolver.root / "a.png").write_bytes(b"local")
+
+    assert resolver.resolve("a.png") == resolver.root / "a.png"
+    assert remote.calls == []
+
+
+def test_missing_file_is_fetched_once_then_served_from_cache(tmp_path):
+    remote = FakeRemote({"a.png": b"remote bytes"})
+    resolver = make_resolver(tmp_path, remote)
+
+    path = resolver.resolve("a.png")
+    assert path.read_bytes() == b"remote bytes"
+    assert resolver.resolve("a.png") == path
+    assert len(remote.calls) == 1
+
+    # A new process with the same cache directory doesn't fetch either.
+    fresh = AssetResolver(resolver.root, DiskCache(tmp_path / "cache", 1_000), "https://example.invalid/", remote)
+    assert fresh.resolve("a.png").read_bytes() == b"remote bytes"
+    assert len(remote.calls) == 1
+
+
+def test_failed_fetch_raises_asset_not_found_and_backs_off(tmp_path):
+    remote = FakeRemote({"a.png": b"x"})
+    remote.down = True
+    resolver = make_resolver(tmp_path, remote)
+
+    with pytest.raises(AssetNotFound):
+        resolver.resolve("a.png")
+    with pytest.raises(AssetNotFound):
+        resolver.resolve("a.png")
+    assert len(remote.calls) == 1
+
+
+def test_offline_mode_never_fetches(tmp_path, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_OFFLINE", "1")
+    remote = FakeRemote({"a.png": b"x"})
+    resolver = make_resolver(tmp_path, remote)
+
+    with pytest.raises(AssetNotFound):
+        resolver.resolve("a.png")
+    assert remote.calls == []
+
+
+def test_revalidation_sends_the_stored_etag(tmp_path):
+    remote = FakeRemote({"a.png": b"version 1"})
+    resolver = make_resolver(tmp_path, remote)
+    path = resolver.resolve("a.png")
+    etag = resolver.cache.entry("a.png")["etag"]
+
+    # Unchanged on the server: 304, same blob.
+    assert resolver.revalidate("a.png") == path
+    assert remote.calls[-1] == ("https://example.invalid/a.png", etag)
+
+    remote.files["a.png"] = b"version 2!"
+    assert resolver.revalidate("a.png").read_bytes() == b"version 2!"
+    assert remote.calls[-1][1] == etag
+
+
+def test_revalidation_keeps_the_cached_copy_when_the_fetch_fails(tmp_path):
+    remote = FakeRemote({"a.png": b"cached"})
+    resolver = make_resolver(tmp_path, remote)
+    path = resolver.resolve("a.png")
+
+    remote.down = True
+    assert resolver.revalidate("a.png") == path
+    assert path.read_bytes() == b"cached"
+
+
+def test_stale_entry_is_served_at_once_and_revalidated_in_background(tmp_path):
+    remote = FakeRemote({"a.png": b"version 1"})
+    resolver = make_resolver(tmp_path, remote, revalidate_after=0.0)
+    path = resolver.resolve("a.png")
+    remote.files["a.png"] = b"version 2!"
+
+    assert resolver.resolve("a.png") == path
+    # The revalidation holds the asset's fetch lock until it is done.
+    with resolver._lock_for("a.png"):
+        pass
+    assert resolver.resolve("a.png").read_bytes() == b"version 2!"
+
+
+def test_least_recently_used_blob_is_evicted(tmp_path):
+    remote = FakeRemote({"a.png": b"a" * 40, "b.png": b"b" * 40, "c.png": b"c" * 40})
+    resolver = make_resolver(tmp_path, remote, max_bytes=100)
+    a = resolver.resolve("a.png")
+    b = resolver.resolve("b.png")
+    resolver.resolve("a.png")  # a is now more recently used than b
+
+    c = resolver.resolve("c.png")
+    assert a.exists() and c.exists()
+    assert not b.exists()
+    assert resolver.cache.entry("b.png") is None
+
+
+def test_blob_larger_than_the_bound_is_still_returned(tmp_path):
+    remote = FakeRemote({"a.png": b"a" * 100})
+    resolver = make_resolver(tmp_path, remote, max_bytes=50)
+
+    path = resolver.resolve("a.png")
+    assert path.exists()
+    assert path.read_bytes() == b"a" * 100
+
+
+def test_use_times_are_not_written_on_every_hit(tmp_path):
+    remote = FakeRemote({"a.png": b"a"})
+    resolver = make_resolver(tmp_path, remote)
+    resolver.resolve("a.png")
+    index = tmp_path / "cache" / "index.json"
+    written = index.stat().st_mtime_ns, index.read_text()
+
+    resolver.resolve("a.png")
+    assert (index.stat().st_mtime_ns, index.read_text()) == written
+
+    resolver.cache.flush()
+    assert index.read_text() != written[1]
+
+
+def test_refetch_after_a_304_for_an_evicted_blob_fails_like_any_fetch(tmp_path):
+    remote = FakeRemote({"a.png": b"cached"})
+    resolver = make_resolver(tmp_path, remote)
+    resolver.resolve("a.png").unlink()
+    calls = []
+
+    def fetch(url, etag):
+        # The conditional request succeeds, the full download then fails.
+        calls.append(etag)
+        if etag is None:
+            raise ConnectionError("connection reset")
+        return None, etag
+
+    resolver.fetch = fetch
+    with pytest.raises(AssetNotFound):
+        resolver.revalidate("a.png")
+    assert calls[-1] is None
+    with pytest.raises(AssetNotFound):
+        resolver.resolve("a.png")
+    assert len(calls) == 2
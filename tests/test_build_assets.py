@@ -0,0 +1,40 @@
+"""The asset build never publishes a PNG's text or metadata chunks."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from portfolio.build_assets import has_metadata
+
+
+def png(**save_options) -> Image.Image:
+    buffered = BytesIO()
+    Image.new("RGB", (8, 8), "teal").save(buffered, format="PNG", **save_options)
+    return Image.open(BytesIO(buffered.getvalue()))
+
+
+def with_chunk(add) -> dict:
+    info = PngImagePlugin.PngInfo()
+    add(info)
+    return {"pnginfo": info}
+
+
+def with_exif() -> dict:
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    return {"exif": exif}
+
+
+def test_plain_png_has_no_metadata():
+    assert not has_metadata(png(dpi=(96, 96)))
+
+
+@pytest.mark.parametrize("options", [
+    with_chunk(lambda info: info.add_text("Author", "someone")),
+    with_chunk(lambda info: info.add_text("Comment", "compressed", zip=True)),
+    with_chunk(lambda info: info.add_itxt("XML:com.adobe.xmp", "<x:xmpmeta/>")),
+    with_exif(),
+])
+def test_text_and_metadata_chunks_are_detected(options):
+    assert has_metadata(png(**options))
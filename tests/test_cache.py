@@ -0,0 +1,100 @@
+"""MemoryCache: the byte bound, LRU order and single-flight loading."""
+
+import threading
+import time
+
+import pytest
+
+from portfolio.cache import MemoryCache
+
+
+def test_entries_are_evicted_once_the_byte_bound_is_exceeded():
+    cache = MemoryCache(100)
+    cache.put("a", b"a" * 40)
+    cache.put("b", b"b" * 40)
+    assert cache.stats()["bytes"] == 80
+
+    cache.put("c", b"c" * 40)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"b" * 40 and cache.get("c") == b"c" * 40
+    assert cache.stats()["bytes"] == 80
+    assert cache.stats()["evictions"] == 1
+
+
+def test_an_explicit_size_overrides_the_measured_one():
+    cache = MemoryCache(100)
+    cache.put("a", ("a tuple",), size=60)
+    cache.put("b", ("another",), size=60)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 60
+
+
+def test_a_value_larger_than_the_bound_is_not_kept():
+    cache = MemoryCache(100)
+    cache.put("small", b"x")
+    cache.put("huge", b"x" * 101)
+    assert cache.get("huge") is None
+    assert cache.get("small") == b"x"
+
+
+def test_least_recently_used_entry_goes_first():
+    cache = MemoryCache(100)
+    for key in "abc":
+        cache.put(key, key * 30)
+    cache.get("a")  # b is now the least recently used
+    cache.get_or_load("c", lambda: pytest.fail("c is cached"))
+
+    cache.put("d", "d" * 30)
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["a" * 30, "c" * 30, "d" * 30]
+
+
+def test_replacing_a_key_keeps_the_byte_count_right():
+    cache = MemoryCache(100)
+    cache.put("a", b"x" * 50)
+    cache.put("a", b"y" * 20)
+    assert cache.stats()["bytes"] == 20
+    assert cache.get("a") == b"y" * 20
+
+
+def test_concurrent_misses_load_once():
+    cache = MemoryCache(1_000)
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(threading.get_ident())
+        release.wait(5)
+        return b"loaded"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)  # let every thread reach the key's loading lock
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [b"loaded"] * 8
+    assert cache.stats()["loads"] == 1
+
+
+def test_a_failed_load_is_not_cached():
+    cache = MemoryCache(1_000)
+
+    def broken():
+        raise OSError("decode failed")
+
+    with pytest.raises(OSError):
+        cache.get_or_load("k", broken)
+    assert cache.get("k") is None
+    assert cache.get_or_load("k", lambda: b"second try") == b"second try"
+    assert cache.stats()["loads"] == 2
+
+
+def test_size_can_be_a_function_of_the_loaded_value():
+    cache = MemoryCache(1_000)
+    cache.get_or_load("k", lambda: [1, 2, 3], size=lambda value: 100 * len(value))
+    assert cache.stats()["bytes"] == 300
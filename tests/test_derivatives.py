@@ -0,0 +1,73 @@
+"""Derivative keys follow the source and the transform; repeats never decode the source."""
+
+import os
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from portfolio import derivatives
+from portfolio.cache import MemoryCache
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (64, 48), "navy").save(path)
+    monkeypatch.setattr(derivatives, "resolve_asset", lambda name: path)
+    monkeypatch.setattr(derivatives, "DERIVATIVES_DIR", tmp_path / "derivatives")
+    monkeypatch.setattr(derivatives, "shared_cache", MemoryCache(1_000_000))
+    return path
+
+
+@pytest.fixture
+def opens(monkeypatch):
+    calls = []
+    real_open = Image.open
+
+    def counting_open(fp, *args, **kwargs):
+        calls.append(fp)
+        return real_open(fp, *args, **kwargs)
+
+    monkeypatch.setattr(derivatives.Image, "open", counting_open)
+    return calls
+
+
+def key(path, transform="fit_width", params=None, format="PNG", quality=None):
+    return derivatives.derivative_key(derivatives.source_hash(path), transform, params or {"max_width": 32},
+                                      format, quality)
+
+
+def test_key_changes_with_the_source_bytes(source):
+    before = key(source)
+    assert key(source) == before
+
+    Image.new("RGB", (64, 48), "orange").save(source)
+    os.utime(source, ns=(1, 1))  # a different mtime, whatever the clock resolution
+    assert key(source) != before
+
+
+def test_key_changes_with_the_transform_and_its_parameters(source):
+    base = key(source)
+    assert key(source, params={"max_width": 16}) != base
+    assert key(source, transform="resize_width", params={"width": 32}) != base
+    assert key(source, format="WEBP", quality=80) != base
+    assert key(source, format="WEBP", quality=60) != key(source, format="WEBP", quality=80)
+
+
+def test_repeat_calls_are_served_without_decoding_the_source(source, opens):
+    first = derivatives.get_derivative("photo.png", "fit_width", max_width=32)
+    assert len(opens) == 1
+    with Image.open(BytesIO(first)) as img:
+        assert img.size == (32, 24)
+    opens.clear()
+
+    # From memory...
+    assert derivatives.get_derivative("photo.png", "fit_width", max_width=32) == first
+    # ...and, in a fresh process, from disk.
+    derivatives.shared_cache.clear()
+    assert derivatives.get_derivative("photo.png", "fit_width", max_width=32) == first
+    assert opens == []
+
+    derivatives.get_derivative("photo.png", "fit_width", max_width=16)
+    assert len(opens) == 1
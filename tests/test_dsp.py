@@ -0,0 +1,48 @@
+"""The streaming filter and STFT against one-shot NumPy references."""
+
+import numpy as np
+import pytest
+
+from portfolio import dsp
+
+SIZES = [1, 7, 300, 1_000, 5, 4_096, 2_500]
+
+
+def chunked(signal: np.ndarray, sizes=SIZES):
+    start = 0
+    for size in sizes:
+        yield signal[..., start:start + size]
+        start += size
+
+
+@pytest.mark.parametrize("taps", [1, 31, 255])
+def test_overlap_add_matches_np_convolve(taps):
+    rng = np.random.default_rng(taps)
+    signal, h = rng.standard_normal(sum(SIZES)), rng.standard_normal(taps)
+
+    out = list(dsp.overlap_add(chunked(signal), h))
+    assert [len(chunk) for chunk in out] == SIZES
+    np.testing.assert_allclose(np.concatenate(out), np.convolve(signal, h)[:len(signal)], atol=1e-9)
+
+
+def test_overlap_add_with_a_short_fft():
+    # Several blocks per chunk, each shorter than most chunks.
+    rng = np.random.default_rng(1)
+    signal, h = rng.standard_normal(sum(SIZES)), dsp.windowed_sinc(63, "lowpass", 0.2, 0.0, np.hanning)
+    out = np.concatenate(list(dsp.overlap_add(chunked(signal), h, nfft=128)))
+    np.testing.assert_allclose(out, np.convolve(signal, h)[:len(signal)], atol=1e-9)
+
+
+@pytest.mark.parametrize("segment, hop", [(256, 64), (512, 512), (1024, 256)])
+def test_streaming_stft_matches_a_one_shot_stft(segment, hop):
+    rng = np.random.default_rng(segment)
+    signal = rng.standard_normal((2, sum(SIZES)))
+    window = np.hanning(segment)
+
+    frames = np.concatenate(list(dsp.stft(chunked(signal), segment, hop, window)), axis=-2)
+
+    count = dsp.frame_count(signal.shape[-1], segment, hop)
+    starts = np.arange(count) * hop
+    reference = np.abs(np.fft.rfft(signal[:, starts[:, None] + np.arange(segment)] * window, axis=-1)) ** 2
+    assert frames.shape == (2, count, segment // 2 + 1)
+    np.testing.assert_allclose(frames, reference / np.sum(window) ** 2, rtol=1e-9, atol=1e-12)
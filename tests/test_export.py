@@ -0,0 +1,76 @@
+"""Static export: images come through, demos are left out and don't swallow the projects after them."""
+
+from html.parser import HTMLParser
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from portfolio import content
+from portfolio.export import Renderer, render_section
+from portfolio.sections import SECTIONS
+
+
+class Headings(HTMLParser):
+    """Heading texts, each with how many ``<details>`` enclose it."""
+
+    def __init__(self):
+        super().__init__()
+        self.depth = 0
+        self.current = None
+        self.headings: list[tuple[str, int]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "details":
+            self.depth += 1
+        elif tag in ("h2", "h3"):
+            self.current = ""
+
+    def handle_endtag(self, tag):
+        if tag == "details":
+            self.depth -= 1
+        elif tag in ("h2", "h3") and self.current is not None:
+            self.headings.append((self.current.strip(), self.depth))
+            self.current = None
+
+    def handle_data(self, data):
+        if self.current is not None:
+            self.current += data
+
+
+@pytest.mark.parametrize("section", ["Computational Simulation", "Signal & Communication Systems"])
+def test_projects_after_a_demo_stay_top_level(section, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_OFFLINE", "1")
+    projects = content.get(SECTIONS[section]).projects
+    assert any(project.demo for project in projects)
+
+    parser = Headings()
+    parser.feed(render_section(section, Renderer()))
+    depths = dict(parser.headings)
+    for project in projects:
+        assert depths[project.title] == 0, f"{project.title!r} is inside a demo's <details>"
+
+
+@pytest.mark.parametrize("section", ["Computational Simulation", "Signal & Communication Systems"])
+def test_demos_are_replaced_by_a_note_without_running(section, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_OFFLINE", "1")
+    demos = [project.demo for project in content.get(SECTIONS[section]).projects if project.demo]
+
+    page = render_section(section, Renderer())
+    assert page.count('class="demo-note"') == len(demos)
+    assert "<details>" not in page
+    assert " ms " not in page  # no "solved in N ms" captions
+
+
+def test_images_become_img_tags():
+    app = AppTest.from_string(
+        "import numpy as np\n"
+        "import streamlit as st\n"
+        "st.image(np.zeros((4, 4, 3), dtype='uint8'), caption='A caption')\n"
+        "st.image('https://example.com/b.png')\n"
+    ).run()
+    renderer = Renderer()
+    page = renderer.page(app)
+    assert page.count("<img ") == 2
+    assert 'src="https://example.com/b.png"' in page
+    assert "<figcaption" in page and "A caption" in page
+    assert "image" not in renderer.skipped
@@ -0,0 +1,58 @@
+"""The heat solver's tridiagonal solve and the explicit scheme's stability bound."""
+
+import numpy as np
+import pytest
+
+from portfolio import heat
+
+
+def dense(lower, diag, upper):
+    return np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+
+
+@pytest.mark.parametrize("n", [2, 3, 8, 17, 64, 101])
+@pytest.mark.parametrize("boundary", heat.BOUNDARIES)
+def test_cyclic_reduction_matches_a_dense_solve(n, boundary):
+    rng = np.random.default_rng(n)
+    lower, diag, upper = heat.implicit_matrix(n, 5.0, boundary)
+    rhs = rng.standard_normal(n)
+
+    x = heat.tridiagonal_solve(heat.tridiagonal_factor(lower, diag, upper), rhs)
+    np.testing.assert_allclose(x, np.linalg.solve(dense(lower, diag, upper), rhs), rtol=1e-10, atol=1e-12)
+
+
+def test_cyclic_reduction_of_a_general_diagonally_dominant_matrix():
+    rng = np.random.default_rng(0)
+    n = 50
+    lower, upper = rng.uniform(-1, 1, n), rng.uniform(-1, 1, n)
+    diag = np.abs(lower) + np.abs(upper) + rng.uniform(0.5, 2, n)
+    lower[0] = upper[-1] = 0.0
+    rhs = rng.standard_normal(n)
+
+    x = heat.tridiagonal_solve(heat.tridiagonal_factor(lower, diag, upper), rhs)
+    np.testing.assert_allclose(x, np.linalg.solve(dense(lower, diag, upper), rhs), rtol=1e-10, atol=1e-12)
+
+
+def last_frame(scheme: str, fourier: float, boundary: str = "dirichlet"):
+    problem = heat.HeatProblem("Copper", 101, fourier, 2_000, boundary, 20.0, 20.0, scheme)
+    return list(heat.simulate(problem))[-1]
+
+
+@pytest.mark.parametrize("boundary", heat.BOUNDARIES)
+@pytest.mark.parametrize("fourier", [0.25, 0.5])
+def test_explicit_scheme_is_stable_up_to_r_one_half(fourier, boundary):
+    frame = last_frame("explicit", fourier, boundary)
+    assert frame.step == 2_000
+    # Diffusion never leaves the range the rod started in.
+    assert 20.0 - 1e-9 <= frame.profile.min() and frame.profile.max() <= 20.0 + heat.INITIAL_BUMP
+
+
+@pytest.mark.parametrize("fourier", [0.55, 1])
+def test_explicit_scheme_blows_up_beyond_r_one_half(fourier):
+    assert last_frame("explicit", fourier).step < 2_000
+
+
+def test_implicit_scheme_is_stable_for_large_steps():
+    frame = last_frame("implicit", 1_000)
+    assert frame.step == 2_000
+    assert np.abs(frame.profile - 20.0).max() < 1e-3
@@ -0,0 +1,50 @@
+"""Prefetch keeps per-asset profiling rows and reads sections without importing them."""
+
+import sys
+import threading
+
+from portfolio import prefetch, profiling
+from portfolio.sections import SECTIONS
+
+
+def fake_prepare(kind, name, args=()):
+    # What the real preparation functions record, from a pool thread.
+    with profiling.timed(kind, name):
+        profiling.record_element(kind, name, 123)
+
+
+def test_asset_rows_are_recorded_when_prefetch_is_on(monkeypatch):
+    tasks = [("image", "prefetch-test-a.png", ()), ("pdf", "prefetch-test-b.pdf", ())]
+    monkeypatch.setenv(profiling.ENV_VAR, "1")
+    monkeypatch.setattr(prefetch, "PREFETCH_WORKERS", 2)
+    monkeypatch.setattr(prefetch, "section_tasks", lambda section: tasks)
+    threads = set()
+
+    def prepare(kind, name, args=()):
+        threads.add(threading.get_ident())
+        fake_prepare(kind, name, args)
+
+    monkeypatch.setattr(prefetch, "prepare", prepare)
+    prefetch.forget({name for _, name, _ in tasks} | {"prefetch-test-c.png"})
+
+    with profiling.profile_rerun("Test") as profile:
+        prefetch.prepare_section("Test")
+
+    assert threading.get_ident() not in threads
+    timed = {(t["kind"], t["name"]) for t in profile.timings}
+    assert {("image", "prefetch-test-a.png"), ("pdf", "prefetch-test-b.pdf"), ("prefetch", "Test")} <= timed
+    assert {(e["kind"], e["name"]) for e in profile.elements} == {(kind, name) for kind, name, _ in tasks}
+    # The worker threads don't keep the rerun's profile afterwards.
+    assert prefetch.submit(("image", "prefetch-test-c.png", ()), block=True).result() is True
+    assert len(profile.elements) == 2
+
+
+def test_section_tasks_do_not_import_section_modules(monkeypatch):
+    for section, module in SECTIONS.items():
+        monkeypatch.delitem(sys.modules, f"portfolio.sections.{module}", raising=False)
+        prefetch.section_tasks(section)
+        assert f"portfolio.sections.{module}" not in sys.modules
+
+    welcome = prefetch.section_tasks("Welcome")
+    assert [task[0] for task in welcome] == ["derivative", "derivative"]
+    assert prefetch.section_tasks("Welcome") is welcome
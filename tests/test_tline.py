@@ -0,0 +1,34 @@
+"""Settled levels of the reflection simulator."""
+
+import numpy as np
+import pytest
+
+from portfolio import tline
+
+AMPLITUDE = 3.3
+Z0 = 50.0
+
+
+def near_levels(source_r: float, loss_db: float) -> dict[str, tuple[float, float]]:
+    """Near-end voltage before the pulse and at the end of its flat top, per termination."""
+    params = tline.ReflectionParams(AMPLITUDE, Z0, source_r, 100.0, delay_ns=2.0, loss_db=loss_db,
+                                    rise_ns=0.2, width_ns=20.0)
+    result = tline._reflections(params)
+    top = np.searchsorted(result.t_ns, params.rise_ns + params.width_ns) - 1
+    return {case: (float(result.traces[f"{case}: near end"][0]), float(result.traces[f"{case}: near end"][top]))
+            for case in tline.CASES}
+
+
+@pytest.mark.parametrize("loss_db", [0.0, 1.0])
+def test_ideal_source_holds_the_near_end_at_the_source_voltage(loss_db):
+    # Rs = 0 into a short makes the DC bin 0/0; it must not offset the trace.
+    for case, (before, top) in near_levels(0.0, loss_db).items():
+        assert before == pytest.approx(0.0, abs=1e-6), case
+        assert top == pytest.approx(AMPLITUDE, abs=1e-6), case
+
+
+def test_matched_source_settles_to_the_dc_divider():
+    expected = {"Open": AMPLITUDE, "Short": 0.0, "Matched": AMPLITUDE / 2, "Mismatched": AMPLITUDE * 100 / 150}
+    for case, (before, top) in near_levels(Z0, 0.0).items():
+        assert before == pytest.approx(0.0, abs=1e-3), case
+        assert top == pytest.approx(expected[case], abs=1e-3), case
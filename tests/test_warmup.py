@@ -0,0 +1,22 @@
+"""A failed warm-up still lets the instance report ready."""
+
+import threading
+
+from portfolio import warmup
+
+
+def test_failed_warm_up_sets_ready(monkeypatch, tmp_path):
+    monkeypatch.setattr(warmup, "READY_FILE", tmp_path / "ready.json")
+    monkeypatch.setattr(warmup, "_ready", threading.Event())
+    monkeypatch.setattr(warmup, "_status", {"state": "starting"})
+
+    def broken():
+        raise RuntimeError("import blew up")
+
+    monkeypatch.setattr(warmup, "_import_heavy_modules", broken)
+    warmup._warm_up_logged()
+
+    assert warmup.is_ready()
+    assert warmup.status()["state"] == "failed"
+    assert "import blew up" in warmup.status()["error"]
+    assert not (tmp_path / "ready.json").exists()